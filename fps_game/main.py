@@ -5,12 +5,14 @@ import random
 import cv2
 import threading
 import time
+import numpy as np
 
 # Import our modules
 from src.core.camera import Camera  # Now fixed position camera
 from src.entities.enemy.enemy import Enemy
+from src.entities.enemy.enemy_rendering import EnemyRenderer
 from src.rendering.environment import draw_skybox, draw_ground, draw_weapon_model, draw_cursor_target
-from src.rendering.ui import draw_crosshair, draw_health_bar, draw_ammo_display  # Crosshair is now empty
+from src.rendering.ui import draw_crosshair, draw_ui  # Crosshair is now empty
 from src.weapons.weapon import shoot  # Updated to use cursor tracking
 from src.weapons.weapon_system import WeaponSystem
 from src.systems.particles import ShootingEffects  # New visual effects system
@@ -19,8 +21,12 @@ from src.entities.player.health import HealthSystem
 from src.systems.collision import CollisionSystem
 from src.weapons.cursor_weapon import QuaternionWeapon  # New cursor tracking weapon
 from src.vision.estimate import Estimate  # ArUco marker detection
+from src.vision.capture import LatestFrameReader  # Drops stale camera frames
 from src.audio.sound_system import initialize_sound_system, cleanup_sound_system  # Sound system
 
+# convertScaleAbs(alpha=1.2, beta=20) as a lookup table for the detection frame
+_BRIGHTEN_LUT = np.clip(np.rint(np.arange(256) * 1.2 + 20), 0, 255).astype(np.uint8)
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -105,6 +111,7 @@ class Game:
                 
             cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
             cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            cap = LatestFrameReader(cap)
             
             print("ArUco camera initialized successfully")
             print("Camera matrix shape:", self.estimator.K.shape)
@@ -117,11 +124,13 @@ class Game:
                     continue
                 
                 try:
-                    frame = cv2.flip(frame, 1)
-                    frame = cv2.convertScaleAbs(frame, alpha=1.2, beta=20)
+                    cv2.flip(frame, 1, dst=frame)  # Mirror in place, the frame is ours
+                    # Brighten only the grayscale copy used for detection (a third of the pixels), by table lookup
+                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    cv2.LUT(gray, _BRIGHTEN_LUT, dst=gray)
                     
                     # Process frame for ArUco markers
-                    frame = self.estimator.get_measurements(frame)
+                    frame = self.estimator.get_measurements(frame, gray)
                     
                     # Update cooldowns for shooting and reloading
                     if self.estimator.shoot_cooldown > 0:
@@ -145,11 +154,11 @@ class Game:
                     
                     # Show ArUco detection window with debug info
                     cv2.putText(frame, f'Reload cooldown: {self.estimator.reload_cooldown}', 
-                               (10, 60), cv2.FONT_HERSHEY_COMPLEX, 0.7, (255, 255, 0), 2)
+                               (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
                     cv2.putText(frame, f'Shooting cooldown: {self.estimator.shoot_cooldown}', 
-                               (10, 90), cv2.FONT_HERSHEY_COMPLEX, 0.7, (255, 255, 0), 2)
+                               (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
                     cv2.putText(frame, f'Distance: {self.estimator.d_to_cam:.2f}m', 
-                               (10, 120), cv2.FONT_HERSHEY_COMPLEX, 0.7, (255, 255, 0), 2)
+                               (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
                     
                     cv2.imshow("ArUco Detection", frame)
                     
@@ -162,8 +171,6 @@ class Game:
                     print(f"Error processing frame: {frame_error}")
                     continue
                 
-                time.sleep(0.016)  # ~60 FPS
-                
         except Exception as e:
             print(f"ArUco detection error: {e}")
             import traceback
@@ -388,9 +395,10 @@ class Game:
         # Get player position for collision detection
         player_pos = [self.camera.x, self.camera.y, self.camera.z]
         
-        # Update AI enemies
+        # Update AI enemies (sample the clock once per frame)
+        current_time = time.monotonic()
         for enemy in self.enemies:
-            enemy.update(player_pos)
+            enemy.update(player_pos, current_time)
         
         # Check for collisions with enemies
         alive_enemies = [enemy for enemy in self.enemies if enemy.alive]
@@ -400,7 +408,7 @@ class Game:
         
         # Handle collisions
         if colliding_enemies:
-            if self.health_system.take_damage():
+            if self.health_system.take_damage(current_time=current_time):
                 print("Enemy collision! Defend yourself!")
         
         # Count enemies that were killed this frame
@@ -450,14 +458,19 @@ class Game:
         # Render smoke effects
         self.shooting_effects.render_smoke_effects()
         
-        # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw()
+        # Draw enemies (skipping ones behind the camera or too far away)
+        visible_enemies = EnemyRenderer.cull_enemies(
+            self.enemies, self.camera.get_position(), self.camera.get_forward_vector()
+        )
+        EnemyRenderer.draw_enemies(visible_enemies)
         
         # Draw UI with kill counter
         draw_crosshair()
-        draw_health_bar(self.health_system.get_health_percentage())
-        draw_ammo_display(self.weapon_system)
+        draw_ui(self.health_system.get_health_percentage(), self.weapon_system)
+        
+        # Report queued damage messages once per frame
+        for message in self.health_system.drain_events():
+            print(message)
         
         # Display kill counter (you'll need to implement this in your UI module)
         # For now, it will be printed to console when enemies die
@@ -64,12 +64,20 @@ class ReloadAnimation:
                 'end': cumulative + duration
             }
             cumulative += duration
+        self.phase_names = list(self.phase_durations)
+        
+        # Phase index cached once per frame by update(); None while inactive
+        self._cached_phase_idx = None
+        
+        # Reusable segment transform for _render_square_segment
+        self._xform = np.eye(4, dtype=np.float32)
     
     def start_animation(self, current_quaternion):
         """Start the reload animation with current weapon quaternion"""
         self.is_active = True
         self.start_time = time.time()
         self.sound_played = False  # Reset sound flag
+        self._cached_phase_idx = 0
         
         # Store current quaternion for smooth transition back
         self.original_quaternion = current_quaternion.copy()
@@ -90,10 +98,14 @@ class ReloadAnimation:
         if elapsed >= self.duration:
             self.is_active = False
             self.sound_played = False  # Reset for next reload
+            self._cached_phase_idx = None
             return
         
+        # Cache the phase for this frame so the render path can skip the lookup
+        self._cached_phase_idx = self._get_phase_index(elapsed / self.duration)
+        
         # Check if we should play the reload sound during pull_back phase
-        current_phase = self.get_current_phase()
+        current_phase = self.phase_names[self._cached_phase_idx]
         if current_phase == 'pull_back' and not self.sound_played:
             # Play sound at the start of pull_back phase
             phase_progress = self.get_phase_progress('pull_back')
@@ -123,6 +135,14 @@ class ReloadAnimation:
                 
         return 'transition_to_cursor'  # Fallback to last phase
     
+    def _get_phase_index(self, progress):
+        """Get the index of the phase containing the given overall progress"""
+        for i, phase in enumerate(self.phase_names):
+            if progress <= self.phase_times[phase]['end']:
+                return i
+        
+        return len(self.phase_names) - 1  # Fallback to last phase
+    
     def get_phase_progress(self, phase):
         """Get progress within a specific phase (0.0 to 1.0)"""
         overall_progress = self.get_progress()
@@ -141,6 +161,10 @@ class ReloadAnimation:
         """Get interpolated quaternion for smooth weapon transition during reload"""
         if not self.is_active:
             return current_quaternion
+        
+        # Gun holds the center pose while the arm reaches in and retracts
+        if self._cached_phase_idx in (1, 5):
+            return self.target_quaternion
             
         overall_progress = self.get_progress()
         
@@ -296,10 +320,11 @@ class ReloadAnimation:
         # Create perpendicular vector for elbow offset
         up_vector = np.array([0, 1, 0])
         side_vector = np.cross(direction, up_vector)
-        if np.linalg.norm(side_vector) < 0.1:  # Direction is vertical
+        side_norm = np.linalg.norm(side_vector)
+        if side_norm < 0.1:  # Direction is vertical
             side_vector = np.array([1, 0, 0])
         else:
-            side_vector = side_vector / np.linalg.norm(side_vector)
+            side_vector = side_vector / side_norm
         
         elbow_offset = np.cross(side_vector, direction)
         elbow_offset = elbow_offset / np.linalg.norm(elbow_offset)
@@ -313,6 +338,9 @@ class ReloadAnimation:
     
     def get_arm_segments(self, weapon_position):
         """Get arm segment positions using inverse kinematics"""
+        # No arm while the gun transitions to/from center
+        if self._cached_phase_idx in (0, 6):
+            return None
         if not self.is_active:
             return None
             
@@ -343,6 +371,8 @@ class ReloadAnimation:
     
     def render_arm(self, weapon_position):
         """Render the two-segment arm using thick square prisms only"""
+        if self._cached_phase_idx in (0, 6):
+            return
         if not self.is_active:
             return
             
@@ -361,6 +391,9 @@ class ReloadAnimation:
         glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.3, 0.3, 0.3, 1.0])
         glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 16.0)
         
+        # Segment transforms are non-uniformly scaled, so let GL renormalize normals
+        glEnable(GL_NORMALIZE)
+        
         # Render upper arm as thick square prism (shoulder to elbow)
         # Increased size: was 0.12 width, 0.08 height - now much thicker and square
         self._render_square_segment(shoulder_pos, elbow_pos, 0.25)
@@ -369,6 +402,7 @@ class ReloadAnimation:
         # Increased size: was 0.10 width, 0.06 height - now thicker and square
         self._render_square_segment(elbow_pos, wrist_pos, 0.15)
         
+        glDisable(GL_NORMALIZE)
         glEnable(GL_COLOR_MATERIAL)
     
     def _render_square_segment(self, start_pos, end_pos, size):
@@ -378,32 +412,39 @@ class ReloadAnimation:
         if length < 0.001:
             return
         
-        direction = direction / length
+        dx, dy, dz = direction / length
         
         # Calculate center position
-        center_pos = start_pos + direction * (length / 2)
-        
-        # Create rotation matrix to align with direction
-        # Default direction is along Z-axis
-        default_dir = np.array([0, 0, 1])
+        center_pos = start_pos + direction * 0.5
+        
+        # Compose translate/rotate/scale into a single matrix so the driver only
+        # sees one glMultMatrixf. Rows of _xform are the columns of the transform,
+        # which is the column-major layout OpenGL expects.
+        xform = self._xform
+        if dz > -0.999999:
+            # Rodrigues rotation taking the default Z-axis onto the segment direction
+            k = 1.0 / (1.0 + dz)
+            xform[0, :3] = (1.0 - k * dx * dx, -k * dx * dy, -dx)
+            xform[1, :3] = (-k * dx * dy, 1.0 - k * dy * dy, -dy)
+            xform[2, :3] = (dx, dy, dz)
+        else:
+            # 180-degree rotation case
+            xform[0, :3] = (1.0, 0.0, 0.0)
+            xform[1, :3] = (0.0, -1.0, 0.0)
+            xform[2, :3] = (0.0, 0.0, -1.0)
         
-        # Calculate rotation axis and angle
-        axis = np.cross(default_dir, direction)
+        # Scale the unit prism to (size, size, length) and move it to the center
+        xform[0, :3] *= size
+        xform[1, :3] *= size
+        xform[2, :3] *= length
+        xform[3, :3] = center_pos
         
         glPushMatrix()
-        glTranslatef(center_pos[0], center_pos[1], center_pos[2])
-        
-        if np.linalg.norm(axis) > 0.001:
-            axis = axis / np.linalg.norm(axis)
-            angle = math.acos(max(-1, min(1, np.dot(default_dir, direction))))
-            glRotatef(math.degrees(angle), axis[0], axis[1], axis[2])
-        elif np.dot(default_dir, direction) < 0:
-            # 180-degree rotation case
-            glRotatef(180, 1, 0, 0)
+        glMultMatrixf(xform)
         
-        # Draw thick square prism - all dimensions are equal for perfect square cross-section
-        half_size = size / 2
-        half_length = length / 2
+        # Draw unit prism - the transform above provides the square cross-section and length
+        half_size = 0.5
+        half_length = 0.5
         
         glBegin(GL_QUADS)
         
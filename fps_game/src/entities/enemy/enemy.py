@@ -6,12 +6,14 @@ from src.entities.enemy.enemy_physics import EnemyPhysics
 class Enemy(EnemyBase):
     """Main Enemy class that combines all enemy functionality"""
     
+    __slots__ = ()  # Keep EnemyBase's slots, no per-instance __dict__
+    
     def __init__(self, x, y, z, height=3.0, radius=0.8):
         super().__init__(x, y, z, height, radius)
     
-    def update(self, player_pos):
+    def update(self, player_pos, current_time=None):
         """Update enemy AI - move towards player"""
-        #EnemyAI.update_movement(self, player_pos)
+        #EnemyAI.update_movement(self, player_pos, current_time)
     
     def draw(self):
         """Draw enemy as a cylinder with health bar above"""
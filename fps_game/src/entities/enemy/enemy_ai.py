@@ -1,11 +1,43 @@
 import math
 import time
+from array import array
+
+# Squared distance thresholds so range checks don't need a sqrt
+_MIN_DIST_SQ = 0.8 * 0.8    # Stop moving inside this radius
+_CLOSE_DIST_SQ = 5.0 * 5.0  # Speed boost inside this radius
+
+# First-quadrant sine table for the hover/sway animation
+_SIN_TABLE_SIZE = 1024
+_SIN_TABLE = array('f', [math.sin(i * (math.pi / 2) / _SIN_TABLE_SIZE) for i in range(_SIN_TABLE_SIZE + 1)])
+_SIN_SCALE = 4 * _SIN_TABLE_SIZE / (2 * math.pi)
+
+def fast_sin(x):
+    """Approximate math.sin with the quarter-wave table and linear interpolation"""
+    pos = (x % (2 * math.pi)) * _SIN_SCALE
+    idx = int(pos)
+    frac = pos - idx
+    quadrant = (idx // _SIN_TABLE_SIZE) & 3
+    i = idx % _SIN_TABLE_SIZE
+    
+    # Mirror odd quadrants: sin(pi/2 + t) = sin(pi/2 - t)
+    if quadrant & 1:
+        i = _SIN_TABLE_SIZE - i
+        value = _SIN_TABLE[i] + (_SIN_TABLE[i - 1] - _SIN_TABLE[i]) * frac
+    else:
+        value = _SIN_TABLE[i] + (_SIN_TABLE[i + 1] - _SIN_TABLE[i]) * frac
+    
+    # Lower half of the wave: sin(pi + t) = -sin(t)
+    return -value if quadrant & 2 else value
+
+def fast_cos(x):
+    """Approximate math.cos via fast_sin"""
+    return fast_sin(x + math.pi / 2)
 
 class EnemyAI:
     """Handles ghost enemy AI behavior and floating movement logic"""
     
     @staticmethod
-    def update_movement(enemy, player_pos):
+    def update_movement(enemy, player_pos, current_time=None):
         """Update ghost AI - float towards player with hovering motion"""
         if not enemy.alive:
             return
@@ -15,17 +47,18 @@ class EnemyAI:
         dz = player_pos[2] - enemy.z
         
         # Calculate distance to player
-        distance = math.sqrt(dx * dx + dz * dz)
+        d2 = dx * dx + dz * dz
         
         # Move towards player (more aggressive when close)
-        if distance > 0.8:  # Reduced minimum distance for more aggressive behavior
-            # Normalize direction vector
-            dx /= distance
-            dz /= distance
+        if d2 > _MIN_DIST_SQ:  # Reduced minimum distance for more aggressive behavior
+            # Normalize direction vector (only sqrt when actually moving)
+            inv_distance = 1.0 / math.sqrt(d2)
+            dx *= inv_distance
+            dz *= inv_distance
             
             # Increase speed when close to player for more intense combat
             current_speed = enemy.speed
-            if distance < 5.0:
+            if d2 < _CLOSE_DIST_SQ:
                 current_speed *= 1.5  # 50% speed boost when close
             
             # Move towards player in X and Z axes
@@ -33,17 +66,14 @@ class EnemyAI:
             enemy.z += dz * current_speed
         
         # Add floating motion for ghost behavior
-        EnemyAI._update_floating_motion(enemy)
+        EnemyAI._update_floating_motion(enemy, current_time)
     
     @staticmethod
-    def _update_floating_motion(enemy):
+    def _update_floating_motion(enemy, current_time=None):
         """Add gentle floating up and down motion to the ghost"""
-        # Use current time for smooth floating animation
-        current_time = time.time()
-        
-        # Create unique floating pattern for each ghost based on position
-        # This prevents all ghosts from floating in sync
-        phase_offset = (enemy.x + enemy.z) * 2.0
+        # Use current time for smooth floating animation (callers pass one per frame)
+        if current_time is None:
+            current_time = time.time()
         
         # Calculate floating height with sine wave
         float_amplitude = 0.3  # How high/low the ghost floats
@@ -51,7 +81,7 @@ class EnemyAI:
         base_hover_height = 2.0  # Base height above ground
         
         # Create floating motion
-        float_offset = float_amplitude * math.sin(current_time * float_frequency + phase_offset)
+        float_offset = float_amplitude * fast_sin(current_time * float_frequency + enemy.phase)
         target_y = base_hover_height + float_offset
         
         # Smooth interpolation to target height (prevents jerky movement)
@@ -68,10 +98,11 @@ class EnemyAI:
         """Calculate normalized direction vector from enemy to player"""
         dx = player_pos[0] - enemy.x
         dz = player_pos[2] - enemy.z
-        distance = math.sqrt(dx * dx + dz * dz)
+        d2 = dx * dx + dz * dz
         
-        if distance > 0:
-            return dx / distance, dz / distance, distance
+        if d2 > 0:
+            inv_distance = 1.0 / math.sqrt(d2)
+            return dx * inv_distance, dz * inv_distance, d2 * inv_distance
         return 0, 0, 0
     
     @staticmethod
@@ -79,32 +110,30 @@ class EnemyAI:
         """Determine if ghost should move toward player based on distance"""
         dx = player_pos[0] - enemy.x
         dz = player_pos[2] - enemy.z
-        distance = math.sqrt(dx * dx + dz * dz)
-        return distance > min_distance
+        return dx * dx + dz * dz > min_distance * min_distance
     
     @staticmethod
     def get_speed_multiplier(enemy, player_pos, close_distance=5.0, speed_boost=1.5):
         """Get speed multiplier based on distance to player"""
         dx = player_pos[0] - enemy.x
         dz = player_pos[2] - enemy.z
-        distance = math.sqrt(dx * dx + dz * dz)
         
-        if distance < close_distance:
+        if dx * dx + dz * dz < close_distance * close_distance:
             return speed_boost
         return 1.0
     
     @staticmethod
-    def add_ghost_sway(enemy):
+    def add_ghost_sway(enemy, current_time=None):
         """Add subtle side-to-side swaying motion for more ghostly appearance"""
-        current_time = time.time()
-        phase_offset = enemy.x * 1.5 + enemy.z * 0.8
+        if current_time is None:
+            current_time = time.time()
         
         # Small sway motion
         sway_amplitude = 0.05
         sway_frequency = 0.8
         
-        sway_x = sway_amplitude * math.sin(current_time * sway_frequency + phase_offset)
-        sway_z = sway_amplitude * math.cos(current_time * sway_frequency * 1.3 + phase_offset)
+        sway_x = sway_amplitude * fast_sin(current_time * sway_frequency + enemy.sway_phase)
+        sway_z = sway_amplitude * fast_cos(current_time * sway_frequency * 1.3 + enemy.sway_phase)
         
         # Apply sway (gentle movement)
         enemy.x += sway_x * 0.1
@@ -4,6 +4,9 @@ import random
 class EnemyBase:
     """Base enemy class with core properties"""
     
+    __slots__ = ('x', 'y', 'z', 'height', 'radius', 'speed', 'alive',
+                 'phase', 'sway_phase', 'max_health', 'current_health')
+    
     def __init__(self, x, y, z, height=3.0, radius=0.8):
         self.x = x
         self.y = y
@@ -13,6 +16,10 @@ class EnemyBase:
         self.speed = 0.02
         self.alive = True
         
+        # Fixed animation phases so ghosts don't float/sway in sync
+        self.phase = random.uniform(0.0, 2 * math.pi)
+        self.sway_phase = random.uniform(0.0, 2 * math.pi)
+        
         # Health system
         self.max_health = random.randint(30, 80)
         self.current_health = self.max_health
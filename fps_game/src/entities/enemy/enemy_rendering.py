@@ -1,12 +1,128 @@
 import math
+import numpy as np
 from OpenGL.GL import *
 
+# Unit-circle (cos, sin) tables for _draw_cylinder, keyed by segment count
+_CYL_TABLE = {}
+
+def _get_cylinder_table(segments):
+    """Get (endpoints, mids) unit-circle tables for a cylinder with the given segments"""
+    table = _CYL_TABLE.get(segments)
+    if table is None:
+        endpoints = [(math.cos(2 * math.pi * i / segments), math.sin(2 * math.pi * i / segments))
+                     for i in range(segments + 1)]
+        # Side face normals point through the middle of each segment
+        mids = [(math.cos(2 * math.pi * (i + 0.5) / segments), math.sin(2 * math.pi * (i + 0.5) / segments))
+                for i in range(segments)]
+        table = _CYL_TABLE[segments] = (endpoints, mids)
+    return table
+
+# Compiled display lists for static geometry, keyed by (draw function, args)
+_DISPLAY_LISTS = {}
+
+def _get_display_list(draw_fn, *args):
+    """Compile draw_fn(*args) into a display list on first use and return its id"""
+    key = (draw_fn.__name__, args)
+    list_id = _DISPLAY_LISTS.get(key)
+    if list_id is None:
+        list_id = glGenLists(1)
+        glNewList(list_id, GL_COMPILE)
+        draw_fn(*args)
+        glEndList()
+        _DISPLAY_LISTS[key] = list_id
+    return list_id
+
+def _box_quads(x1, x2, half_thickness, half_depth):
+    """Front, back, top and bottom quads of a box spanning x1..x2 (16 vertices)"""
+    t, d = half_thickness, half_depth
+    return np.array([
+        # Front face
+        (x1, -t, d), (x2, -t, d), (x2, t, d), (x1, t, d),
+        # Back face
+        (x1, -t, -d), (x1, t, -d), (x2, t, -d), (x2, -t, -d),
+        # Top face
+        (x1, t, -d), (x1, t, d), (x2, t, d), (x2, t, -d),
+        # Bottom face
+        (x1, -t, -d), (x2, -t, -d), (x2, -t, d), (x1, -t, d),
+    ], dtype=np.float32)
+
+def _draw_vertex_array(mode, vertices):
+    """Submit a float32 (N, 3) vertex array with a single glDrawArrays call"""
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, vertices)
+    glDrawArrays(mode, 0, len(vertices))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+# Health bar dimensions
+_BAR_WIDTH = 1.2
+_BAR_THICKNESS = 0.1
+_BAR_DEPTH = 0.05
+
+# Health bar geometry never changes, so build the vertex arrays once at import.
+# The foreground is unit width and gets scaled by the current health.
+_BG_VERTS = _box_quads(-_BAR_WIDTH/2, _BAR_WIDTH/2, _BAR_THICKNESS/2, _BAR_DEPTH/2)
+_FG_UNIT_VERTS = _box_quads(0.0, 1.0, _BAR_THICKNESS/2, _BAR_DEPTH/2 + 0.001)
+_BORDER_FRONT_VERTS = np.array([
+    (-_BAR_WIDTH/2, -_BAR_THICKNESS/2, _BAR_DEPTH/2 + 0.002),
+    (_BAR_WIDTH/2, -_BAR_THICKNESS/2, _BAR_DEPTH/2 + 0.002),
+    (_BAR_WIDTH/2, _BAR_THICKNESS/2, _BAR_DEPTH/2 + 0.002),
+    (-_BAR_WIDTH/2, _BAR_THICKNESS/2, _BAR_DEPTH/2 + 0.002),
+], dtype=np.float32)
+_BORDER_BACK_VERTS = np.array([
+    (-_BAR_WIDTH/2, -_BAR_THICKNESS/2, -_BAR_DEPTH/2 - 0.002),
+    (-_BAR_WIDTH/2, _BAR_THICKNESS/2, -_BAR_DEPTH/2 - 0.002),
+    (_BAR_WIDTH/2, _BAR_THICKNESS/2, -_BAR_DEPTH/2 - 0.002),
+    (_BAR_WIDTH/2, -_BAR_THICKNESS/2, -_BAR_DEPTH/2 - 0.002),
+], dtype=np.float32)
+
+# Enemy material colours, preallocated so draw_enemy doesn't build lists every frame.
+# Only the diffuse green/blue channels change (with health) and are written in place.
+_AMBIENT = (GLfloat * 4)(0.8, 0.2, 0.2, 1.0)
+_DIFFUSE = (GLfloat * 4)(0.9, 0.3, 0.3, 1.0)
+_SPECULAR = (GLfloat * 4)(0.3, 0.1, 0.1, 1.0)
+
+# Coarse culling limits
+_CULL_DISTANCE = 50.0  # Don't draw enemies further than this
+_CULL_BEHIND = 2.0     # Allowance behind the camera plane for the enemy's radius
+
 class EnemyRenderer:
     """Handles enemy visual rendering including geometry and health bars"""
     
+    @staticmethod
+    def draw_enemies(enemies):
+        """Draw all enemy bodies, then all health bars with lighting toggled once"""
+        EnemyRenderer._begin_bodies()
+        for enemy in enemies:
+            EnemyRenderer.draw_enemy_body(enemy)
+        glDisable(GL_NORMALIZE)
+        
+        glDisable(GL_LIGHTING)
+        for enemy in enemies:
+            if enemy.alive:
+                EnemyRenderer._draw_health_bar_unlit(enemy)
+        glEnable(GL_LIGHTING)
+    
     @staticmethod
     def draw_enemy(enemy):
         """Draw enemy as a cylinder with health bar above"""
+        EnemyRenderer._begin_bodies()
+        EnemyRenderer.draw_enemy_body(enemy)
+        glDisable(GL_NORMALIZE)
+        
+        # Draw health bar above the enemy
+        EnemyRenderer.draw_health_bar(enemy)
+    
+    @staticmethod
+    def _begin_bodies():
+        """Set the GL state shared by every enemy body, undo with glDisable(GL_NORMALIZE)"""
+        glEnable(GL_NORMALIZE)  # Non-uniform scale would otherwise skew lighting
+        glMaterialfv(GL_FRONT, GL_AMBIENT, _AMBIENT)
+        glMaterialfv(GL_FRONT, GL_SPECULAR, _SPECULAR)
+        glMaterialf(GL_FRONT, GL_SHININESS, 30.0)
+    
+    @staticmethod
+    def draw_enemy_body(enemy):
+        """Draw the lit enemy cylinder, inside _begin_bodies() state"""
         if not enemy.alive:
             return
             
@@ -15,22 +131,36 @@ class EnemyRenderer:
         
         # Set material properties for the enemy (red color, darker when damaged)
         health_factor = enemy.get_health_percentage()
-        red_intensity = 0.9
-        green_intensity = 0.3 * health_factor  # Green fades as health decreases
-        blue_intensity = 0.3 * health_factor   # Blue fades as health decreases
+        _DIFFUSE[1] = 0.3 * health_factor  # Green fades as health decreases
+        _DIFFUSE[2] = 0.3 * health_factor  # Blue fades as health decreases
         
-        glMaterialfv(GL_FRONT, GL_AMBIENT, [0.8, 0.2, 0.2, 1.0])
-        glMaterialfv(GL_FRONT, GL_DIFFUSE, [red_intensity, green_intensity, blue_intensity, 1.0])
-        glMaterialfv(GL_FRONT, GL_SPECULAR, [0.3, 0.1, 0.1, 1.0])
-        glMaterialf(GL_FRONT, GL_SHININESS, 30.0)
+        glMaterialfv(GL_FRONT, GL_DIFFUSE, _DIFFUSE)
         
-        # Draw the cylinder geometry
-        EnemyRenderer._draw_cylinder(enemy.radius, enemy.height)
+        # Draw the unit cylinder scaled to this enemy's size
+        glScalef(enemy.radius, enemy.height, enemy.radius)
+        glCallList(_get_display_list(EnemyRenderer._draw_cylinder, 1.0, 1.0))
         
         glPopMatrix()
+    
+    @staticmethod
+    def cull_enemies(enemies, camera_pos, forward, max_distance=_CULL_DISTANCE):
+        """Return the live enemies in front of the camera and within max_distance"""
+        n = len(enemies)
+        if n == 0:
+            return []
         
-        # Draw health bar above the enemy
-        EnemyRenderer.draw_health_bar(enemy)
+        xs = np.fromiter((enemy.x for enemy in enemies), dtype=np.float32, count=n)
+        zs = np.fromiter((enemy.z for enemy in enemies), dtype=np.float32, count=n)
+        alive = np.fromiter((enemy.alive for enemy in enemies), dtype=bool, count=n)
+        
+        # Offset from the camera on the ground plane
+        rel_x = xs - camera_pos[0]
+        rel_z = zs - camera_pos[2]
+        
+        in_front = rel_x * forward[0] + rel_z * forward[2] > -_CULL_BEHIND
+        in_range = rel_x * rel_x + rel_z * rel_z < max_distance * max_distance
+        visible = np.flatnonzero(alive & in_front & in_range)
+        return [enemies[i] for i in visible]
     
     @staticmethod
     def _draw_cylinder(radius, height, segments=12):
@@ -38,20 +168,21 @@ class EnemyRenderer:
         glColor3f(1.0, 1.0, 1.0)
         half_height = height / 2.0
         
+        endpoints, mids = _get_cylinder_table(segments)
+        
         # Draw cylinder sides
         glBegin(GL_QUADS)
         for i in range(segments):
-            angle1 = 2 * math.pi * i / segments
-            angle2 = 2 * math.pi * (i + 1) / segments
+            c1, s1 = endpoints[i]
+            c2, s2 = endpoints[i + 1]
             
-            x1 = radius * math.cos(angle1)
-            z1 = radius * math.sin(angle1)
-            x2 = radius * math.cos(angle2)
-            z2 = radius * math.sin(angle2)
+            x1 = radius * c1
+            z1 = radius * s1
+            x2 = radius * c2
+            z2 = radius * s2
             
             # Normal for side face
-            nx = math.cos((angle1 + angle2) / 2)
-            nz = math.sin((angle1 + angle2) / 2)
+            nx, nz = mids[i]
             glNormal3f(nx, 0, nz)
             
             # Bottom vertices
@@ -66,22 +197,16 @@ class EnemyRenderer:
         glBegin(GL_TRIANGLE_FAN)
         glNormal3f(0, 1, 0)
         glVertex3f(0, half_height, 0)  # Center
-        for i in range(segments + 1):
-            angle = 2 * math.pi * i / segments
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-            glVertex3f(x, half_height, z)
+        for c, s in endpoints:
+            glVertex3f(radius * c, half_height, radius * s)
         glEnd()
         
         # Draw bottom cap
         glBegin(GL_TRIANGLE_FAN)
         glNormal3f(0, -1, 0)
         glVertex3f(0, -half_height, 0)  # Center
-        for i in range(segments + 1):
-            angle = 2 * math.pi * i / segments
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-            glVertex3f(x, -half_height, -z)  # Reverse winding for bottom
+        for c, s in endpoints:
+            glVertex3f(radius * c, -half_height, -radius * s)  # Reverse winding for bottom
         glEnd()
     
     @staticmethod
@@ -92,12 +217,14 @@ class EnemyRenderer:
         
         # Disable lighting for health bar to make it clearly visible
         glDisable(GL_LIGHTING)
-        
+        EnemyRenderer._draw_health_bar_unlit(enemy)
+        glEnable(GL_LIGHTING)
+    
+    @staticmethod
+    def _draw_health_bar_unlit(enemy):
+        """Draw the health bar geometry, assuming lighting is already disabled"""
         # Position health bar above enemy
         bar_height_offset = enemy.height / 2 + 0.5
-        bar_width = 1.2
-        bar_thickness = 0.1
-        bar_depth = 0.05
         
         glPushMatrix()
         glTranslatef(enemy.x, enemy.y + bar_height_offset, enemy.z)
@@ -105,52 +232,25 @@ class EnemyRenderer:
         health_percentage = enemy.get_health_percentage()
         
         # Draw health bar background (dark red)
-        EnemyRenderer._draw_health_bar_background(bar_width, bar_thickness, bar_depth)
+        glCallList(_get_display_list(EnemyRenderer._draw_health_bar_background))
         
         # Draw current health portion
         if health_percentage > 0:
-            EnemyRenderer._draw_health_bar_foreground(bar_width, bar_thickness, bar_depth, health_percentage)
+            EnemyRenderer._draw_health_bar_foreground(health_percentage)
         
         # Draw health bar border
-        EnemyRenderer._draw_health_bar_border(bar_width, bar_thickness, bar_depth)
+        glCallList(_get_display_list(EnemyRenderer._draw_health_bar_border))
         
         glPopMatrix()
-        
-        # Re-enable lighting
-        glEnable(GL_LIGHTING)
     
     @staticmethod
-    def _draw_health_bar_background(bar_width, bar_thickness, bar_depth):
+    def _draw_health_bar_background():
         """Draw the background of the health bar"""
         glColor3f(0.3, 0.1, 0.1)
-        glBegin(GL_QUADS)
-        # Front face
-        glVertex3f(-bar_width/2, -bar_thickness/2, bar_depth/2)
-        glVertex3f(bar_width/2, -bar_thickness/2, bar_depth/2)
-        glVertex3f(bar_width/2, bar_thickness/2, bar_depth/2)
-        glVertex3f(-bar_width/2, bar_thickness/2, bar_depth/2)
-        
-        # Back face
-        glVertex3f(-bar_width/2, -bar_thickness/2, -bar_depth/2)
-        glVertex3f(-bar_width/2, bar_thickness/2, -bar_depth/2)
-        glVertex3f(bar_width/2, bar_thickness/2, -bar_depth/2)
-        glVertex3f(bar_width/2, -bar_thickness/2, -bar_depth/2)
-        
-        # Top face
-        glVertex3f(-bar_width/2, bar_thickness/2, -bar_depth/2)
-        glVertex3f(-bar_width/2, bar_thickness/2, bar_depth/2)
-        glVertex3f(bar_width/2, bar_thickness/2, bar_depth/2)
-        glVertex3f(bar_width/2, bar_thickness/2, -bar_depth/2)
-        
-        # Bottom face
-        glVertex3f(-bar_width/2, -bar_thickness/2, -bar_depth/2)
-        glVertex3f(bar_width/2, -bar_thickness/2, -bar_depth/2)
-        glVertex3f(bar_width/2, -bar_thickness/2, bar_depth/2)
-        glVertex3f(-bar_width/2, -bar_thickness/2, bar_depth/2)
-        glEnd()
+        _draw_vertex_array(GL_QUADS, _BG_VERTS)
     
     @staticmethod
-    def _draw_health_bar_foreground(bar_width, bar_thickness, bar_depth, health_percentage):
+    def _draw_health_bar_foreground(health_percentage):
         """Draw the current health portion of the health bar"""
         # Set color based on health percentage
         if health_percentage > 0.6:
@@ -160,53 +260,23 @@ class EnemyRenderer:
         else:
             glColor3f(0.8, 0.2, 0.2)  # Red
         
-        current_width = bar_width * health_percentage
-        glBegin(GL_QUADS)
-        # Front face (health portion)
-        glVertex3f(-bar_width/2, -bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2 + current_width, -bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2 + current_width, bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2, bar_thickness/2, bar_depth/2 + 0.001)
-        
-        # Back face (health portion)
-        glVertex3f(-bar_width/2, -bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2, bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2 + current_width, bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2 + current_width, -bar_thickness/2, -bar_depth/2 - 0.001)
-        
-        # Top face (health portion)
-        glVertex3f(-bar_width/2, bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2, bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2 + current_width, bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2 + current_width, bar_thickness/2, -bar_depth/2 - 0.001)
-        
-        # Bottom face (health portion)
-        glVertex3f(-bar_width/2, -bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2 + current_width, -bar_thickness/2, -bar_depth/2 - 0.001)
-        glVertex3f(-bar_width/2 + current_width, -bar_thickness/2, bar_depth/2 + 0.001)
-        glVertex3f(-bar_width/2, -bar_thickness/2, bar_depth/2 + 0.001)
-        glEnd()
+        # Stretch the unit-width bar from the left edge to the current health
+        glPushMatrix()
+        glTranslatef(-_BAR_WIDTH/2, 0, 0)
+        glScalef(_BAR_WIDTH * health_percentage, 1, 1)
+        _draw_vertex_array(GL_QUADS, _FG_UNIT_VERTS)
+        glPopMatrix()
     
     @staticmethod
-    def _draw_health_bar_border(bar_width, bar_thickness, bar_depth):
+    def _draw_health_bar_border():
         """Draw the border of the health bar"""
         glColor3f(1.0, 1.0, 1.0)
         glLineWidth(1.5)
         
         # Front border
-        glBegin(GL_LINE_LOOP)
-        glVertex3f(-bar_width/2, -bar_thickness/2, bar_depth/2 + 0.002)
-        glVertex3f(bar_width/2, -bar_thickness/2, bar_depth/2 + 0.002)
-        glVertex3f(bar_width/2, bar_thickness/2, bar_depth/2 + 0.002)
-        glVertex3f(-bar_width/2, bar_thickness/2, bar_depth/2 + 0.002)
-        glEnd()
+        _draw_vertex_array(GL_LINE_LOOP, _BORDER_FRONT_VERTS)
         
         # Back border
-        glBegin(GL_LINE_LOOP)
-        glVertex3f(-bar_width/2, -bar_thickness/2, -bar_depth/2 - 0.002)
-        glVertex3f(-bar_width/2, bar_thickness/2, -bar_depth/2 - 0.002)
-        glVertex3f(bar_width/2, bar_thickness/2, -bar_depth/2 - 0.002)
-        glVertex3f(bar_width/2, -bar_thickness/2, -bar_depth/2 - 0.002)
-        glEnd()
+        _draw_vertex_array(GL_LINE_LOOP, _BORDER_BACK_VERTS)
         
-        glLineWidth(1.0)
\ No newline at end of file
+        glLineWidth(1.0)
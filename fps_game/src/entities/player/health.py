@@ -1,6 +1,10 @@
 import time
+from collections import deque
 
 class HealthSystem:
+    __slots__ = ('max_health', 'current_health', 'last_damage_time',
+                 'damage_cooldown', 'damage_per_hit', 'is_alive', 'events')
+    
     def __init__(self, max_health=100):
         self.max_health = max_health
         self.current_health = max_health
@@ -8,10 +12,12 @@ class HealthSystem:
         self.damage_cooldown = 1.0  # 1 second between damage instances
         self.damage_per_hit = 20
         self.is_alive = True
+        self.events = deque()  # Damage messages, drained by the HUD once per frame
         
-    def take_damage(self, damage=None):
+    def take_damage(self, damage=None, current_time=None):
         """Take damage if cooldown has passed"""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.monotonic()
         
         # Check if enough time has passed since last damage
         if current_time - self.last_damage_time < self.damage_cooldown:
@@ -26,12 +32,18 @@ class HealthSystem:
         if self.current_health <= 0:
             self.current_health = 0
             self.is_alive = False
-            print("GAME OVER! You have been defeated!")
+            self.events.append("GAME OVER! You have been defeated!")
         else:
-            print(f"Taking damage! Health: {self.current_health}/{self.max_health}")
+            self.events.append(f"Taking damage! Health: {self.current_health}/{self.max_health}")
             
         return True
     
+    def drain_events(self):
+        """Return and clear the queued health messages"""
+        events = list(self.events)
+        self.events.clear()
+        return events
+    
     def heal(self, amount):
         """Heal the player"""
         self.current_health = min(self.max_health, self.current_health + amount)
@@ -44,4 +56,5 @@ class HealthSystem:
         """Reset health to full"""
         self.current_health = self.max_health
         self.is_alive = True
-        self.last_damage_time = 0
\ No newline at end of file
+        self.last_damage_time = 0
+        self.events.clear()
\ No newline at end of file
@@ -1,8 +1,57 @@
 import math
+import numpy as np
 from OpenGL.GL import *
 from src.rendering.model_loader import render_pistol
 
+# Display lists for the static skybox and ground, compiled on first draw
+_skybox_list = None
+_ground_list = None
+
+# Skybox side corners on a radius-100 circle (last repeats the first to close the loop)
+_SKY_CORNERS = [(100 * math.cos(i * math.pi / 2), 100 * math.sin(i * math.pi / 2)) for i in range(5)]
+
+def _build_unit_sphere(rings, segments):
+    """Unit UV-sphere vertices and one triangle-strip index row per ring"""
+    ring_angles = np.linspace(0.0, math.pi, rings + 1)
+    segment_angles = np.linspace(0.0, 2 * math.pi, segments + 1)
+    sin_r = np.sin(ring_angles)[:, None]
+    vertices = np.empty((rings + 1, segments + 1, 3), dtype=np.float32)
+    vertices[..., 0] = sin_r * np.cos(segment_angles)
+    vertices[..., 1] = np.cos(ring_angles)[:, None]
+    vertices[..., 2] = sin_r * np.sin(segment_angles)
+    
+    # Each strip alternates between ring i and ring i + 1
+    grid = np.arange((rings + 1) * (segments + 1), dtype=np.uint16).reshape(rings + 1, segments + 1)
+    strips = np.empty((rings, 2 * (segments + 1)), dtype=np.uint16)
+    strips[:, 0::2] = grid[:-1]
+    strips[:, 1::2] = grid[1:]
+    return vertices.reshape(-1, 3), strips
+
+def _join_strips(strips):
+    """Join triangle strips into one with degenerate triangles between them"""
+    joined = [strips[0]]
+    for prev, strip in zip(strips[:-1], strips[1:]):
+        joined.append(np.array([prev[-1], strip[0]], dtype=strips.dtype))
+        joined.append(strip)
+    return np.concatenate(joined)
+
+# Cursor target sphere geometry, uploaded to buffer objects on first draw
+_CURSOR_RADIUS = 0.1
+_CURSOR_VERTS, _CURSOR_STRIPS = _build_unit_sphere(rings=6, segments=8)
+_CURSOR_INDICES = _join_strips(_CURSOR_STRIPS)
+_cursor_vbo = None
+_cursor_ibo = None
+
 def draw_skybox():
+    global _skybox_list
+    if _skybox_list is None:
+        _skybox_list = glGenLists(1)
+        glNewList(_skybox_list, GL_COMPILE)
+        _draw_skybox_immediate()
+        glEndList()
+    glCallList(_skybox_list)
+
+def _draw_skybox_immediate():
     # Disable depth testing for skybox
     glDisable(GL_DEPTH_TEST)
     glDisable(GL_LIGHTING)  # Disable lighting for skybox
@@ -20,9 +69,8 @@ def draw_skybox():
     
     # Sides with gradient
     for i in range(4):
-        angle = i * math.pi / 2
-        x1, z1 = 100 * math.cos(angle), 100 * math.sin(angle)
-        x2, z2 = 100 * math.cos(angle + math.pi/2), 100 * math.sin(angle + math.pi/2)
+        x1, z1 = _SKY_CORNERS[i]
+        x2, z2 = _SKY_CORNERS[i + 1]
         
         # Top of side (sky blue)
         glColor3f(0.5, 0.7, 1.0)
@@ -42,6 +90,15 @@ def draw_skybox():
     glDepthMask(GL_TRUE)
 
 def draw_ground():
+    global _ground_list
+    if _ground_list is None:
+        _ground_list = glGenLists(1)
+        glNewList(_ground_list, GL_COMPILE)
+        _draw_ground_immediate()
+        glEndList()
+    glCallList(_ground_list)
+
+def _draw_ground_immediate():
     # Set material properties for the ground
     glMaterialfv(GL_FRONT, GL_AMBIENT, [0.3, 0.3, 0.3, 1.0])
     glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.5, 0.5, 0.5, 1.0])
@@ -78,12 +135,8 @@ def draw_weapon_model(quaternion_weapon, weapon_system=None):
     else:
         weapon_quaternion = quaternion_weapon.quaternion
     
-    # Temporarily override the quaternion_weapon's quaternion for rendering
-    original_quaternion = quaternion_weapon.quaternion.copy()
-    quaternion_weapon.quaternion = weapon_quaternion
-    
-    # Apply weapon transformation (this pushes matrix)
-    if quaternion_weapon.apply_weapon_transform():
+    # Apply weapon transformation with that orientation (this pushes matrix)
+    if quaternion_weapon.apply_weapon_transform(weapon_quaternion):
         
         # Reduced scale for smaller weapon size
         weapon_scale = 50.0  # Reduced from 100.0
@@ -99,17 +152,15 @@ def draw_weapon_model(quaternion_weapon, weapon_system=None):
         # Pop the matrix
         glPopMatrix()
     
-    # Restore original quaternion
-    quaternion_weapon.quaternion = original_quaternion
-    
     # Render reload animation arm if weapon system is provided
     if weapon_system:
-        # Get weapon world position for arm animation
-        weapon_world_pos = [
-            quaternion_weapon.camera_pos[0] + quaternion_weapon.weapon_offset[0],
-            quaternion_weapon.camera_pos[1] + quaternion_weapon.weapon_offset[1],
-            quaternion_weapon.camera_pos[2] + quaternion_weapon.weapon_offset[2]
-        ]
+        # Get weapon world position for arm animation (written into the weapon's buffer)
+        weapon_world_pos = quaternion_weapon._world_pos
+        camera_pos = quaternion_weapon.camera_pos
+        weapon_offset = quaternion_weapon.weapon_offset
+        weapon_world_pos[0] = camera_pos[0] + weapon_offset[0]
+        weapon_world_pos[1] = camera_pos[1] + weapon_offset[1]
+        weapon_world_pos[2] = camera_pos[2] + weapon_offset[2]
         weapon_system.render_reload_animation(weapon_world_pos)
 
 def draw_cursor_target(quaternion_weapon):
@@ -123,32 +174,26 @@ def draw_cursor_target(quaternion_weapon):
     glDisable(GL_LIGHTING)
     glColor3f(1.0, 0.0, 0.0)  # Bright red
     
-    # Draw a simple sphere using triangle strips
-    import math
-    
-    segments = 8
-    rings = 6
-    radius = 0.1
-    
-    for i in range(rings):
-        ring_angle1 = math.pi * i / rings
-        ring_angle2 = math.pi * (i + 1) / rings
-        
-        glBegin(GL_TRIANGLE_STRIP)
-        for j in range(segments + 1):
-            segment_angle = 2 * math.pi * j / segments
-            
-            x1 = radius * math.sin(ring_angle1) * math.cos(segment_angle)
-            y1 = radius * math.cos(ring_angle1)
-            z1 = radius * math.sin(ring_angle1) * math.sin(segment_angle)
-            
-            x2 = radius * math.sin(ring_angle2) * math.cos(segment_angle)
-            y2 = radius * math.cos(ring_angle2)
-            z2 = radius * math.sin(ring_angle2) * math.sin(segment_angle)
-            
-            glVertex3f(x1, y1, z1)
-            glVertex3f(x2, y2, z2)
-        glEnd()
+    # Upload the unit sphere once
+    global _cursor_vbo, _cursor_ibo
+    if _cursor_vbo is None:
+        _cursor_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, _cursor_vbo)
+        glBufferData(GL_ARRAY_BUFFER, _CURSOR_VERTS.nbytes, _CURSOR_VERTS, GL_STATIC_DRAW)
+        _cursor_ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, _cursor_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, _CURSOR_INDICES.nbytes, _CURSOR_INDICES, GL_STATIC_DRAW)
+    
+    # Draw the sphere as a single indexed triangle strip
+    glScalef(_CURSOR_RADIUS, _CURSOR_RADIUS, _CURSOR_RADIUS)
+    glBindBuffer(GL_ARRAY_BUFFER, _cursor_vbo)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, _cursor_ibo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, None)
+    glDrawElements(GL_TRIANGLE_STRIP, len(_CURSOR_INDICES), GL_UNSIGNED_SHORT, None)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
     
     glEnable(GL_LIGHTING)
     glPopMatrix()
@@ -1,62 +1,228 @@
 import struct
 import json
 import os
+import hashlib
+import mmap
+import logging
 import sys
+import threading
+import ctypes
 from OpenGL.GL import *
 import numpy as np
 from pygltflib import GLTF2
 
+log = logging.getLogger(__name__)
+
+# Precompiled GLB container layouts: file header (magic, version, length)
+# and chunk header (length, type)
+_GLB_HEADER = struct.Struct('<4sII')
+_GLB_CHUNK_HEADER = struct.Struct('<I4s')
+
+def _make_accessor_decoder(dtype, components):
+    """Build a decoder for one (componentType, type) accessor layout"""
+    item_size = dtype.itemsize * components
+    scalar = components == 1
+    
+    def decode(buffer_data, offset, count, byte_stride):
+        stride = byte_stride or item_size
+        # View the buffer in place (elements may be interleaved with a larger
+        # byteStride), then copy out a contiguous array
+        data = np.ndarray(shape=(count, components), dtype=dtype, buffer=buffer_data,
+                          offset=offset, strides=(stride, dtype.itemsize))
+        data = np.ascontiguousarray(data)
+        return data.reshape(-1) if scalar else data
+    
+    decode.item_size = item_size
+    return decode
+
+# Accessor decoders keyed by (componentType, type), built once at import
+_ACCESSOR_DECODERS = {
+    (component_type, accessor_type): _make_accessor_decoder(np.dtype(dtype), components)
+    for component_type, dtype in (
+        (5120, '<i1'),  # BYTE
+        (5121, '<u1'),  # UNSIGNED_BYTE
+        (5122, '<i2'),  # SHORT
+        (5123, '<u2'),  # UNSIGNED_SHORT
+        (5125, '<u4'),  # UNSIGNED_INT
+        (5126, '<f4'),  # FLOAT
+    )
+    for accessor_type, components in (('SCALAR', 1), ('VEC2', 2), ('VEC3', 3), ('VEC4', 4))
+}
+
+# Dark gun material, preallocated so rendering doesn't convert lists every frame
+_MAT_AMBIENT = (GLfloat * 4)(0.1, 0.1, 0.1, 1.0)   # Very dark ambient
+_MAT_DIFFUSE = (GLfloat * 4)(0.2, 0.2, 0.2, 1.0)   # Dark gray/black
+_MAT_SPECULAR = (GLfloat * 4)(0.3, 0.3, 0.3, 1.0)  # Subtle specular
+_MAT_SHININESS = 32.0                              # Medium shininess
+
 class GLTFLoader:
     """Loads and renders GLTF/GLB 3D models using pygltflib"""
     
     def __init__(self):
         self.models = {}
+        self._accessor_cache = {}  # Decoded accessors for the model being processed
+        self._vbo_cache = {}  # Geometry hash -> GPU buffers, shared by identical primitives
         
     def load_glb(self, filepath):
         """Load a GLB (binary GLTF) file using pygltflib"""
-        print(f"Attempting to load GLB file with pygltflib: {filepath}")
+        log.debug("Attempting to load GLB file with pygltflib: %s", filepath)
         
         # Check if file exists
         if not os.path.exists(filepath):
-            print(f"ERROR: File not found: {filepath}")
+            log.error("File not found: %s", filepath)
             try:
                 # Safely print current directory, handling Unicode issues
                 current_dir = os.getcwd()
-                print(f"Current working directory: {current_dir}")
+                log.warning("Current working directory: %s", current_dir)
             except UnicodeEncodeError:
-                print("Current working directory contains Unicode characters that cannot be displayed")
-                print("Consider moving the project to a path with only ASCII characters")
+                log.warning("Current working directory contains Unicode characters that cannot be displayed")
+                log.warning("Consider moving the project to a path with only ASCII characters")
             
             try:
                 files = os.listdir('.')
-                print(f"Files in current directory: {files}")
+                log.warning("Files in current directory: %s", files)
             except Exception as e:
-                print(f"Could not list directory contents: {e}")
+                log.warning("Could not list directory contents: %s", e)
             return None
+        
+        # Map the file once, it is both hashed and parsed from the mapping
+        try:
+            with open(filepath, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            log.error("Could not map %s: %s", filepath, e)
+            return None
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)  # Hint read-ahead for the hash pass
+        
+        # Reuse an already decoded model if the file content hasn't changed
+        key = hashlib.blake2b(mm, digest_size=16).hexdigest()
+        if key in self.models:
+            log.debug("Using cached model for %s", filepath)
+            mm.close()
+            return self.models[key]
+        
+        model_data = self._load_sidecar(filepath, key)
+        if model_data:
+            log.debug("Loaded decoded model from cache file %s.npz", filepath)
+            self.models[key] = model_data
+            mm.close()
+            return model_data
             
         try:
-            # Load GLTF using pygltflib - simple approach like working version
-            gltf = GLTF2().load(filepath)
-            print(f"Successfully loaded GLTF file with pygltflib")
-            print(f"GLTF contains:")
-            print(f"  - {len(gltf.meshes) if gltf.meshes else 0} meshes")
-            print(f"  - {len(gltf.materials) if gltf.materials else 0} materials")
-            print(f"  - {len(gltf.nodes) if gltf.nodes else 0} nodes")
-            print(f"  - {len(gltf.buffers) if gltf.buffers else 0} buffers")
-            print(f"  - {len(gltf.bufferViews) if gltf.bufferViews else 0} buffer views")
-            print(f"  - {len(gltf.accessors) if gltf.accessors else 0} accessors")
-            
-            return self._process_gltf_pygltflib(gltf)
+            # Map GLB files and parse the container ourselves so the BIN chunk isn't copied
+            bin_view = None
+            if filepath.lower().endswith('.glb'):
+                try:
+                    gltf, bin_view = self._parse_glb_mapped(mm, filepath)
+                except Exception as e:
+                    log.warning("Memory-mapped GLB load failed, using pygltflib loader: %s", e)
+                    gltf = GLTF2().load(filepath)
+            else:
+                # Load GLTF using pygltflib - simple approach like working version
+                gltf = GLTF2().load(filepath)
+            
+            # pygltflib already holds GLB binary data as one blob, fetch it once
+            # here instead of once per accessor
+            if bin_view is None:
+                blob = gltf.binary_blob()
+                if blob:
+                    bin_view = memoryview(blob)
+            log.debug("Successfully loaded GLTF file with pygltflib")
+            log.debug("GLTF contains:")
+            log.debug("- %s meshes", len(gltf.meshes) if gltf.meshes else 0)
+            log.debug("- %s materials", len(gltf.materials) if gltf.materials else 0)
+            log.debug("- %s nodes", len(gltf.nodes) if gltf.nodes else 0)
+            log.debug("- %s buffers", len(gltf.buffers) if gltf.buffers else 0)
+            log.debug("- %s buffer views", len(gltf.bufferViews) if gltf.bufferViews else 0)
+            log.debug("- %s accessors", len(gltf.accessors) if gltf.accessors else 0)
+            
+            model_data = self._process_gltf_pygltflib(gltf, bin_view)
+            if model_data:
+                self.models[key] = model_data
+                self._save_sidecar(filepath, key, model_data)
+            return model_data
                 
         except Exception as e:
-            print(f"ERROR loading GLB file {filepath} with pygltflib: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error loading GLB file %s with pygltflib: %s", filepath, e)
             return None
     
-    def _process_gltf_pygltflib(self, gltf):
+    def _load_sidecar(self, filepath, key):
+        """Load decoded primitive arrays from the .npz next to the model, if it matches key"""
+        sidecar_path = filepath + '.npz'
+        if not os.path.exists(sidecar_path):
+            return None
+        
+        try:
+            with np.load(sidecar_path) as cache:
+                if str(cache['key']) != key:
+                    return None
+                
+                meshes = []
+                for i in range(int(cache['mesh_count'])):
+                    primitives = []
+                    for j in range(int(cache[f'm{i}_primitive_count'])):
+                        prefix = f'm{i}_p{j}_'
+                        primitives.append({
+                            'vertices': cache[prefix + 'vertices'],
+                            'normals': cache[prefix + 'normals'] if prefix + 'normals' in cache else None,
+                            'indices': cache[prefix + 'indices'] if prefix + 'indices' in cache else None,
+                            'material': int(cache[prefix + 'material'])
+                        })
+                    meshes.append({'primitives': primitives})
+        except Exception as e:
+            log.warning("Ignoring unreadable model cache %s: %s", sidecar_path, e)
+            return None
+        
+        # Only geometry is cached, the glTF material/node objects are not
+        return {'meshes': meshes, 'materials': [], 'nodes': [], 'scenes': []}
+    
+    def _save_sidecar(self, filepath, key, model_data):
+        """Save decoded primitive arrays to a .npz next to the model for faster cold starts"""
+        arrays = {'key': np.array(key), 'mesh_count': np.array(len(model_data['meshes']))}
+        for i, mesh in enumerate(model_data['meshes']):
+            arrays[f'm{i}_primitive_count'] = np.array(len(mesh['primitives']))
+            for j, primitive in enumerate(mesh['primitives']):
+                prefix = f'm{i}_p{j}_'
+                arrays[prefix + 'material'] = np.array(primitive['material'])
+                for name in ('vertices', 'normals', 'indices'):
+                    if primitive[name] is not None:
+                        arrays[prefix + name] = primitive[name]
+        
+        try:
+            with open(filepath + '.npz', 'wb') as f:
+                np.savez(f, **arrays)
+        except OSError as e:
+            log.warning("Could not write model cache for %s: %s", filepath, e)
+    
+    def _parse_glb_mapped(self, mm, filepath):
+        """Parse a memory-mapped GLB file, returning the GLTF2 and a view of its BIN chunk"""
+        # 12 byte header, then 8 byte chunk headers (length, type) before each chunk
+        magic, version, length = _GLB_HEADER.unpack_from(mm, 0)
+        if magic != b'glTF':
+            raise ValueError(f"Not a GLB file: {filepath}")
+        
+        json_start = _GLB_HEADER.size + _GLB_CHUNK_HEADER.size
+        json_length, json_type = _GLB_CHUNK_HEADER.unpack_from(mm, _GLB_HEADER.size)
+        if json_type != b'JSON':
+            raise ValueError(f"GLB file has no JSON chunk: {filepath}")
+        gltf = GLTF2.from_json(mm[json_start:json_start + json_length].decode('utf-8'), infer_missing=True)
+        
+        # The BIN chunk stays in the mapping, accessors are decoded straight from it
+        bin_view = None
+        bin_header = json_start + json_length
+        if bin_header + _GLB_CHUNK_HEADER.size <= length:
+            bin_length, bin_type = _GLB_CHUNK_HEADER.unpack_from(mm, bin_header)
+            if bin_type == b'BIN\x00':
+                bin_start = bin_header + _GLB_CHUNK_HEADER.size
+                bin_view = memoryview(mm)[bin_start:bin_start + bin_length]
+        
+        return gltf, bin_view
+    
+    def _process_gltf_pygltflib(self, gltf, bin_view=None):
         """Process GLTF data loaded with pygltflib"""
-        print("Processing GLTF data with pygltflib...")
+        log.debug("Processing GLTF data with pygltflib...")
+        self._accessor_cache = {}
         
         model_data = {
             'meshes': [],
@@ -66,105 +232,122 @@ class GLTFLoader:
         }
         
         if not gltf.meshes:
-            print("No meshes found in GLTF file")
+            log.warning("No meshes found in GLTF file")
             return None
             
         # Process each mesh
-        for i, mesh in enumerate(gltf.meshes):
-            mesh_name = mesh.name if mesh.name else f'mesh_{i}'
-            print(f"Processing mesh {i}: {mesh_name}")
-            mesh_data = self._process_mesh_pygltflib(gltf, mesh, i)
-            if mesh_data:
-                model_data['meshes'].append(mesh_data)
-                print(f"Successfully processed mesh {i}")
-            else:
-                print(f"Failed to process mesh {i}")
+        try:
+            for i, mesh in enumerate(gltf.meshes):
+                mesh_name = mesh.name if mesh.name else f'mesh_{i}'
+                log.debug("Processing mesh %s: %s", i, mesh_name)
+                mesh_data = self._process_mesh_pygltflib(gltf, mesh, i, bin_view)
+                if mesh_data:
+                    model_data['meshes'].append(mesh_data)
+                    log.debug("Successfully processed mesh %s", i)
+                else:
+                    log.warning("Failed to process mesh %s", i)
+        except Exception as e:
+            log.exception("Error processing GLTF meshes: %s", e)
+            return None
+        finally:
+            self._accessor_cache = {}
         
-        print(f"Final model has {len(model_data['meshes'])} processed meshes")
+        log.debug("Final model has %s processed meshes", len(model_data['meshes']))
         return model_data if model_data['meshes'] else None
     
-    def _process_mesh_pygltflib(self, gltf, mesh, mesh_index):
+    def _process_mesh_pygltflib(self, gltf, mesh, mesh_index, bin_view=None):
         """Process a single mesh using pygltflib"""
         primitives = []
         
         for j, primitive in enumerate(mesh.primitives):
-            try:
-                print(f"  Processing primitive {j}")
-                
-                vertices = None
-                normals = None
-                indices = None
-                
-                # Get vertex positions
-                if hasattr(primitive.attributes, 'POSITION') and primitive.attributes.POSITION is not None:
-                    vertices = self._get_accessor_data_pygltflib(gltf, primitive.attributes.POSITION)
-                    if vertices:
-                        print(f"  Loaded {len(vertices)} vertices")
-                        # Print first few vertices for debugging
-                        for k in range(min(3, len(vertices))):
-                            print(f"    Vertex {k}: {vertices[k]}")
-                
-                # Get normals
-                if hasattr(primitive.attributes, 'NORMAL') and primitive.attributes.NORMAL is not None:
-                    normals = self._get_accessor_data_pygltflib(gltf, primitive.attributes.NORMAL)
-                    if normals:
-                        print(f"  Loaded {len(normals)} normals")
-                
-                # Get indices
-                if primitive.indices is not None:
-                    indices = self._get_accessor_data_pygltflib(gltf, primitive.indices)
-                    if indices:
-                        print(f"  Loaded {len(indices)} indices")
-                        # Convert to flat list if needed
-                        if indices and isinstance(indices[0], (list, tuple)):
-                            indices = [idx[0] if isinstance(idx, (list, tuple)) else idx for idx in indices]
-                
-                if vertices is not None:
-                    primitives.append({
-                        'vertices': vertices,
-                        'normals': normals,
-                        'indices': indices,
-                        'material': primitive.material if primitive.material is not None else 0
-                    })
-                    print(f"  Successfully created primitive {j}")
-                else:
-                    print(f"  No vertices found for primitive {j}")
-                    
-            except Exception as e:
-                print(f"  ERROR processing primitive {j}: {e}")
-                import traceback
-                traceback.print_exc()
+            log.debug("Processing primitive %s", j)
+            
+            position_index = getattr(primitive.attributes, 'POSITION', None)
+            normal_index = getattr(primitive.attributes, 'NORMAL', None)
+            
+            # Get vertex positions
+            if position_index is None:
+                log.warning("No vertices found for primitive %s", j)
                 continue
+            vertices = self._get_accessor_data_pygltflib(gltf, position_index, bin_view)
+            if vertices is None:
+                log.warning("No vertices found for primitive %s", j)
+                continue
+            log.debug("Loaded %s vertices", len(vertices))
+            # Print first few vertices for debugging
+            if log.isEnabledFor(logging.DEBUG):
+                for k in range(min(3, len(vertices))):
+                    log.debug("Vertex %s: %s", k, vertices[k])
+            
+            # Get normals
+            normals = None
+            if normal_index is not None:
+                normals = self._get_accessor_data_pygltflib(gltf, normal_index, bin_view)
+                if normals is not None:
+                    log.debug("Loaded %s normals", len(normals))
+            
+            # Get indices
+            indices = None
+            if primitive.indices is not None:
+                indices = self._get_accessor_data_pygltflib(gltf, primitive.indices, bin_view)
+                if indices is not None:
+                    log.debug("Loaded %s indices", len(indices))
+            
+            # Store typed arrays: float32 attributes and uint32 indices
+            vertices = np.asarray(vertices, dtype=np.float32)
+            if normals is not None:
+                normals = np.asarray(normals, dtype=np.float32)
+            if indices is not None:
+                # SCALAR accessors decode to 1-D, so this is a plain widening cast
+                indices = np.asarray(indices, dtype=np.uint32)
+            
+            primitives.append({
+                'vertices': vertices,
+                'normals': normals,
+                'indices': indices,
+                'material': primitive.material if primitive.material is not None else 0
+            })
+            log.debug("Successfully created primitive %s", j)
         
         return {'primitives': primitives} if primitives else None
     
-    def _get_accessor_data_pygltflib(self, gltf, accessor_index):
+    def _get_accessor_data_pygltflib(self, gltf, accessor_index, bin_view=None):
         """Extract data using pygltflib accessor - comprehensive approach"""
         try:
-            print(f"    Getting accessor data for index {accessor_index}")
+            log.debug("Getting accessor data for index %s", accessor_index)
+            
+            # Primitives often share accessors, decode each one only once per model
+            cached = self._accessor_cache.get(accessor_index)
+            if cached is not None:
+                return cached
             
             if accessor_index >= len(gltf.accessors):
-                print(f"    ERROR: Accessor index {accessor_index} out of range")
+                log.error("Accessor index %s out of range", accessor_index)
                 return None
             
             accessor = gltf.accessors[accessor_index]
             
             if accessor.bufferView is None:
-                print(f"    ERROR: Accessor {accessor_index} has no bufferView")
+                log.error("Accessor %s has no bufferView", accessor_index)
                 return None
                 
             buffer_view = gltf.bufferViews[accessor.bufferView]
             buffer = gltf.buffers[buffer_view.buffer]
             
-            print(f"    Accessor: count={accessor.count}, componentType={accessor.componentType}, type={accessor.type}")
+            log.debug("Accessor: count=%s, componentType=%s, type=%s", accessor.count, accessor.componentType, accessor.type)
             
             # Try multiple ways to get buffer data
             buffer_data = None
             
+            # Method 0: The GLB BIN chunk (always buffer 0 with no uri)
+            if bin_view is not None and buffer_view.buffer == 0 and not buffer.uri:
+                buffer_data = bin_view
+                log.debug("Got buffer data from GLB BIN chunk (%s bytes)", len(buffer_data))
+            
             # Method 1: Direct buffer.data access
-            if hasattr(buffer, 'data') and buffer.data:
+            elif getattr(buffer, 'data', None):
                 buffer_data = buffer.data
-                print(f"    Got buffer data from buffer.data ({len(buffer_data)} bytes)")
+                log.debug("Got buffer data from buffer.data (%s bytes)", len(buffer_data))
             
             # Method 2: Try to get from GLTF binary blob
             elif hasattr(gltf, 'binary_blob') and gltf.binary_blob:
@@ -172,12 +355,12 @@ class GLTFLoader:
                 if callable(gltf.binary_blob):
                     try:
                         buffer_data = gltf.binary_blob()
-                        print(f"    Got buffer data from gltf.binary_blob() method ({len(buffer_data)} bytes)")
+                        log.debug("Got buffer data from gltf.binary_blob() method (%s bytes)", len(buffer_data))
                     except:
-                        print("    binary_blob method failed")
+                        log.warning("binary_blob method failed")
                 else:
                     buffer_data = gltf.binary_blob
-                    print(f"    Got buffer data from gltf.binary_blob attribute ({len(buffer_data)} bytes)")
+                    log.debug("Got buffer data from gltf.binary_blob attribute (%s bytes)", len(buffer_data))
             
             # Method 3: Try buffer.uri handling
             elif buffer.uri:
@@ -186,24 +369,24 @@ class GLTFLoader:
                     import base64
                     header, data = buffer.uri.split(',', 1)
                     buffer_data = base64.b64decode(data)
-                    print(f"    Got buffer data from data URI ({len(buffer_data)} bytes)")
+                    log.debug("Got buffer data from data URI (%s bytes)", len(buffer_data))
                 else:
                     # External file
                     buffer_path = os.path.join(os.path.dirname(gltf.filename), buffer.uri)
                     with open(buffer_path, 'rb') as f:
                         buffer_data = f.read()
-                    print(f"    Got buffer data from external file ({len(buffer_data)} bytes)")
+                    log.debug("Got buffer data from external file (%s bytes)", len(buffer_data))
             
             # Method 4: Try accessing GLB file directly
-            elif hasattr(gltf, 'filename') and gltf.filename:
+            elif getattr(gltf, 'filename', None):
                 buffer_data = self._extract_glb_binary_data(gltf.filename)
                 if buffer_data:
-                    print(f"    Got buffer data by parsing GLB directly ({len(buffer_data)} bytes)")
+                    log.debug("Got buffer data by parsing GLB directly (%s bytes)", len(buffer_data))
             
             if buffer_data is None:
-                print("    ERROR: Could not access buffer data through any method")
-                print(f"    Buffer attributes: {[attr for attr in dir(buffer) if not attr.startswith('_')]}")
-                print(f"    GLTF attributes: {[attr for attr in dir(gltf) if not attr.startswith('_')]}")
+                log.error("Could not access buffer data through any method")
+                log.debug("Buffer attributes: %s", [attr for attr in dir(buffer) if not attr.startswith('_')])
+                log.debug("GLTF attributes: %s", [attr for attr in dir(gltf) if not attr.startswith('_')])
                 return None
             
             # Calculate offsets
@@ -211,65 +394,30 @@ class GLTFLoader:
             accessor_offset = accessor.byteOffset if accessor.byteOffset else 0
             total_offset = buffer_offset + accessor_offset
             
-            print(f"    Buffer offset: {buffer_offset}, Accessor offset: {accessor_offset}")
-            print(f"    Total offset: {total_offset}, Buffer size: {len(buffer_data)}")
-            
-            # Map component types to struct formats and sizes
-            component_types = {
-                5120: ('b', 1),  # BYTE
-                5121: ('B', 1),  # UNSIGNED_BYTE
-                5122: ('h', 2),  # SHORT
-                5123: ('H', 2),  # UNSIGNED_SHORT
-                5125: ('I', 4),  # UNSIGNED_INT
-                5126: ('f', 4),  # FLOAT
-            }
-            
-            # Map accessor types to component counts
-            type_components = {
-                'SCALAR': 1,
-                'VEC2': 2,
-                'VEC3': 3,
-                'VEC4': 4
-            }
-            
-            if accessor.componentType not in component_types:
-                print(f"    ERROR: Unknown component type: {accessor.componentType}")
-                return None
-                
-            if accessor.type not in type_components:
-                print(f"    ERROR: Unknown accessor type: {accessor.type}")
-                return None
-            
-            format_char, byte_size = component_types[accessor.componentType]
-            components = type_components[accessor.type]
-            
-            print(f"    Format: {format_char}, components: {components}, byte_size: {byte_size}")
+            log.debug("Buffer offset: %s, Accessor offset: %s", buffer_offset, accessor_offset)
+            log.debug("Total offset: %s, Buffer size: %s", total_offset, len(buffer_data))
             
-            # Extract data
-            data = []
-            stride = byte_size * components
-            total_bytes_needed = accessor.count * stride
+            decode = _ACCESSOR_DECODERS.get((accessor.componentType, accessor.type))
+            if decode is None:
+                log.error("Unsupported accessor layout: componentType=%s, type=%s",
+                          accessor.componentType, accessor.type)
+                return None
             
+            # Check the last element fits in the buffer
+            stride = buffer_view.byteStride or decode.item_size
+            total_bytes_needed = stride * (accessor.count - 1) + decode.item_size if accessor.count else 0
             if total_offset + total_bytes_needed > len(buffer_data):
-                print(f"    ERROR: Not enough buffer data. Need {total_bytes_needed} bytes, have {len(buffer_data) - total_offset}")
+                log.error("Not enough buffer data. Need %s bytes, have %s", total_bytes_needed, len(buffer_data) - total_offset)
                 return None
             
-            for i in range(accessor.count):
-                item_offset = total_offset + i * stride
-                if accessor.type == 'SCALAR':
-                    value = struct.unpack_from(f'<{format_char}', buffer_data, item_offset)[0]
-                    data.append(value)
-                else:
-                    values = struct.unpack_from(f'<{components}{format_char}', buffer_data, item_offset)
-                    data.append(list(values))
+            data = decode(buffer_data, total_offset, accessor.count, buffer_view.byteStride)
             
-            print(f"    Successfully extracted {len(data)} items")
+            log.debug("Successfully extracted %s items", len(data))
+            self._accessor_cache[accessor_index] = data
             return data
             
         except Exception as e:
-            print(f"    ERROR extracting accessor data with pygltflib: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error extracting accessor data with pygltflib: %s", e)
             return None
     
     def _extract_glb_binary_data(self, filepath):
@@ -277,16 +425,12 @@ class GLTFLoader:
         try:
             with open(filepath, 'rb') as f:
                 # Read GLB header
-                magic = f.read(4)
+                magic, version, length = _GLB_HEADER.unpack(f.read(_GLB_HEADER.size))
                 if magic != b'glTF':
                     return None
                 
-                version = struct.unpack('<I', f.read(4))[0]
-                length = struct.unpack('<I', f.read(4))[0]
-                
                 # Read JSON chunk header
-                json_chunk_length = struct.unpack('<I', f.read(4))[0]
-                json_chunk_type = f.read(4)
+                json_chunk_length, json_chunk_type = _GLB_CHUNK_HEADER.unpack(f.read(_GLB_CHUNK_HEADER.size))
                 
                 # Skip JSON data
                 f.seek(json_chunk_length, 1)
@@ -294,8 +438,7 @@ class GLTFLoader:
                 # Check if there's a binary chunk
                 if f.tell() < length:
                     # Read binary chunk header
-                    bin_chunk_length = struct.unpack('<I', f.read(4))[0]
-                    bin_chunk_type = f.read(4)
+                    bin_chunk_length, bin_chunk_type = _GLB_CHUNK_HEADER.unpack(f.read(_GLB_CHUNK_HEADER.size))
                     
                     if bin_chunk_type == b'BIN\x00':
                         # Read binary data
@@ -304,7 +447,7 @@ class GLTFLoader:
                 
                 return None
         except Exception as e:
-            print(f"    Error reading GLB binary data manually: {e}")
+            log.error("Error reading GLB binary data manually: %s", e)
             return None
     
     def render_model(self, model_data, scale=1.0, position=(0, 0, 0), rotation=(0, 0, 0)):
@@ -328,10 +471,10 @@ class GLTFLoader:
         glDisable(GL_COLOR_MATERIAL)
         
         # Set dark/black material properties for the gun
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.1, 0.1, 0.1, 1.0])      # Very dark ambient
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.2, 0.2, 0.2, 1.0])      # Dark gray/black
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.3, 0.3, 0.3, 1.0])     # Subtle specular
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 32.0)                      # Medium shininess
+        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, _MAT_AMBIENT)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, _MAT_DIFFUSE)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, _MAT_SPECULAR)
+        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, _MAT_SHININESS)
         
         # Render each mesh
         for i, mesh in enumerate(model_data['meshes']):
@@ -343,48 +486,128 @@ class GLTFLoader:
         
         glPopMatrix()
     
+    def _upload_primitive(self, primitive):
+        """Upload a primitive's geometry into GPU buffers (needs a current GL context)"""
+        vertices = np.asarray(primitive['vertices'], dtype=np.float32)
+        normals = primitive.get('normals')
+        indices = primitive.get('indices')
+        
+        # Normals are only usable if there is one per vertex. When present they are
+        # interleaved with the positions (px, py, pz, nx, ny, nz) in a single buffer.
+        primitive['has_normals'] = normals is not None and len(normals) == len(vertices)
+        if primitive['has_normals']:
+            interleaved = np.empty((len(vertices), 6), dtype=np.float32)
+            interleaved[:, 0:3] = vertices
+            interleaved[:, 3:6] = normals
+        else:
+            interleaved = np.ascontiguousarray(vertices)
+        primitive['stride'] = interleaved.strides[0]
+        
+        # Identical primitives (within or across models) share one set of buffers
+        digest = hashlib.blake2b(interleaved.tobytes(), digest_size=16)
+        if indices is not None:
+            digest.update(np.asarray(indices, dtype=np.uint32).tobytes())
+        geometry_key = digest.digest()
+        shared = self._vbo_cache.get(geometry_key)
+        if shared is not None:
+            primitive['vbo'], primitive['ibo'], primitive['count'], primitive['index_range'] = shared
+            return
+        
+        primitive['vbo'] = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, primitive['vbo'])
+        glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        primitive['ibo'] = None
+        if indices is not None and len(indices) > 0:
+            # Keep whole triangles that only reference existing vertices
+            triangles = np.asarray(indices, dtype=np.uint32)[:len(indices) // 3 * 3].reshape(-1, 3)
+            triangles = np.ascontiguousarray(triangles[(triangles < len(vertices)).all(axis=1)])
+            primitive['ibo'] = glGenBuffers(1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, primitive['ibo'])
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, triangles.nbytes, triangles, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+            primitive['count'] = triangles.size
+            # Referenced vertex range, passed to glDrawRangeElements
+            primitive['index_range'] = (int(triangles.min()), int(triangles.max())) if triangles.size else (0, 0)
+        else:
+            primitive['count'] = len(vertices) // 3 * 3
+            primitive['index_range'] = None
+        
+        self._vbo_cache[geometry_key] = (primitive['vbo'], primitive['ibo'],
+                                         primitive['count'], primitive['index_range'])
+    
     def _render_primitive(self, primitive, mesh_idx, prim_idx):
         """Render a single primitive (triangle list)"""
         vertices = primitive.get('vertices')
-        normals = primitive.get('normals')
-        indices = primitive.get('indices')
+        if vertices is None or len(vertices) == 0:
+            return
         
-        if not vertices:
+        # Old GL drivers without buffer objects draw from client-side arrays
+        if not bool(glGenBuffers):
+            self._render_primitive_arrays(primitive)
             return
         
-        if indices:
+        # Geometry is uploaded on first draw since models load before the GL context exists
+        if 'vbo' not in primitive:
+            self._upload_primitive(primitive)
+        
+        stride = primitive['stride']
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, primitive['vbo'])
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        
+        if primitive['has_normals']:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))  # Normals follow the 3 position floats
+        
+        if primitive['ibo'] is not None:
             # Render with indices
-            glBegin(GL_TRIANGLES)
-            for i in range(0, len(indices), 3):
-                if i + 2 < len(indices):
-                    for j in range(3):
-                        idx = indices[i + j]
-                        if isinstance(idx, list):
-                            idx = idx[0] if idx else 0
-                        if idx < len(vertices):
-                            if normals and idx < len(normals):
-                                normal = normals[idx]
-                                if len(normal) >= 3:
-                                    glNormal3f(normal[0], normal[1], normal[2])
-                            vertex = vertices[idx]
-                            if len(vertex) >= 3:
-                                glVertex3f(vertex[0], vertex[1], vertex[2])
-            glEnd()
+            start, end = primitive['index_range']
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, primitive['ibo'])
+            glDrawRangeElements(GL_TRIANGLES, start, end, primitive['count'], GL_UNSIGNED_INT, None)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
         else:
             # Render without indices
-            glBegin(GL_TRIANGLES)
-            for i in range(0, len(vertices), 3):
-                if i + 2 < len(vertices):
-                    for j in range(3):
-                        if i + j < len(vertices):
-                            if normals and i + j < len(normals):
-                                normal = normals[i + j]
-                                if len(normal) >= 3:
-                                    glNormal3f(normal[0], normal[1], normal[2])
-                            vertex = vertices[i + j]
-                            if len(vertex) >= 3:
-                                glVertex3f(vertex[0], vertex[1], vertex[2])
-            glEnd()
+            glDrawArrays(GL_TRIANGLES, 0, primitive['count'])
+        
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+    
+    def _render_primitive_arrays(self, primitive):
+        """Render a primitive from client-side arrays gathered into triangle order"""
+        if 'gathered_vertices' not in primitive:
+            vertices = np.asarray(primitive['vertices'], dtype=np.float32)
+            normals = primitive.get('normals')
+            indices = primitive.get('indices')
+            
+            if indices is not None and len(indices) > 0:
+                # Gather once so the triangles can be drawn without an index buffer
+                triangles = np.asarray(indices, dtype=np.uint32)[:len(indices) // 3 * 3].reshape(-1, 3)
+                order = triangles[(triangles < len(vertices)).all(axis=1)].reshape(-1)
+            else:
+                order = np.arange(len(vertices) // 3 * 3)
+            
+            primitive['gathered_vertices'] = np.ascontiguousarray(vertices.take(order, axis=0))
+            primitive['gathered_normals'] = None
+            if normals is not None and len(normals) == len(vertices):
+                primitive['gathered_normals'] = np.ascontiguousarray(
+                    np.asarray(normals, dtype=np.float32).take(order, axis=0))
+        
+        gathered_vertices = primitive['gathered_vertices']
+        gathered_normals = primitive['gathered_normals']
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, gathered_vertices)
+        if gathered_normals is not None:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glNormalPointer(GL_FLOAT, 0, gathered_normals)
+        
+        glDrawArrays(GL_TRIANGLES, 0, len(gathered_vertices))
+        
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
 
 
 # Global model loader instance
@@ -459,32 +682,16 @@ def render_pistol(position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0):
             render_pistol.fallback_message_count = 0
         
         render_pistol.fallback_message_count += 1
-        if render_pistol.fallback_message_count % 60 == 1:  # Print every 60 frames (1 second at 60 FPS)
+        if render_pistol.fallback_message_count % 60 == 1 and not _pistol_loader.is_alive():  # Print every 60 frames (1 second at 60 FPS)
             print("No pistol model loaded - using fallback rendering")
         
         render_fallback_pistol(position, rotation, scale)
 
-def render_fallback_pistol(position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0):
-    """Render a simple box as fallback when model loading fails"""
-    glPushMatrix()
-    
-    # Apply transformations
-    glTranslatef(position[0], position[1], position[2])
-    glRotatef(rotation[0], 1, 0, 0)
-    glRotatef(rotation[1], 0, 1, 0)
-    glRotatef(rotation[2], 0, 0, 1)
-    glScalef(scale, scale, scale)
-    
-    # Ensure we're using material properties, not color
-    glDisable(GL_COLOR_MATERIAL)
-    
-    # Set black/dark gray material properties
-    glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.1, 0.1, 0.1, 1.0])      # Very dark ambient
-    glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.2, 0.2, 0.2, 1.0])      # Dark gray
-    glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.3, 0.3, 0.3, 1.0])     # Subtle specular
-    glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 32.0)                      # Medium shininess
-    
-    # Draw a simple box (pistol shape)
+# Display list for the fallback box, compiled on first use
+_fallback_list = None
+
+def _draw_fallback_box():
+    """Emit the fallback pistol box faces"""
     glBegin(GL_QUADS)
     
     # Front face
@@ -530,16 +737,51 @@ def render_fallback_pistol(position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0):
     glVertex3f(-0.1, 0.05, -0.1)
     
     glEnd()
+
+def render_fallback_pistol(position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0):
+    """Render a simple box as fallback when model loading fails"""
+    glPushMatrix()
+    
+    # Apply transformations
+    glTranslatef(position[0], position[1], position[2])
+    glRotatef(rotation[0], 1, 0, 0)
+    glRotatef(rotation[1], 0, 1, 0)
+    glRotatef(rotation[2], 0, 0, 1)
+    glScalef(scale, scale, scale)
+    
+    # Ensure we're using material properties, not color
+    glDisable(GL_COLOR_MATERIAL)
+    
+    # Set black/dark gray material properties
+    glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, _MAT_AMBIENT)
+    glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, _MAT_DIFFUSE)
+    glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, _MAT_SPECULAR)
+    glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, _MAT_SHININESS)
+    
+    # Draw a simple box (pistol shape)
+    global _fallback_list
+    if _fallback_list is None:
+        _fallback_list = glGenLists(1)
+        glNewList(_fallback_list, GL_COMPILE)
+        _draw_fallback_box()
+        glEndList()
+    glCallList(_fallback_list)
     
     # Re-enable color material for other objects
     glEnable(GL_COLOR_MATERIAL)
     
     glPopMatrix()
 
-# Load model on import
+def _load_pistol_in_background():
+    """Load the pistol model off the main thread; GL buffers are created later on first draw"""
+    render_pistol.model = load_pistol_model()
+    if render_pistol.model:
+        print("Pistol model ready for rendering with pygltflib!")
+    else:
+        print("Pistol model failed to load with pygltflib - will use fallback rendering")
+
+# Start loading the model on import, the fallback box is drawn until it's ready
 print("Initializing pistol model with pygltflib...")
-render_pistol.model = load_pistol_model()
-if render_pistol.model:
-    print("Pistol model ready for rendering with pygltflib!")
-else:
-    print("Pistol model failed to load with pygltflib - will use fallback rendering")
\ No newline at end of file
+render_pistol.model = None
+_pistol_loader = threading.Thread(target=_load_pistol_in_background, daemon=True)
+_pistol_loader.start()
\ No newline at end of file
@@ -1,11 +1,160 @@
+import time
+import numpy as np
 from OpenGL.GL import *
 
+class _UIBatch:
+    """Preallocated 2D position + RGB colour arrays that UI shapes are appended to"""
+    
+    def __init__(self, max_vertices=512):
+        self.positions = np.empty((max_vertices, 2), dtype=np.float32)
+        self.colors = np.empty((max_vertices, 3), dtype=np.float32)
+        self.count = 0
+    
+    def _push(self, points, r, g, b):
+        """Append vertices sharing one colour"""
+        end = self.count + len(points)
+        self.positions[self.count:end] = points
+        self.colors[self.count:end] = (r, g, b)
+        self.count = end
+    
+    def push_quad(self, x, y, w, h, r, g, b):
+        """Append a filled rectangle (4 vertices for GL_QUADS)"""
+        self._push(((x, y), (x + w, y), (x + w, y + h), (x, y + h)), r, g, b)
+    
+    def push_line(self, x0, y0, x1, y1, r, g, b):
+        """Append a line segment (2 vertices for GL_LINES)"""
+        self._push(((x0, y0), (x1, y1)), r, g, b)
+    
+    def push_rect(self, x, y, w, h, r, g, b):
+        """Append a rectangle outline as 4 line segments"""
+        self._push(((x, y), (x + w, y), (x + w, y), (x + w, y + h),
+                    (x + w, y + h), (x, y + h), (x, y + h), (x, y)), r, g, b)
+    
+    def push_instances(self, template, offsets, colors):
+        """Append one copy of a template shape per (x, y) offset, colours are per copy or shared (1, 3)"""
+        n = len(offsets) * len(template)
+        end = self.count + n
+        positions = self.positions[self.count:end].reshape(len(offsets), len(template), 2)
+        np.add(offsets[:, None, :], template[None, :, :], out=positions)
+        self.colors[self.count:end].reshape(len(offsets), len(template), 3)[:] = colors[:, None, :]
+        self.count = end
+    
+    def draw(self, mode):
+        """Submit the batch with one glDrawArrays call and reset it"""
+        if self.count == 0:
+            return
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, self.positions[:self.count])
+        glColorPointer(3, GL_FLOAT, 0, self.colors[:self.count])
+        glDrawArrays(mode, 0, self.count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        self.count = 0
+
+# Filled UI shapes, and outlines grouped by line width
+_quads = _UIBatch()
+_line_batches = {}
+
+def _get_line_batch(width):
+    """Get the line batch drawn with the given line width"""
+    batch = _line_batches.get(width)
+    if batch is None:
+        batch = _line_batches[width] = _UIBatch()
+    return batch
+
+def _flush_ui_batches():
+    """Draw all queued UI quads, then the outlines on top"""
+    _quads.draw(GL_QUADS)
+    for width, batch in _line_batches.items():
+        if batch.count:
+            glLineWidth(width)
+            batch.draw(GL_LINES)
+    glLineWidth(1.0)
+
+# Line-segment endpoints for each glyph in unit size, scaled and offset when drawn
+CHAR_STROKES = {char: np.array(points, dtype=np.float32) for char, points in {
+    'A': [(0, 0), (0.5, 1), (0.5, 1), (1, 0), (0.25, 0.5), (0.75, 0.5)],
+    'M': [(0, 0), (0, 1), (0, 1), (0.5, 0.5), (0.5, 0.5), (1, 1), (1, 1), (1, 0)],
+    'O': [(0, 0), (0, 1), (0, 1), (1, 1), (1, 1), (1, 0), (1, 0), (0, 0)],  # Simplified as rectangle
+    'R': [(0, 0), (0, 1), (0, 1), (1, 1), (1, 1), (1, 0.5), (1, 0.5), (0, 0.5), (0, 0.5), (1, 0)],
+    'E': [(0, 0), (0, 1), (0, 1), (1, 1), (0, 0.5), (0.75, 0.5), (0, 0), (1, 0)],
+    'L': [(0, 0), (0, 1), (0, 0), (1, 0)],
+    'D': [(0, 0), (0, 1), (0, 1), (0.75, 1), (0.75, 1), (1, 0.75),
+          (1, 0.75), (1, 0.25), (1, 0.25), (0.75, 0), (0.75, 0), (0, 0)],  # Simplified
+    'I': [(0, 0), (1, 0), (0.5, 0), (0.5, 1), (0, 1), (1, 1)],
+    'N': [(0, 0), (0, 1), (0, 1), (1, 0), (1, 0), (1, 1)],
+    'G': [(0, 0), (0, 1), (0, 1), (1, 1), (1, 0.5), (0.5, 0.5), (0.5, 0.5), (1, 0), (1, 0), (0, 0)],  # Simplified
+}.items()}
+
+# Scratch vertex buffer for text, enough for 64 of the largest glyphs
+_text_vertices = np.empty((64 * max(len(strokes) for strokes in CHAR_STROKES.values()), 2), dtype=np.float32)
+
+# Display list for the "HP" label, compiled on first use
+_hp_label_list = None
+
+def _draw_hp_label():
+    """Draw the "HP" label strokes relative to the label origin"""
+    glBegin(GL_LINES)
+    # H
+    glVertex2f(0.0, 0.0)
+    glVertex2f(0.0, 0.03)
+    glVertex2f(0.0, 0.015)
+    glVertex2f(0.015, 0.015)
+    glVertex2f(0.015, 0.0)
+    glVertex2f(0.015, 0.03)
+    
+    # P
+    glVertex2f(0.025, 0.0)
+    glVertex2f(0.025, 0.03)
+    glVertex2f(0.025, 0.03)
+    glVertex2f(0.04, 0.03)
+    glVertex2f(0.04, 0.03)
+    glVertex2f(0.04, 0.015)
+    glVertex2f(0.04, 0.015)
+    glVertex2f(0.025, 0.015)
+    glEnd()
+
+# Health bar layout (top-left corner) and colours
+_HEALTH_BAR_X = -0.9  # Left side of screen
+_HEALTH_BAR_Y = 0.85  # Top of screen
+_HEALTH_BAR_WIDTH = 0.3
+_HEALTH_BAR_HEIGHT = 0.04
+_HEALTH_BG = (0.3, 0.1, 0.1)     # Dark red
+_HEALTH_HIGH = (0.2, 0.8, 0.2)   # Green
+_HEALTH_MID = (0.8, 0.8, 0.2)    # Yellow
+_HEALTH_LOW = (0.8, 0.2, 0.2)    # Red
+_WHITE = (1.0, 1.0, 1.0)
+
+# Ammo display layout (bottom-right corner) and colours
+_BULLET_SIZE = 0.025
+_BULLET_SPACING = 0.04
+_AMMO_MARGIN = 0.05
+_AMMO_Y = -0.95 + _AMMO_MARGIN  # Bottom with margin
+_RELOAD_BAR_HEIGHT = 0.02
+_BULLET_FLASH = (1.0, 1.0, 0.3)   # Yellow flash
+_BULLET_DIM = (0.3, 0.3, 0.1)     # Dark yellow
+_BULLET_LOADED = (0.9, 0.9, 0.2)  # Bright yellow
+_BULLET_EMPTY = (0.3, 0.3, 0.3)   # Gray
+_RELOAD_BG = (0.2, 0.2, 0.2)
+_RELOAD_FILL = (0.2, 0.8, 0.2)    # Green
+
+# Bullet shape relative to its bottom-left corner, copied once per round
+_BULLET_QUAD = np.array([(0, 0), (_BULLET_SIZE, 0), (_BULLET_SIZE, _BULLET_SIZE * 2),
+                         (0, _BULLET_SIZE * 2)], dtype=np.float32)
+_BULLET_OUTLINE = np.array([(0, 0), (_BULLET_SIZE, 0), (_BULLET_SIZE, 0), (_BULLET_SIZE, _BULLET_SIZE * 2),
+                            (_BULLET_SIZE, _BULLET_SIZE * 2), (0, _BULLET_SIZE * 2),
+                            (0, _BULLET_SIZE * 2), (0, 0)], dtype=np.float32)
+_BULLET_COLORS = np.array([_BULLET_EMPTY, _BULLET_LOADED], dtype=np.float32)
+_BULLET_FLASH_COLORS = np.array([_BULLET_DIM, _BULLET_FLASH], dtype=np.float32)
+_WHITE_ARRAY = np.array([_WHITE], dtype=np.float32)
+
 def draw_crosshair():
     """Crosshair removed - weapon now aims at cursor position"""
     pass
 
-def draw_health_bar(health_percentage):
-    """Draw health bar in top-left corner"""
+def _begin_ui():
+    """Switch to an identity 2D projection with depth testing and lighting off"""
     # Save current matrices
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
@@ -18,48 +167,61 @@ def draw_health_bar(health_percentage):
     # Disable depth testing and lighting for UI
     glDisable(GL_DEPTH_TEST)
     glDisable(GL_LIGHTING)
+
+def _end_ui():
+    """Restore the matrices and state saved by _begin_ui"""
+    # Restore settings
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_LIGHTING)
     
-    # Health bar dimensions and position
-    bar_width = 0.3
-    bar_height = 0.04
-    bar_x = -0.9  # Left side of screen
-    bar_y = 0.85  # Top of screen
+    # Restore matrices
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+
+def draw_ui(health_percentage, weapon_system):
+    """Draw the whole HUD inside a single UI state block"""
+    _begin_ui()
+    _draw_health_bar_body(health_percentage)
+    _draw_ammo_display_body(weapon_system)
+    _end_ui()
+
+def draw_health_bar(health_percentage):
+    """Draw health bar in top-left corner"""
+    _begin_ui()
+    _draw_health_bar_body(health_percentage)
+    _end_ui()
+
+def draw_ammo_display(weapon_system):
+    """Draw ammo counter and reload indicator in bottom-right corner"""
+    _begin_ui()
+    _draw_ammo_display_body(weapon_system)
+    _end_ui()
+
+def _draw_health_bar_body(health_percentage):
+    """Draw the health bar, assuming _begin_ui has set up the UI state"""
+    bar_x = _HEALTH_BAR_X
+    bar_y = _HEALTH_BAR_Y
+    bar_width = _HEALTH_BAR_WIDTH
+    bar_height = _HEALTH_BAR_HEIGHT
     
     # Draw health bar background (dark red)
-    glColor3f(0.3, 0.1, 0.1)
-    glBegin(GL_QUADS)
-    glVertex2f(bar_x, bar_y)
-    glVertex2f(bar_x + bar_width, bar_y)
-    glVertex2f(bar_x + bar_width, bar_y + bar_height)
-    glVertex2f(bar_x, bar_y + bar_height)
-    glEnd()
+    _quads.push_quad(bar_x, bar_y, bar_width, bar_height, *_HEALTH_BG)
     
     # Draw current health (green to red based on health)
     if health_percentage > 0.6:
-        glColor3f(0.2, 0.8, 0.2)  # Green
+        color = _HEALTH_HIGH
     elif health_percentage > 0.3:
-        glColor3f(0.8, 0.8, 0.2)  # Yellow
+        color = _HEALTH_MID
     else:
-        glColor3f(0.8, 0.2, 0.2)  # Red
-    
-    current_width = bar_width * health_percentage
-    glBegin(GL_QUADS)
-    glVertex2f(bar_x, bar_y)
-    glVertex2f(bar_x + current_width, bar_y)
-    glVertex2f(bar_x + current_width, bar_y + bar_height)
-    glVertex2f(bar_x, bar_y + bar_height)
-    glEnd()
+        color = _HEALTH_LOW
+    _quads.push_quad(bar_x, bar_y, bar_width * health_percentage, bar_height, *color)
     
     # Draw health bar border (white)
-    glColor3f(1.0, 1.0, 1.0)
-    glLineWidth(2.0)
-    glBegin(GL_LINE_LOOP)
-    glVertex2f(bar_x, bar_y)
-    glVertex2f(bar_x + bar_width, bar_y)
-    glVertex2f(bar_x + bar_width, bar_y + bar_height)
-    glVertex2f(bar_x, bar_y + bar_height)
-    glEnd()
-    glLineWidth(1.0)
+    _get_line_batch(2.0).push_rect(bar_x, bar_y, bar_width, bar_height, *_WHITE)
+    
+    _flush_ui_batches()
     
     # Draw "HEALTH" text (simplified using lines)
     glColor3f(1.0, 1.0, 1.0)
@@ -67,101 +229,52 @@ def draw_health_bar(health_percentage):
     glLineWidth(1.5)
     
     # Simple "HP" text using basic lines
-    glBegin(GL_LINES)
-    # H
-    glVertex2f(bar_x, text_y)
-    glVertex2f(bar_x, text_y + 0.03)
-    glVertex2f(bar_x, text_y + 0.015)
-    glVertex2f(bar_x + 0.015, text_y + 0.015)
-    glVertex2f(bar_x + 0.015, text_y)
-    glVertex2f(bar_x + 0.015, text_y + 0.03)
-    
-    # P
-    glVertex2f(bar_x + 0.025, text_y)
-    glVertex2f(bar_x + 0.025, text_y + 0.03)
-    glVertex2f(bar_x + 0.025, text_y + 0.03)
-    glVertex2f(bar_x + 0.04, text_y + 0.03)
-    glVertex2f(bar_x + 0.04, text_y + 0.03)
-    glVertex2f(bar_x + 0.04, text_y + 0.015)
-    glVertex2f(bar_x + 0.04, text_y + 0.015)
-    glVertex2f(bar_x + 0.025, text_y + 0.015)
-    glEnd()
+    global _hp_label_list
+    if _hp_label_list is None:
+        _hp_label_list = glGenLists(1)
+        glNewList(_hp_label_list, GL_COMPILE)
+        _draw_hp_label()
+        glEndList()
+    glPushMatrix()
+    glTranslatef(bar_x, text_y, 0)
+    glCallList(_hp_label_list)
+    glPopMatrix()
     
     glLineWidth(1.0)
-    
-    # Restore settings
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
-    
-    # Restore matrices
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
 
-def draw_ammo_display(weapon_system):
-    """Draw ammo counter and reload indicator in bottom-right corner"""
-    # Save current matrices
-    glMatrixMode(GL_PROJECTION)
-    glPushMatrix()
-    glLoadIdentity()
-    
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
-    
-    # Disable depth testing and lighting for UI
-    glDisable(GL_DEPTH_TEST)
-    glDisable(GL_LIGHTING)
-    
+def _draw_ammo_display_body(weapon_system):
+    """Draw the ammo counter, assuming _begin_ui has set up the UI state"""
     current_ammo, max_ammo = weapon_system.get_ammo_info()
     
     # Ammo display position (bottom-right corner)
-    bullet_size = 0.025
-    bullet_spacing = 0.04
+    bullet_size = _BULLET_SIZE
+    bullet_spacing = _BULLET_SPACING
     total_width = max_ammo * bullet_spacing - (bullet_spacing - bullet_size)
     
     # Position in bottom-right corner with some margin
-    margin = 0.05
-    ammo_x = 1.0 - total_width - margin  # Right side with margin
-    ammo_y = -0.95 + margin  # Bottom with margin
+    ammo_x = 1.0 - total_width - _AMMO_MARGIN  # Right side with margin
+    ammo_y = _AMMO_Y
     
     start_x = ammo_x
+    borders = _get_line_batch(1.0)
     
-    for i in range(max_ammo):
-        bullet_x = start_x + i * bullet_spacing
-        
-        # Choose color based on ammo status
-        if weapon_system.is_reloading:
-            # Flashing yellow during reload
-            import time
-            flash = int(time.time() * 8) % 2  # Flash 4 times per second
-            if flash:
-                glColor3f(1.0, 1.0, 0.3)  # Yellow flash
-            else:
-                glColor3f(0.3, 0.3, 0.1)  # Dark yellow
-        elif i < current_ammo:
-            glColor3f(0.9, 0.9, 0.2)  # Bright yellow (loaded)
-        else:
-            glColor3f(0.3, 0.3, 0.3)  # Gray (empty)
-        
-        # Draw bullet as small rectangle
-        glBegin(GL_QUADS)
-        glVertex2f(bullet_x, ammo_y)
-        glVertex2f(bullet_x + bullet_size, ammo_y)
-        glVertex2f(bullet_x + bullet_size, ammo_y + bullet_size * 2)
-        glVertex2f(bullet_x, ammo_y + bullet_size * 2)
-        glEnd()
-        
-        # Draw bullet border
-        glColor3f(1.0, 1.0, 1.0)
-        glLineWidth(1.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(bullet_x, ammo_y)
-        glVertex2f(bullet_x + bullet_size, ammo_y)
-        glVertex2f(bullet_x + bullet_size, ammo_y + bullet_size * 2)
-        glVertex2f(bullet_x, ammo_y + bullet_size * 2)
-        glEnd()
+    # Bottom-left corner of every bullet
+    slots = np.arange(max_ammo)
+    offsets = np.empty((max_ammo, 2), dtype=np.float32)
+    offsets[:, 0] = start_x + slots * bullet_spacing
+    offsets[:, 1] = ammo_y
+    
+    # Choose colors based on ammo status
+    if weapon_system.is_reloading:
+        # Flashing yellow during reload
+        flash = int(time.time() * 8) % 2  # Flash 4 times per second
+        colors = _BULLET_FLASH_COLORS[flash:flash + 1]
+    else:
+        colors = _BULLET_COLORS[(slots < current_ammo).astype(np.intp)]
+    
+    # Draw bullets as small rectangles with a border
+    _quads.push_instances(_BULLET_QUAD, offsets, colors)
+    borders.push_instances(_BULLET_OUTLINE, offsets, _WHITE_ARRAY)
     
     # Draw reload progress bar if reloading
     if weapon_system.is_reloading:
@@ -170,37 +283,16 @@ def draw_ammo_display(weapon_system):
         # Reload bar position (above bullets)
         reload_bar_y = ammo_y + bullet_size * 2 + 0.02
         reload_bar_width = total_width
-        reload_bar_height = 0.02
-        
-        # Draw reload bar background
-        glColor3f(0.2, 0.2, 0.2)
-        glBegin(GL_QUADS)
-        glVertex2f(start_x, reload_bar_y)
-        glVertex2f(start_x + reload_bar_width, reload_bar_y)
-        glVertex2f(start_x + reload_bar_width, reload_bar_y + reload_bar_height)
-        glVertex2f(start_x, reload_bar_y + reload_bar_height)
-        glEnd()
-        
-        # Draw reload progress
-        glColor3f(0.2, 0.8, 0.2)  # Green progress
-        progress_width = reload_bar_width * progress
-        glBegin(GL_QUADS)
-        glVertex2f(start_x, reload_bar_y)
-        glVertex2f(start_x + progress_width, reload_bar_y)
-        glVertex2f(start_x + progress_width, reload_bar_y + reload_bar_height)
-        glVertex2f(start_x, reload_bar_y + reload_bar_height)
-        glEnd()
-        
-        # Draw reload bar border
-        glColor3f(1.0, 1.0, 1.0)
-        glLineWidth(1.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(start_x, reload_bar_y)
-        glVertex2f(start_x + reload_bar_width, reload_bar_y)
-        glVertex2f(start_x + reload_bar_width, reload_bar_y + reload_bar_height)
-        glVertex2f(start_x, reload_bar_y + reload_bar_height)
-        glEnd()
+        reload_bar_height = _RELOAD_BAR_HEIGHT
         
+        # Draw reload bar background, progress (green) and border
+        _quads.push_quad(start_x, reload_bar_y, reload_bar_width, reload_bar_height, *_RELOAD_BG)
+        _quads.push_quad(start_x, reload_bar_y, reload_bar_width * progress, reload_bar_height, *_RELOAD_FILL)
+        borders.push_rect(start_x, reload_bar_y, reload_bar_width, reload_bar_height, *_WHITE)
+    
+    _flush_ui_batches()
+    
+    if weapon_system.is_reloading:
         # Draw "RELOADING..." text (above reload bar)
         glColor3f(1.0, 1.0, 0.3)
         text_y = reload_bar_y + reload_bar_height + 0.02
@@ -214,16 +306,6 @@ def draw_ammo_display(weapon_system):
         text_y = ammo_y + bullet_size * 2 + 0.02  # Above bullets
     
     _draw_simple_text("AMMO", start_x + total_width/2 - 0.04, text_y)
-    
-    # Restore settings
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
-    
-    # Restore matrices
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
 
 def _draw_simple_text(text, x, y):
     """Draw simple text using basic line segments"""
@@ -231,116 +313,24 @@ def _draw_simple_text(text, x, y):
     char_width = 0.015
     char_spacing = 0.02
     
+    # Place every glyph's strokes into one vertex array
+    count = 0
     for i, char in enumerate(text):
-        char_x = x + i * char_spacing
-        _draw_char(char, char_x, y, char_width)
+        strokes = CHAR_STROKES.get(char)
+        if strokes is None:
+            continue
+        end = count + len(strokes)
+        np.multiply(strokes, char_width, out=_text_vertices[count:end])
+        _text_vertices[count:end] += (x + i * char_spacing, y)
+        count = end
     
-    glLineWidth(1.0)
-
-def _draw_char(char, x, y, size):
-    """Draw a simple character using line segments"""
-    glBegin(GL_LINES)
+    if count:
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, _text_vertices[:count])
+        glDrawArrays(GL_LINES, 0, count)
+        glDisableClientState(GL_VERTEX_ARRAY)
     
-    if char == 'A':
-        # A
-        glVertex2f(x, y)
-        glVertex2f(x + size/2, y + size)
-        glVertex2f(x + size/2, y + size)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size/4, y + size/2)
-        glVertex2f(x + 3*size/4, y + size/2)
-    elif char == 'M':
-        # M
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size/2, y + size/2)
-        glVertex2f(x + size/2, y + size/2)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y)
-    elif char == 'O':
-        # O (simplified as rectangle)
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size, y)
-        glVertex2f(x, y)
-    elif char == 'R':
-        # R
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y + size/2)
-        glVertex2f(x + size, y + size/2)
-        glVertex2f(x, y + size/2)
-        glVertex2f(x, y + size/2)
-        glVertex2f(x + size, y)
-    elif char == 'E':
-        # E
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x, y + size/2)
-        glVertex2f(x + 3*size/4, y + size/2)
-        glVertex2f(x, y)
-        glVertex2f(x + size, y)
-    elif char == 'L':
-        # L
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y)
-        glVertex2f(x + size, y)
-    elif char == 'D':
-        # D (simplified)
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + 3*size/4, y + size)
-        glVertex2f(x + 3*size/4, y + size)
-        glVertex2f(x + size, y + 3*size/4)
-        glVertex2f(x + size, y + 3*size/4)
-        glVertex2f(x + size, y + size/4)
-        glVertex2f(x + size, y + size/4)
-        glVertex2f(x + 3*size/4, y)
-        glVertex2f(x + 3*size/4, y)
-        glVertex2f(x, y)
-    elif char == 'I':
-        # I
-        glVertex2f(x, y)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size/2, y)
-        glVertex2f(x + size/2, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y + size)
-    elif char == 'N':
-        # N
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size, y + size)
-    elif char == 'G':
-        # G (simplified)
-        glVertex2f(x, y)
-        glVertex2f(x, y + size)
-        glVertex2f(x, y + size)
-        glVertex2f(x + size, y + size)
-        glVertex2f(x + size, y + size/2)
-        glVertex2f(x + size/2, y + size/2)
-        glVertex2f(x + size/2, y + size/2)
-        glVertex2f(x + size, y)
-        glVertex2f(x + size, y)
-        glVertex2f(x, y)
-    
-    glEnd()
+    glLineWidth(1.0)
 
 def draw_cursor_indicator():
     """Draw a small indicator showing cursor position - optional function"""
@@ -1,8 +1,25 @@
 import time
 import math
 import random
+import ctypes
 import numpy as np
 from OpenGL.GL import *
+from src.systems.smoke_pool import SmokePool
+
+# Smoke colour (gray with slight yellow tint) and overall transparency
+_SMOKE_RGB = (0.7, 0.7, 0.6)
+_SMOKE_OPACITY = 0.6
+_SMOKE_STRIDE = 7 * 4  # x, y, z, r, g, b, a as float32
+
+# Muzzle flash spikes: one triangle per spike from the inner ring out to the tip
+_SPIKE_COUNT = 5  # Even fewer spikes
+_SPIKE_INNER_RADIUS = 0.08  # Smaller inner radius
+_SPIKE_ANGLES = np.linspace(0, 2 * np.pi, _SPIKE_COUNT + 1)
+_SPIKE_DIRS = np.stack([np.cos(_SPIKE_ANGLES), np.sin(_SPIKE_ANGLES)], axis=1).astype(np.float32)
+_SPIKE_TIP_DIRS = _SPIKE_DIRS[:-1]  # Unit direction of each tip, scaled by the spike length per frame
+
+# Random shake factors drawn per shot, more than a shake lasts in frames
+_SHAKE_JITTER_SAMPLES = 32
 
 class ShootingEffects:
     """Handles visual effects for shooting: muzzle flash, smoke, and screen shake"""
@@ -13,20 +30,37 @@ class ShootingEffects:
         self.muzzle_flash_start_time = 0
         self.muzzle_flash_duration = 0.08  # 80ms flash duration
         self.muzzle_flash_intensity = 1.0
-        self.muzzle_flash_position = np.array([0.0, 0.0, 0.0])
-        self.muzzle_flash_direction = np.array([0.0, 0.0, -1.0])
+        self.muzzle_flash_position = np.zeros(3, dtype=np.float32)
+        self.muzzle_flash_direction = np.array([0.0, 0.0, -1.0], dtype=np.float32)
         
         # Smoke effect settings
-        self.smoke_particles = []
         self.max_smoke_particles = 15
+        self.smoke_particles = SmokePool(self.max_smoke_particles)
         self.smoke_lifetime = 2.0  # 2 seconds
+        self._smoke_vbo = None  # Created on first draw, there is no GL context yet
+        self._flash_core_list = None  # Unit-scale flash core, compiled on first draw
+        self._last_update = time.perf_counter()
+        
+        # Spike triangles (inner, tip, next inner), only the tips move with intensity
+        self._spike_vertices = np.empty((_SPIKE_COUNT, 3, 3), dtype=np.float32)
+        self._spike_vertices[:, 0, :2] = _SPIKE_DIRS[:-1] * _SPIKE_INNER_RADIUS
+        self._spike_vertices[:, 0, 2] = 0.08
+        self._spike_vertices[:, 1, 2] = 0.04
+        self._spike_vertices[:, 2, :2] = _SPIKE_DIRS[1:] * _SPIKE_INNER_RADIUS
+        self._spike_vertices[:, 2, 2] = 0.08
         
         # Screen shake settings
         self.screen_shake_active = False
         self.screen_shake_start_time = 0
         self.screen_shake_duration = 0.25  # Longer duration for recoil
         self.screen_shake_intensity = 1.2  # Stronger intensity
-        self.shake_offset = np.array([0.0, 0.0, 0.0])
+        self.shake_x = 0.0
+        self.shake_y = 0.0
+        self.shake_z = 0.0
+        self._shake_progress = 0.0
+        self._shake_jitter = [(0.0, 0.0)]  # Per-frame (horizontal, roll) random factors in [-1, 1]
+        self._shake_frame = 0
+        self._shake_roll = 0.0
         self.recoil_recovery_factor = 0.3  # How much the gun settles back down
         
         # Flash colors for different intensities
@@ -35,10 +69,18 @@ class ShootingEffects:
             'medium': [1.0, 0.6, 0.2],    # Orange-yellow
             'dim': [0.8, 0.3, 0.1]        # Orange-red
         }
+        # Same colours packed for glColor4fv, the alpha slot is filled in per frame
+        self._flash_colors_v = {name: (GLfloat * 4)(*rgb, 0.0) for name, rgb in self.flash_colors.items()}
+        
+        self.verbose = False  # Log every shot to stdout, too slow for rapid fire
     
     def trigger_shooting_effects(self, weapon_tip_position, weapon_direction):
         """Trigger all shooting effects: muzzle flash, smoke, and screen shake"""
-        current_time = time.time()
+        current_time = time.perf_counter()
+        
+        # If effects were idle, update() stopped advancing _last_update, measure the next dt from now
+        if not (self.muzzle_flash_active or self.screen_shake_active or self.smoke_particles):
+            self._last_update = current_time
         
         # Start muzzle flash
         self.muzzle_flash_active = True
@@ -48,19 +90,29 @@ class ShootingEffects:
         # Start screen shake
         self.screen_shake_active = True
         self.screen_shake_start_time = current_time
+        self._shake_jitter = np.random.uniform(-1.0, 1.0, (_SHAKE_JITTER_SAMPLES, 2)).tolist()
+        self._shake_frame = 0
         
         # Store weapon tip position and direction for rendering
-        self.muzzle_flash_position = np.array(weapon_tip_position).copy()
-        self.muzzle_flash_direction = np.array(weapon_direction).copy()
+        self.muzzle_flash_position[:] = weapon_tip_position
+        self.muzzle_flash_direction[:] = weapon_direction
         
         # Create smoke particles at weapon tip
-        self._create_smoke_burst(weapon_tip_position, weapon_direction)
+        self._create_smoke_burst(weapon_tip_position, weapon_direction, current_time)
         
-        print("Shooting effects triggered: muzzle flash, smoke, and screen shake!")
+        if __debug__ and self.verbose:
+            print("Shooting effects triggered: muzzle flash, smoke, and screen shake!")
     
     def update(self):
         """Update all visual effects (call every frame)"""
-        current_time = time.time()
+        # Nothing to animate between shots
+        if not (self.muzzle_flash_active or self.screen_shake_active or self.smoke_particles):
+            return
+        
+        current_time = time.perf_counter()
+        # Real frame time, clamped so a stall doesn't fling the smoke
+        dt = min(max(current_time - self._last_update, 0.0), 0.1)
+        self._last_update = current_time
         
         # Update muzzle flash
         if self.muzzle_flash_active:
@@ -78,10 +130,13 @@ class ShootingEffects:
             elapsed = current_time - self.screen_shake_start_time
             if elapsed >= self.screen_shake_duration:
                 self.screen_shake_active = False
-                self.shake_offset = np.array([0.0, 0.0, 0.0])
+                self.shake_x = self.shake_y = self.shake_z = 0.0
             else:
                 # Calculate recoil pattern (upward kick followed by recovery)
                 progress = elapsed / self.screen_shake_duration
+                self._shake_progress = progress
+                jitter, self._shake_roll = self._shake_jitter[self._shake_frame % len(self._shake_jitter)]
+                self._shake_frame += 1
                 
                 # Recoil phases
                 if progress < 0.2:  # Initial upward kick (first 20%)
@@ -89,11 +144,9 @@ class ShootingEffects:
                     intensity = self.screen_shake_intensity * (1.0 - kick_progress * 0.3)  # Strong start, slight decrease
                     
                     # Strong upward recoil with slight backward movement
-                    self.shake_offset = np.array([
-                        random.uniform(-0.3, 0.3) * intensity * 0.01,     # Slight horizontal variation
-                        intensity * 0.025 * (1.0 + kick_progress * 0.5),  # Strong upward kick
-                        intensity * 0.015 * kick_progress                   # Slight backward movement
-                    ])
+                    self.shake_x = jitter * 0.3 * intensity * 0.01                  # Slight horizontal variation
+                    self.shake_y = intensity * 0.025 * (1.0 + kick_progress * 0.5)  # Strong upward kick
+                    self.shake_z = intensity * 0.015 * kick_progress                 # Slight backward movement
                     
                 elif progress < 0.6:  # Recovery phase (20% to 60%)
                     recovery_progress = (progress - 0.2) / 0.4
@@ -102,41 +155,37 @@ class ShootingEffects:
                     # Camera settling back down with oscillation
                     oscillation = math.sin(recovery_progress * math.pi * 4) * (1.0 - recovery_progress)
                     
-                    self.shake_offset = np.array([
-                        random.uniform(-0.2, 0.2) * intensity * 0.008,     # Reduced horizontal shake
-                        intensity * 0.015 * oscillation,                   # Oscillating vertical movement
-                        intensity * 0.01 * (1.0 - recovery_progress)       # Return from backward movement
-                    ])
+                    self.shake_x = jitter * 0.2 * intensity * 0.008                 # Reduced horizontal shake
+                    self.shake_y = intensity * 0.015 * oscillation                  # Oscillating vertical movement
+                    self.shake_z = intensity * 0.01 * (1.0 - recovery_progress)     # Return from backward movement
                     
                 else:  # Final settle (60% to 100%)
                     settle_progress = (progress - 0.6) / 0.4
                     intensity = self.screen_shake_intensity * 0.3 * (1.0 - settle_progress)  # Final fade
                     
                     # Very subtle final movements
-                    self.shake_offset = np.array([
-                        random.uniform(-0.1, 0.1) * intensity * 0.005,     # Minimal horizontal
-                        intensity * 0.008 * (1.0 - settle_progress),       # Settling down
-                        0.0                                                 # No backward movement
-                    ])
+                    self.shake_x = jitter * 0.1 * intensity * 0.005                 # Minimal horizontal
+                    self.shake_y = intensity * 0.008 * (1.0 - settle_progress)      # Settling down
+                    self.shake_z = 0.0                                              # No backward movement
         
         # Update smoke particles
-        self._update_smoke_particles()
+        if self.smoke_particles:
+            self._update_smoke_particles(current_time, dt)
     
     def apply_screen_shake(self):
         """Apply screen shake transformation (call before rendering scene)"""
         if self.screen_shake_active:
             # Apply translation shake
-            glTranslatef(self.shake_offset[0], self.shake_offset[1], self.shake_offset[2])
+            glTranslatef(self.shake_x, self.shake_y, self.shake_z)
             
             # Add subtle rotational recoil for more realism
-            elapsed = time.time() - self.screen_shake_start_time
-            progress = elapsed / self.screen_shake_duration
+            progress = self._shake_progress
             
             if progress < 0.3:  # Initial recoil rotation
                 kick_intensity = (1.0 - progress / 0.3) * 0.8
                 # Slight upward rotation (pitch) and random roll
                 pitch_rotation = kick_intensity * 1.2  # Degrees
-                roll_rotation = kick_intensity * random.uniform(-0.8, 0.8)
+                roll_rotation = kick_intensity * self._shake_roll * 0.8
                 
                 glRotatef(pitch_rotation, 1, 0, 0)  # Pitch up
                 glRotatef(roll_rotation, 0, 0, 1)   # Roll left/right
@@ -173,14 +222,14 @@ class ShootingEffects:
         
         # Choose flash color based on intensity
         if self.muzzle_flash_intensity > 0.7:
-            color = self.flash_colors['bright']
+            color = self._flash_colors_v['bright']
         elif self.muzzle_flash_intensity > 0.3:
-            color = self.flash_colors['medium']
+            color = self._flash_colors_v['medium']
         else:
-            color = self.flash_colors['dim']
+            color = self._flash_colors_v['dim']
         
-        alpha = self.muzzle_flash_intensity * 0.8
-        glColor4f(color[0], color[1], color[2], alpha)
+        color[3] = self.muzzle_flash_intensity * 0.8  # Alpha
+        glColor4fv(color)
         
         # Render flash as multiple overlapping shapes for realistic look
         self._render_flash_core()
@@ -197,151 +246,98 @@ class ShootingEffects:
         if not self.smoke_particles:
             return
         
-        glPushMatrix()
+        smoke = self.smoke_particles
+        vertex_count = smoke.fill_quads(_SMOKE_RGB, _SMOKE_OPACITY)
+        
+        if self._smoke_vbo is None:
+            self._smoke_vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self._smoke_vbo)
+            glBufferData(GL_ARRAY_BUFFER, smoke.quads.nbytes, None, GL_DYNAMIC_DRAW)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self._smoke_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_count * _SMOKE_STRIDE, smoke.quads[:smoke.count])
+        
         glDisable(GL_LIGHTING)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glDepthMask(GL_FALSE)
         
-        for particle in self.smoke_particles:
-            self._render_smoke_particle(particle)
+        # All particles in one draw call
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _SMOKE_STRIDE, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, _SMOKE_STRIDE, ctypes.c_void_p(12))
+        glDrawArrays(GL_QUADS, 0, vertex_count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
         
         glDepthMask(GL_TRUE)
         glDisable(GL_BLEND)
         glEnable(GL_LIGHTING)
-        glPopMatrix()
     
-    def _create_smoke_burst(self, position, direction):
-        """Create a burst of smoke particles"""
-        current_time = time.time()
-        
-        # Create 4-6 smoke particles (much smaller burst)
+    def _create_smoke_burst(self, position, direction, current_time):
+        """Create a burst of smoke particles born at current_time (perf_counter clock)"""
+        # Create 4-6 smoke particles (much smaller burst), dropping the oldest if full
         num_particles = random.randint(4, 6)
-        
-        for i in range(num_particles):
-            # Random velocity with forward bias
-            base_velocity = np.array(direction) * random.uniform(0.5, 1.2)  # Much slower
-            
-            # Add random spread
-            spread = np.array([
-                random.uniform(-0.3, 0.3),  # Much tighter spread
-                random.uniform(-0.2, 0.5),  # Slight upward bias
-                random.uniform(-0.3, 0.3)
-            ]) * 0.4  # Much smaller spread multiplier
-            
-            velocity = base_velocity + spread
-            
-            particle = {
-                'position': np.array(position) + np.random.uniform(-0.01, 0.01, 3),  # Very tight spawn area
-                'velocity': velocity,
-                'size': random.uniform(0.02, 0.08),  # Much smaller initial size
-                'max_size': random.uniform(0.2, 0.4),  # Much smaller maximum size
-                'life': 0.0,
-                'max_life': random.uniform(1.0, 1.5),  # Shorter life
-                'birth_time': current_time,
-                'rotation': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-60, 60)  # Slower rotation
-            }
-            
-            self.smoke_particles.append(particle)
-        
-        # Remove old particles if we have too many
-        if len(self.smoke_particles) > self.max_smoke_particles:
-            # Remove oldest particles
-            self.smoke_particles = self.smoke_particles[-self.max_smoke_particles:]
+        smoke = self.smoke_particles
+        new = smoke.spawn(num_particles)
+        k = new.stop - new.start
+        
+        # Random velocity with forward bias plus random spread (slight upward bias)
+        base_velocity = np.asarray(direction, dtype=np.float32) * np.random.uniform(0.5, 1.2, (k, 1))
+        spread = np.random.uniform((-0.3, -0.2, -0.3), (0.3, 0.5, 0.3), (k, 3)) * 0.4
+        smoke.velocity[new] = base_velocity + spread
+        
+        smoke.position[new] = np.asarray(position, dtype=np.float32) + np.random.uniform(-0.01, 0.01, (k, 3))  # Very tight spawn area
+        smoke.size[new] = np.random.uniform(0.02, 0.08, k)  # Much smaller initial size
+        smoke.max_size[new] = np.random.uniform(0.2, 0.4, k)  # Much smaller maximum size
+        smoke.life[new] = 0.0
+        smoke.max_life[new] = np.random.uniform(1.0, 1.5, k)  # Shorter life
+        smoke.birth_time[new] = current_time
+        smoke.rotation[new] = np.random.uniform(0, 360, k)
+        smoke.rotation_speed[new] = np.random.uniform(-60, 60, k)  # Slower rotation
     
-    def _update_smoke_particles(self):
-        """Update all smoke particles"""
-        current_time = time.time()
-        dt = 1.0 / 60.0  # Assume 60 FPS
-        
-        particles_to_remove = []
-        
-        for i, particle in enumerate(self.smoke_particles):
-            # Update lifetime
-            particle['life'] = current_time - particle['birth_time']
-            
-            # Remove expired particles
-            if particle['life'] >= particle['max_life']:
-                particles_to_remove.append(i)
-                continue
-            
-            # Update position
-            particle['position'] += particle['velocity'] * dt
-            
-            # Apply gravity and air resistance
-            particle['velocity'][1] += 2.0 * dt  # Gravity (upward positive)
-            particle['velocity'] *= 0.98  # Air resistance
-            
-            # Update size (grows over time)
-            life_progress = particle['life'] / particle['max_life']
-            particle['size'] = particle['max_size'] * (0.1 + 0.9 * life_progress)
-            
-            # Update rotation
-            particle['rotation'] += particle['rotation_speed'] * dt
-        
-        # Remove expired particles (in reverse order to avoid index issues)
-        for i in reversed(particles_to_remove):
-            del self.smoke_particles[i]
-    
-    def _render_smoke_particle(self, particle):
-        """Render a single smoke particle"""
-        life_progress = particle['life'] / particle['max_life']
-        
-        # Calculate alpha (fades out over time)
-        if life_progress < 0.1:
-            alpha = life_progress / 0.1  # Fade in
-        elif life_progress > 0.7:
-            alpha = (1.0 - life_progress) / 0.3  # Fade out
-        else:
-            alpha = 1.0  # Full opacity
-        
-        alpha *= 0.6  # Overall transparency
-        
-        # Smoke color (gray with slight yellow tint)
-        glColor4f(0.7, 0.7, 0.6, alpha)
-        
-        glPushMatrix()
-        glTranslatef(particle['position'][0], particle['position'][1], particle['position'][2])
-        glRotatef(particle['rotation'], 0, 0, 1)
-        
-        # Render as textured quad
-        size = particle['size']
-        glBegin(GL_QUADS)
-        glVertex3f(-size, -size, 0)
-        glVertex3f(size, -size, 0)
-        glVertex3f(size, size, 0)
-        glVertex3f(-size, size, 0)
-        glEnd()
-        
-        glPopMatrix()
+    def _update_smoke_particles(self, current_time, dt):
+        """Update all smoke particles to current_time (perf_counter clock), dt seconds after the last update"""
+        self.smoke_particles.update(current_time, dt)
     
     def _align_with_direction(self, direction):
         """Align current transformation with given direction"""
         # Normalize direction
-        direction = np.array(direction)
-        if np.linalg.norm(direction) > 0:
-            direction = direction / np.linalg.norm(direction)
-        
-        # Default direction is along negative Z
-        default_dir = np.array([0, 0, -1])
-        
-        # Calculate rotation
-        axis = np.cross(default_dir, direction)
-        if np.linalg.norm(axis) > 0.001:
-            axis = axis / np.linalg.norm(axis)
-            angle = math.acos(max(-1, min(1, np.dot(default_dir, direction))))
-            glRotatef(math.degrees(angle), axis[0], axis[1], axis[2])
-        elif np.dot(default_dir, direction) < 0:
+        dx, dy, dz = float(direction[0]), float(direction[1]), float(direction[2])
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if length > 0:
+            dx /= length
+            dy /= length
+            dz /= length
+        
+        # Default direction is along negative Z, so the rotation axis
+        # cross((0, 0, -1), d) is (dy, -dx, 0) and the cosine dot(...) is -dz
+        axis_length = math.sqrt(dx * dx + dy * dy)
+        if axis_length > 0.001:
+            angle = math.acos(max(-1.0, min(1.0, -dz)))
+            glRotatef(math.degrees(angle), dy / axis_length, -dx / axis_length, 0.0)
+        elif -dz < 0:
             glRotatef(180, 1, 0, 0)
     
     def _render_flash_core(self):
         """Render the core muzzle flash (bright center)"""
         # Main flash body - even smaller scale
         scale = 0.1 + self.muzzle_flash_intensity * 0.15  # Reduced further
+        if self._flash_core_list is None:
+            self._flash_core_list = glGenLists(1)
+            glNewList(self._flash_core_list, GL_COMPILE)
+            self._draw_flash_core_immediate()
+            glEndList()
+        
         glPushMatrix()
         glScalef(scale, scale, scale * 1.0)  # Less depth extension
-        
+        glCallList(self._flash_core_list)
+        glPopMatrix()
+    
+    def _draw_flash_core_immediate(self):
+        """Emit the flash core quads at unit scale"""
         glBegin(GL_QUADS)
         # Front face
         glVertex3f(-1, -1, 0.2)  # Reduced depth
@@ -355,36 +351,16 @@ class ShootingEffects:
         glVertex3f(0.4, 0.4, -0.3)
         glVertex3f(-0.4, 0.4, -0.3)
         glEnd()
-        
-        glPopMatrix()
     
     def _render_flash_spikes(self):
         """Render spiky edges of muzzle flash for realistic look"""
-        spike_count = 5  # Even fewer spikes
         spike_length = 0.2 + self.muzzle_flash_intensity * 0.15  # Smaller spikes
+        np.multiply(_SPIKE_TIP_DIRS, spike_length, out=self._spike_vertices[:, 1, :2])
         
-        glBegin(GL_TRIANGLES)
-        for i in range(spike_count):
-            angle = (2 * math.pi * i) / spike_count
-            
-            # Inner point
-            inner_x = 0.08 * math.cos(angle)  # Smaller inner radius
-            inner_y = 0.08 * math.sin(angle)
-            
-            # Outer point
-            outer_x = spike_length * math.cos(angle)
-            outer_y = spike_length * math.sin(angle)
-            
-            # Next inner point
-            next_angle = (2 * math.pi * (i + 1)) / spike_count
-            next_inner_x = 0.08 * math.cos(next_angle)
-            next_inner_y = 0.08 * math.sin(next_angle)
-            
-            # Triangle spike
-            glVertex3f(inner_x, inner_y, 0.08)
-            glVertex3f(outer_x, outer_y, 0.04)
-            glVertex3f(next_inner_x, next_inner_y, 0.08)
-        glEnd()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, self._spike_vertices)
+        glDrawArrays(GL_TRIANGLES, 0, _SPIKE_COUNT * 3)
+        glDisableClientState(GL_VERTEX_ARRAY)
     
     def is_any_effect_active(self):
         """Check if any visual effect is currently active"""
@@ -398,5 +374,5 @@ class ShootingEffects:
             'muzzle_flash': self.muzzle_flash_active,
             'screen_shake': self.screen_shake_active,
             'smoke_particles': len(self.smoke_particles),
-            'shake_intensity': np.linalg.norm(self.shake_offset) if self.screen_shake_active else 0.0
+            'shake_intensity': math.sqrt(self.shake_x * self.shake_x + self.shake_y * self.shake_y + self.shake_z * self.shake_z) if self.screen_shake_active else 0.0
         }
\ No newline at end of file
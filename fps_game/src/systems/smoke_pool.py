@@ -0,0 +1,109 @@
+import numpy as np
+
+# Quad corners around each particle centre, in GL_QUADS order
+_CORNERS_X = np.array([-1.0, 1.0, 1.0, -1.0], dtype=np.float32)
+_CORNERS_Y = np.array([-1.0, -1.0, 1.0, 1.0], dtype=np.float32)
+
+class SmokePool:
+    """Structure-of-arrays store for smoke particles, live ones packed in [0, count) in no particular order"""
+
+    def __init__(self, capacity=15):
+        self.capacity = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 3), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 3), dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.max_size = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.birth_time = np.zeros(capacity, dtype=np.float64)  # Timestamps need double precision
+        self.rotation = np.zeros(capacity, dtype=np.float32)
+        self.rotation_speed = np.zeros(capacity, dtype=np.float32)
+        # Interleaved x, y, z, r, g, b, a for 4 corners per particle, ready for upload
+        self.quads = np.zeros((capacity, 4, 7), dtype=np.float32)
+        self._quad_rgb = None  # Colour currently written into every quad
+
+    def __len__(self):
+        return self.count
+
+    def _fields(self):
+        return (self.position, self.velocity, self.size, self.max_size, self.life,
+                self.max_life, self.birth_time, self.rotation, self.rotation_speed)
+
+    def _swap_remove(self, indices):
+        """Remove the given slots by moving the last live particle into each one"""
+        # Highest first, so the last live slot is never one still waiting to be removed
+        for j in sorted(indices, reverse=True):
+            last = self.count - 1
+            if j != last:
+                for field in self._fields():
+                    field[j] = field[last]
+            self.count = last
+
+    def spawn(self, k):
+        """Reserve k new slots at the end, dropping the oldest particles if full"""
+        k = min(k, self.capacity)
+        overflow = self.count + k - self.capacity
+        if overflow > 0:
+            oldest = np.argpartition(self.birth_time[:self.count], overflow - 1)[:overflow]
+            self._swap_remove(oldest.tolist())
+        start = self.count
+        self.count += k
+        return slice(start, self.count)
+
+    def update(self, current_time, dt):
+        """Age, move, grow and spin every particle, dropping expired ones"""
+        n = self.count
+        if n == 0:
+            return
+
+        # Swap-remove expired particles, only the dead slots are touched
+        life = current_time - self.birth_time[:n]
+        expired = np.flatnonzero(life >= self.max_life[:n])
+        if expired.size:
+            self._swap_remove(expired.tolist())
+            n = self.count
+            if n == 0:
+                return
+            life = current_time - self.birth_time[:n]
+        self.life[:n] = life
+
+        # Update position
+        self.position[:n] += self.velocity[:n] * dt
+
+        # Apply gravity (upward positive) and air resistance (2% per 60 Hz frame)
+        self.velocity[:n, 1] += 2.0 * dt
+        self.velocity[:n] *= 0.98 ** (dt * 60.0)
+
+        # Update size (grows over time)
+        self.size[:n] = self.max_size[:n] * (0.1 + 0.9 * self.life[:n] / self.max_life[:n])
+
+        # Update rotation
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+
+    def fill_quads(self, rgb, opacity):
+        """Write a rotated, faded quad per live particle into self.quads and return the vertex count"""
+        n = self.count
+        if n == 0:
+            return 0
+
+        # Rotate the corner offsets about z, scaled by each particle's size
+        angle = np.radians(self.rotation[:n])
+        cos_r = (np.cos(angle) * self.size[:n])[:, None]
+        sin_r = (np.sin(angle) * self.size[:n])[:, None]
+        quads = self.quads[:n]
+        quads[:, :, 0] = cos_r * _CORNERS_X - sin_r * _CORNERS_Y
+        quads[:, :, 1] = sin_r * _CORNERS_X + cos_r * _CORNERS_Y
+        quads[:, :, 2] = 0.0
+        quads[:, :, 0:3] += self.position[:n, None, :]
+
+        # The colour is shared by all particles, only rewrite it when it changes
+        if rgb != self._quad_rgb:
+            self.quads[:, :, 3:6] = rgb
+            self._quad_rgb = rgb
+
+        # Fade in over the first 10% of life and out over the last 30%
+        progress = self.life[:n] / self.max_life[:n]
+        alpha = np.where(progress < 0.1, progress * 10.0, np.where(progress > 0.7, (1.0 - progress) / 0.3, 1.0))
+        quads[:, :, 6] = (alpha * opacity)[:, None]
+        return n * 4
@@ -0,0 +1,43 @@
+import threading
+import cv2
+
+class LatestFrameReader:
+    """Grabs camera frames on a background thread and keeps only the newest one"""
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Don't let the driver queue stale frames
+        self._cond = threading.Condition()
+        self._latest = None
+        self._fresh = False  # Whether _latest has been handed out yet
+        self._running = True
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+
+    def _grab_loop(self):
+        while self._running:
+            if not self.cap.grab():
+                with self._cond:
+                    self._cond.wait(0.005)  # Camera not ready, don't spin
+                continue
+            ok, frame = self.cap.retrieve()
+            if not ok:
+                continue
+            # Overwrite whatever the consumer hasn't picked up, it is already stale
+            with self._cond:
+                self._latest = frame
+                self._fresh = True
+                self._cond.notify()
+
+    def read(self, timeout=1.0):
+        """Return (ok, frame) for the newest frame not returned before, like VideoCapture.read"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._fresh, timeout):
+                return False, None
+            self._fresh = False
+            return True, self._latest
+
+    def release(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.cap.release()
@@ -1,18 +1,23 @@
 import cv2
 import numpy as np
-import math
 from collections import deque
 import json
 import os
 from src.vision.monitors import Viewer
+from src.vision.capture import LatestFrameReader
+from src.vision.estimate_kernel import NUMBA_AVAILABLE, PALM_CENTER, FINGERTIPS, shooting_kick, fist_metrics
+from src.vision.planar_pose import square_poses
 import mediapipe as mp
 
 class Estimate:
     MARKER_SIZE_M = 0.03    
     WIDTH = 1500
     HEIGHT = 750
+    DETECT_DOWNSCALE = 2  # Markers are searched for on an image this many times smaller
+    HAND_INFERENCE_STRIDE = 4  # Run MediaPipe Hands on every Nth fist check, reloading is a slow gesture
     
     def __init__(self):
+        self.debug = False  # Draw marker, pose and hand overlays onto the camera frame
         self.dist = np.array([0, 0, 0, 0, 0], dtype=np.float64)
         try:
             calib_path = os.path.join(os.getcwd(), "calib.json")  # Fixed path join
@@ -40,7 +45,14 @@ class Estimate:
             [ half,  half, 0.0],  # TR
             [ half, -half, 0.0],  # BR
             [-half, -half, 0.0],  # BL
-        ], dtype=np.float32)
+        ], dtype=np.float64)  # Same dtype as K so solvePnP doesn't convert per call
+        self._origin3d = np.zeros((1, 3), dtype=np.float64)  # Marker center, projected every frame
+        self._no_distortion = not np.any(self.dist)  # Then the marker center projects as a plain pinhole
+        
+        # Compile the per-marker kernels now rather than on the first detection
+        if NUMBA_AVAILABLE:
+            shooting_kick(np.zeros((5, 2)), 35.0, 3.0, 3.0, 6.0)
+            fist_metrics(np.zeros((21, 2)), 1.3)
    
         # Initialize all tracking variables
         self.d = 0
@@ -60,6 +72,11 @@ class Estimate:
             min_tracking_confidence=0.5
         )
         self.finger_names = ["thumb", "index", "middle", "ring", "pinky"]
+        self._rgb_buf = None  # RGB copy of the frame for MediaPipe, sized on first use
+        self._hand_frame_ctr = 0
+        self._last_hand_results = None  # Landmarks reused between MediaPipe runs
+        self._gray_buf = None  # Grayscale frame when the caller doesn't provide one
+        self._small_buf = None  # Downscaled grayscale frame the detector runs on
         
         self.viewer = Viewer("Degree and Pos Visualizer")
         
@@ -68,33 +85,27 @@ class Estimate:
         self.shooting = False
         self.shoot_cooldown = 0
 
-    def get_inplane_angle(self, rvec):
-        """Return marker orientation about camera Z-axis in degrees [-180, 180]."""
-        R, _ = cv2.Rodrigues(rvec)
-        angle_rad = math.atan2(R[1,0], R[0,0])
-        angle_deg = math.degrees(angle_rad)
-        return angle_deg  # [-180, 180]
-
-    def get_distance(self, c):
-        """Estimate distance (z) from marker to camera"""
-        TL, TR, BR, BL = c
-
-        # Average side length in pixels
-        side_px = (np.linalg.norm(TR-TL) + np.linalg.norm(TR-BR) +
-                np.linalg.norm(BR-BL) + np.linalg.norm(BL-TL)) / 4.0
-
-        fx = self.K[0,0]  # Focal length in pixels
+    def get_distances(self, corners):
+        """Estimate distance (z) to camera of every marker in an (N, 4, 2) stack of corners"""
+        # Average side length in pixels of every marker, sides run TL->TR->BR->BL->TL
+        edges = corners - np.roll(corners, -1, axis=1)
+        side_px = np.sqrt((edges * edges).sum(axis=2)).mean(axis=1)
         # Pinhole model: size_in_pixels = (f * real_size) / Z
-        Z = (fx * self.MARKER_SIZE_M) / side_px
-        return Z * 1.39  # 1.39 determined experimentally
+        return (self.K[0,0] * self.MARKER_SIZE_M) / side_px * 1.39  # 1.39 determined experimentally
     
     def get_degree_in_game(self, rvec, tvec, frame, ok_pnp):
         """Calculate weapon position and orientation from ArUco marker"""
-        point_3d = np.array([[0, 0, 0]], dtype=np.float32)  # marker center
-        point_2d, _ = cv2.projectPoints(point_3d, rvec, tvec, self.K, self.dist)
-
-        x, y = point_2d.ravel()
-        cv2.circle(frame, (int(x), int(y)), 20, (0, 0, 255), 10)
+        if self._no_distortion:
+            # The marker center is the origin of the marker frame, it lands on K @ tvec whatever the rotation
+            tx, ty, tz = tvec.ravel().tolist()
+            K = self.K
+            x = (K[0, 0] * tx + K[0, 1] * ty) / tz + K[0, 2]
+            y = K[1, 1] * ty / tz + K[1, 2]
+        else:
+            point_2d, _ = cv2.projectPoints(self._origin3d, rvec, tvec, self.K, self.dist)  # marker center
+            x, y = point_2d.ravel()
+        if self.debug:
+            cv2.circle(frame, (int(x), int(y)), 20, (0, 0, 255), 10)
         
         # Get ratio of x pos / total width, convert to a degree by doing ratio * 180
         artistic = 1.3  # This factor makes it so the gun doesn't actually move that much
@@ -112,14 +123,14 @@ class Estimate:
         - fingertip-to-fingertip across the knuckles (green if compact)
         Returns True if left hand fist is detected, False otherwise.
         """
-        def distance(p1, p2):
-            return math.hypot(p1.x - p2.x, p1.y - p2.y)
-
-        def to_px(pt, w, h):
-            return (int(pt.x * w), int(pt.y * h))
-
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb)
+        if self._hand_frame_ctr % self.HAND_INFERENCE_STRIDE == 0:
+            # Convert into a persistent buffer instead of allocating a new frame every call
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            self._last_hand_results = self.hands.process(rgb)
+        self._hand_frame_ctr += 1
+        results = self._last_hand_results
         if not results.multi_hand_landmarks:
             return False
 
@@ -128,59 +139,39 @@ class Estimate:
             if handedness.classification[0].label != "Left":
                 continue
 
-            h, w = frame.shape[:2]
-            lm = hand_lms.landmark
-            avg_y = int(round(np.mean([p.y * h for p in lm])))
+            # All 21 landmarks as one (21, 2) array of normalized x, y
+            pts = np.fromiter((v for p in hand_lms.landmark for v in (p.x, p.y)), dtype=np.float64, count=42).reshape(21, 2)
+            avg_y = int(round(pts[:, 1].mean() * h))
             
-            palm_center = lm[9]
-
-            # Distances fingertip -> palm and PIP -> palm for curl ratios
-            thumb_to_palm  = distance(lm[4],  palm_center);  thumb_ref  = distance(lm[3],  palm_center)
-            index_to_palm  = distance(lm[8],  palm_center);  index_ref  = distance(lm[6],  palm_center)
-            middle_to_palm = distance(lm[12], palm_center);  middle_ref = distance(lm[10], palm_center)
-            ring_to_palm   = distance(lm[16], palm_center);  ring_ref   = distance(lm[14], palm_center)
-            pinky_to_palm  = distance(lm[20], palm_center);  pinky_ref  = distance(lm[18], palm_center)
-
-            # Curl ratios (< threshold means curled)
+            # Curl ratios fingertip -> palm over PIP -> palm (< threshold means curled),
+            # and fingertip compactness
             curl_threshold = 1.3
-            curls = [
-                thumb_to_palm  / (thumb_ref  + 1e-6) < curl_threshold,
-                index_to_palm  / (index_ref  + 1e-6) < curl_threshold,
-                middle_to_palm / (middle_ref + 1e-6) < curl_threshold,
-                ring_to_palm   / (ring_ref   + 1e-6) < curl_threshold,
-                pinky_to_palm  / (pinky_ref  + 1e-6) < curl_threshold
-            ]
-
-            # Fingertip compactness
-            tips = [lm[4], lm[8], lm[12], lm[16], lm[20]]
-            fingertip_distances = [
-                distance(lm[4], lm[8]),
-                distance(lm[8], lm[12]),
-                distance(lm[12], lm[16]),
-                distance(lm[16], lm[20]),
-            ]
-            avg_fingertip_distance = sum(fingertip_distances) / len(fingertip_distances)
+            curls, avg_fingertip_distance = fist_metrics(pts, curl_threshold)
             compact_threshold = 0.08
             compact = avg_fingertip_distance < compact_threshold
 
-            # --------- DRAWING LINES ----------
-            # 1) Palm-center to each fingertip (green if curled, else red)
-            colors = [(0,255,0) if c else (0,0,255) for c in curls]  # BGR
-            palm_px = to_px(palm_center, w, h)
-            for tip, color in zip(tips, colors):
-                cv2.line(frame, palm_px, to_px(tip, w, h), color, 2, cv2.LINE_AA)
-                cv2.circle(frame, to_px(tip, w, h), 4, color, -1, cv2.LINE_AA)
-
-            # 2) Fingertip-to-fingertip chain (green if compact, else red)
-            chain_color = (0,255,0) if compact else (0,0,255)
-            for a, b in zip(tips[:-1], tips[1:]):
-                cv2.line(frame, to_px(a, w, h), to_px(b, w, h), chain_color, 2, cv2.LINE_AA)
-
-            # Optional: draw palm point
-            cv2.circle(frame, palm_px, 5, (255,255,255), -1, cv2.LINE_AA)
+            # --------- DRAWING LINES (debug overlay) ----------
+            if self.debug:
+                # 1) Palm-center to each fingertip (green if curled, else red)
+                colors = [(0,255,0) if c else (0,0,255) for c in curls.tolist()]  # BGR
+                palm_center = pts[PALM_CENTER]
+                palm_px = (int(palm_center[0] * w), int(palm_center[1] * h))
+                tips_px = [tuple(p) for p in (pts[list(FINGERTIPS)] * (w, h)).astype(int).tolist()]
+                for tip_px, color in zip(tips_px, colors):
+                    cv2.line(frame, palm_px, tip_px, color, 2, cv2.LINE_AA)
+                    cv2.circle(frame, tip_px, 4, color, -1, cv2.LINE_AA)
+
+                # 2) Fingertip-to-fingertip chain (green if compact, else red)
+                chain_color = (0,255,0) if compact else (0,0,255)
+                for a, b in zip(tips_px[:-1], tips_px[1:]):
+                    cv2.line(frame, a, b, chain_color, 2, cv2.LINE_AA)
+
+                # Optional: draw palm point
+                cv2.circle(frame, palm_px, 5, (255,255,255), -1, cv2.LINE_AA)
 
             # Decision of reloading (fist + above)
-            if sum(curls) >= 4 and compact and avg_y < aruco_central_y:
+            if curls.sum() >= 4 and compact and avg_y < aruco_central_y:
+                self._hand_frame_ctr = 0  # Look afresh after the cooldown, not at this fist again
                 return True
 
         return False
@@ -191,56 +182,18 @@ class Estimate:
         Fires on a small, fast y 'kick' (up then down) with only mild x stability.
         Assumes self.track_coords holds the last (x, y) centers.
         """
-        n = len(self.track_coords)
-        if n < 4:
-            return False
-
-        pts = list(self.track_coords)[-5:]  # up to last 5
-        xs = [p[0] for p in pts]
-        ys = [p[1] for p in pts]
-
-        # --- Relaxed X stability (allow small pan) ---
-        if (max(xs) - min(xs)) > 35:   # was much stricter before
+        if len(self.track_coords) < 4:
             return False
 
         # --- Sensitivity knobs (tiny thresholds) ---
+        max_x_span       = 35.0  # relaxed X stability (allow small pan), was much stricter before
         up_step_thresh   = 3.0   # min single-frame "up" change (y decreases)
         down_step_thresh = 3.0   # min single-frame "down" change (y increases)
         amp_min          = 6.0   # overall peak-to-trough needed
 
-        # Compute first differences
-        dys = [ys[i+1] - ys[i] for i in range(len(ys)-1)]  # + = down, - = up
-
-        # Look for an UP step followed soon by a DOWN step
-        up_idxs   = [i for i, dy in enumerate(dys) if dy < -up_step_thresh]
-        down_idxs = [i for i, dy in enumerate(dys) if dy >  down_step_thresh]
-
-        if not up_idxs or not down_idxs:
-            return False
-
-        # Ensure order: an up happens before a down within the recent window
-        k = min(up_idxs)
-        m_candidates = [m for m in down_idxs if m > k]
-        if not m_candidates:
-            return False
-
-        # Amplitude check around the up→down region
-        m = min(m_candidates)
-        seg = ys[k:(m+2)]  # cover points affected by dy[k]..dy[m]
-        if len(seg) < 2:
-            return False
-
-        # We want the segment to have a clear local minimum (kick up) then rise back
-        ymin = min(seg); ymax = max(seg)
-        if (ymax - ymin) < amp_min:
-            return False
-
-        # Extra forgiving shape check: min should be before the end of the segment
-        argmin = seg.index(ymin)
-        if argmin == len(seg) - 1:
-            return False
-
-        return True
+        # The deque holds at most 5 points, convert them once for the kernel
+        pts = np.asarray(self.track_coords, dtype=np.float64)
+        return bool(shooting_kick(pts, max_x_span, up_step_thresh, down_step_thresh, amp_min))
     
     def get_weapon_transform_data(self):
         """
@@ -257,37 +210,78 @@ class Estimate:
             'reloading': self.reloading          # Reloading state
         }
 
-    def get_measurements(self, frame):
-        corners, ids, _ = self.detector.detectMarkers(frame)
+    def _detect_markers(self, frame, gray):
+        """Find markers on a downscaled grayscale copy of frame, returning full-resolution corners"""
+        h, w = frame.shape[:2]
+        if gray is None:
+            if self._gray_buf is None or self._gray_buf.shape != (h, w):
+                self._gray_buf = np.empty((h, w), dtype=np.uint8)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        
+        scale = self.DETECT_DOWNSCALE
+        small_shape = (h // scale, w // scale)
+        if self._small_buf is None or self._small_buf.shape != small_shape:
+            self._small_buf = np.empty(small_shape, dtype=np.uint8)
+        small = cv2.resize(gray, small_shape[::-1], dst=self._small_buf, interpolation=cv2.INTER_AREA)
         
-        if ids is not None and len(ids) > 0:
-            self.aruco.drawDetectedMarkers(frame, corners, ids)
-            for c in corners:
-                c = c.reshape(-1, 2).astype(np.float32)
-                # rvec is rotation vector, tvec is translation vector relative to camera
-                ok_pnp, rvec, tvec = cv2.solvePnP(self.objp, c, self.K, self.dist, flags=cv2.SOLVEPNP_IPPE_SQUARE)
+        corners, ids, _ = self.detector.detectMarkers(small)
+        if ids is None or len(ids) == 0:
+            return None, None
+        # Map pixel centres back to the full frame, (N, 4, 2)
+        stacked = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)
+        stacked = stacked * scale + (scale - 1) / 2.0
+        return stacked, ids
+    
+    def get_measurements(self, frame, gray=None):
+        # Markers are found on luma only, a prepared grayscale frame saves converting here
+        stacked, ids = self._detect_markers(frame, gray)
+        
+        if ids is not None:
+            if self.debug:
+                self.aruco.drawDetectedMarkers(frame, tuple(stacked[:, None]), ids)
+            
+            # Per-marker quantities that don't need a pose, for all markers at once
+            distances = self.get_distances(stacked)
+            
+            # IPPE poses of every marker in one batch, same as solvePnP(SOLVEPNP_IPPE_SQUARE) with self.dist all zero
+            rotations, translations = square_poses(stacked, self.K, self.MARKER_SIZE_M / 2.0)
+            # Rotation angle about the camera Z axis (left/right gun rotation)
+            angles = np.degrees(np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0])).tolist()
+            # Degenerate quads come back as NaN poses, skip them and keep the other markers
+            valid = np.isfinite(translations).all(axis=1).tolist()
+            
+            for R, tvec, angle, new_distance, c, ok in zip(rotations, translations, angles, distances.tolist(),
+                                                           stacked.tolist(), valid):
+                if not ok:
+                    continue
+                # Bounding box of the four corners, plain floats beat array reductions at this size
+                (xa, ya), (xb, yb), (xc, yc), (xd, yd) = c
+                x1, x2 = int(min(xa, xb, xc, xd)), int(max(xa, xb, xc, xd))
+                y1, y2 = int(min(ya, yb, yc, yd)), int(max(ya, yb, yc, yd))
+                
+                # rvec is rotation vector, tvec is translation vector relative to camera,
+                # only projecting with distortion needs the rotation
+                rvec = None if self._no_distortion else cv2.Rodrigues(R)[0]
                 
                 # Angles and orientation
-                self.get_degree_in_game(rvec, tvec, frame, ok_pnp)
+                self.get_degree_in_game(rvec, tvec, frame, True)
                 
                 # Distance to cam - only update if valid
-                new_distance = self.get_distance(c)
                 if new_distance > 0:
                     self.d_to_cam = new_distance
                     self.last_valid_distance = new_distance
                 # If new_distance is 0 or negative, keep the current d_to_cam value
                 
                 # Rotation angle (left/right gun rotation)
-                self.angle = self.get_inplane_angle(rvec)
+                self.angle = angle
                 
                 # Label aruco
-                xs, ys = c[:,0], c[:,1]
-                x1, y1, x2, y2 = map(int, [xs.min(), ys.min(), xs.max(), ys.max()])
                 tx, ty = int((x1+x2)/2), max(0, y1-6)
-                txt = f"{self.angle:+.1f}°"
-                sz = cv2.getTextSize(txt, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-                cv2.putText(frame, txt, (tx - sz[0]//2, ty + sz[1]), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2, cv2.LINE_AA)
+                if self.debug:
+                    txt = f"{self.angle:+.1f}°"
+                    sz = cv2.getTextSize(txt, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+                    cv2.putText(frame, txt, (tx - sz[0]//2, ty + sz[1]), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2, cv2.LINE_AA)
                 
                 central_y = int((y1 + y2) / 2)
                 
@@ -312,41 +306,56 @@ class Estimate:
         else:
             # No marker detected - keep the last valid distance instead of setting to 0
             # self.d_to_cam remains at its last valid value
-            pass
+            # Cached hand landmarks go stale while the marker is lost, run fresh inference on reacquiring it
+            self._hand_frame_ctr = 0
+            self._last_hand_results = None
 
         return frame
 
 if __name__ == "__main__":
     estimator = Estimate()
+    estimator.debug = True  # This preview is for looking at the overlays
     
     cap = cv2.VideoCapture(0)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    cap = LatestFrameReader(cap)
+    
+    # Cached HUD text, white on black over the top hud_rows of the frame
+    hud_rows = 280
+    hud = np.zeros((hud_rows, 0, 3), dtype=np.uint8)
+    hud_last = None
 
     while True:
-        _, frame = cap.read()
-        frame = cv2.flip(frame, 1)
+        ok, frame = cap.read()
+        if not ok:
+            continue
+        cv2.flip(frame, 1, dst=frame)  # Mirror in place, the frame is ours
         frame = estimator.get_measurements(frame)
         
         # Update cooldowns
         if estimator.reload_cooldown > 0:
             estimator.reload_cooldown -= 1
-        cv2.putText(frame, f'Reload cooldown {estimator.reload_cooldown}', 
-                   (10, 60), cv2.FONT_HERSHEY_COMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_AA)
-        
         if estimator.shoot_cooldown > 0:
             estimator.shoot_cooldown -= 1
-        cv2.putText(frame, f'Shooting cooldown {estimator.shoot_cooldown}', 
-                   (10, 110), cv2.FONT_HERSHEY_COMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_AA)
         
-        # Display weapon transform data
+        # Display cooldowns and weapon transform data
         data = estimator.get_weapon_transform_data()
-        cv2.putText(frame, f"Distance: {data['distance_to_cam']:.2f}m", 
-                   (10, 160), cv2.FONT_HERSHEY_COMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_AA)
-        cv2.putText(frame, f"Shooting: {data['shooting']}", 
-                   (10, 210), cv2.FONT_HERSHEY_COMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_AA)
-        cv2.putText(frame, f"Reloading: {data['reloading']}", 
-                   (10, 260), cv2.FONT_HERSHEY_COMPLEX, 1.0, (0, 0, 0), 2, cv2.LINE_AA)
+        hud_lines = (
+            'Reload cooldown %d' % estimator.reload_cooldown,
+            'Shooting cooldown %d' % estimator.shoot_cooldown,
+            'Distance: %.2fm' % data['distance_to_cam'],
+            'Shooting: %s' % data['shooting'],
+            'Reloading: %s' % data['reloading'],
+        )
+        # Text only changes at game-logic rate, rasterize it again only when it does
+        if hud_lines != hud_last or hud.shape[1:] != frame.shape[1:]:
+            hud = np.zeros((hud_rows,) + frame.shape[1:], dtype=np.uint8)
+            for i, line in enumerate(hud_lines):
+                cv2.putText(hud, line, (10, 60 + 50 * i), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2, cv2.LINE_8)
+            hud_last = hud_lines
+        # White text subtracted with saturation draws black text over the frame
+        cv2.subtract(frame[:hud_rows], hud, dst=frame[:hud_rows])
         
         cv2.imshow("Cam Feed", frame)
 
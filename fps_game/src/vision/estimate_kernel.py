@@ -0,0 +1,83 @@
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# MediaPipe hand landmark indices: palm centre, fingertips and the joint each tip's curl is measured against
+PALM_CENTER = 9
+FINGERTIPS = (4, 8, 12, 16, 20)
+FINGER_REFS = (3, 6, 10, 14, 18)
+
+def shooting_kick(pts, max_x_span, up_step, down_step, amp_min):
+    """Whether the (n, 2) tracked centres show an up step followed by a down step of enough amplitude"""
+    n = pts.shape[0]
+    if n < 4:
+        return False
+
+    # Allow only a small horizontal pan
+    x_min = x_max = pts[0, 0]
+    for i in range(1, n):
+        x = pts[i, 0]
+        if x < x_min:
+            x_min = x
+        elif x > x_max:
+            x_max = x
+    if x_max - x_min > max_x_span:
+        return False
+
+    # First up step (y decreases), then the first down step after it
+    k = -1
+    for i in range(n - 1):
+        if pts[i + 1, 1] - pts[i, 1] < -up_step:
+            k = i
+            break
+    if k < 0:
+        return False
+    m = -1
+    for i in range(k + 1, n - 1):
+        if pts[i + 1, 1] - pts[i, 1] > down_step:
+            m = i
+            break
+    if m < 0:
+        return False
+
+    # Segment ys[k:m+2] needs enough amplitude and its minimum before the end
+    end = min(m + 2, n)
+    y_min = y_max = pts[k, 1]
+    arg_min = k
+    for i in range(k + 1, end):
+        y = pts[i, 1]
+        if y < y_min:
+            y_min = y
+            arg_min = i
+        elif y > y_max:
+            y_max = y
+    if y_max - y_min < amp_min:
+        return False
+    return arg_min != end - 1
+
+def fist_metrics(pts, curl_threshold):
+    """Per-finger curl flags and the mean fingertip-to-fingertip distance of (21, 2) hand landmarks"""
+    px = pts[PALM_CENTER, 0]
+    py = pts[PALM_CENTER, 1]
+    curls = np.empty(5, dtype=np.bool_)
+    for f in range(5):
+        t = FINGERTIPS[f]
+        r = FINGER_REFS[f]
+        tip_to_palm = math.sqrt((pts[t, 0] - px) ** 2 + (pts[t, 1] - py) ** 2)
+        ref_to_palm = math.sqrt((pts[r, 0] - px) ** 2 + (pts[r, 1] - py) ** 2)
+        curls[f] = tip_to_palm / (ref_to_palm + 1e-6) < curl_threshold
+    chain = 0.0
+    for f in range(4):
+        a = FINGERTIPS[f]
+        b = FINGERTIPS[f + 1]
+        chain += math.sqrt((pts[a, 0] - pts[b, 0]) ** 2 + (pts[a, 1] - pts[b, 1]) ** 2)
+    return curls, chain / 4.0
+
+if NUMBA_AVAILABLE:
+    shooting_kick = njit(cache=True)(shooting_kick)
+    fist_metrics = njit(cache=True)(fist_metrics)
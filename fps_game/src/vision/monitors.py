@@ -1,4 +1,5 @@
 import math
+from itertools import islice
 import numpy as np
 import matplotlib
 matplotlib.use("TkAgg")
@@ -26,12 +27,27 @@ class Viewer:
         self.ax.set_aspect('equal', 'box')
         self.ax.grid(True, linestyle='--', alpha=0.3)
 
-        self.circle_artist = None
+        # Circle and axes lines are created once, update() only resizes the circle
+        self.circle_artist = plt.Circle((0,0), 1.0, fill=False, lw=2, color='k')
+        self.ax.add_artist(self.circle_artist)
+        self.ax.axhline(0, color='0.7', lw=1)
+        self.ax.axvline(0, color='0.7', lw=1)
         self.arc_line,   = self.ax.plot([], [], lw=2, color='tab:cyan')
         self.chord_line, = self.ax.plot([], [], lw=3, color='tab:red')
         self.P_scatter = self.ax.scatter([], [], s=60, color='tab:red',  zorder=3, label='P(d,0)')
         self.E_scatter = self.ax.scatter([], [], s=60, color='tab:cyan', zorder=3, label='E (arc end)')
+        self._p_buf = np.zeros((1, 2))  # Scatter offsets, rewritten in place every update
+        self._e_buf = np.zeros((1, 2))
         self.angle_arc, = self.ax.plot([], [], lw=2, color='tab:green')
+        # Unit parameter grids and output buffers for the arc (150 samples) and angle marker (64)
+        self._t150 = np.linspace(0.0, 1.0, 150)
+        self._arc_t = np.empty(150)
+        self._arc_x = np.empty(150)
+        self._arc_y = np.empty(150)
+        self._t64 = np.linspace(0.0, 1.0, 64)
+        self._ang_t = np.empty(64)
+        self._ang_x = np.empty(64)
+        self._ang_y = np.empty(64)
         self.text_handle = self.ax.text(0.02, 0.98, "", transform=self.ax.transAxes,
                                         ha='left', va='top', fontsize=10)
         self.ax.legend(loc='upper right')
@@ -48,34 +64,52 @@ class Viewer:
         (self.y_line,) = self.ax_y.plot([], [], marker="o")
         (self.y_last,) = self.ax_y.plot([], [], marker="o", lw=0, ms=8)  # highlight newest
         self._y_indices = np.arange(5)
-
-        self.show = False # set True to make update() call pause()
+        self._ys = np.full(5, np.nan)  # Last 5 y's, oldest first, NaN where there is no sample yet
+
+        # Moving artists are left out of full draws and blitted over cached backgrounds
+        self._top_artists = [self.arc_line, self.chord_line, self.P_scatter,
+                             self.E_scatter, self.angle_arc, self.text_handle]
+        self._bottom_artists = [self.y_line, self.y_last]
+        for artist in self._top_artists + self._bottom_artists:
+            artist.set_animated(True)
+        self._bg_top = None
+        self._bg_bot = None
+        self._bg_r = None  # Circle radius the view limits were set for
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self.show = False # set True to make update() process GUI events
+
+    def _on_draw(self, event):
+        """Snapshot both static backgrounds after every full draw (first show, resize, new radius)"""
+        canvas = self.fig.canvas
+        self._bg_top = canvas.copy_from_bbox(self.ax.bbox)
+        self._bg_bot = canvas.copy_from_bbox(self.ax_y.bbox)
 
     @staticmethod
     def _end_angle_from_arc_deg(arc_deg):
         # arc measured from TOP (0,r); convert to standard angle from +x axis CCW
         return 90.0 - arc_deg
 
-    @staticmethod
-    def _pad_last5_y(track_coords):
-        """Extract last 5 y's, pad front with NaNs to length 5."""
-        buf = list(track_coords)[-5:]
-        ys = [p[1] for p in buf]
-        pad = 5 - len(ys)
-        if pad > 0:
-            ys = [np.nan]*pad + ys
-        ys = np.array(ys, dtype=float)
+    def _fill_last5_y(self, track_coords):
+        """Write the last 5 y's into self._ys, NaN-padded at the front."""
+        ys = self._ys
+        n = len(track_coords)
+        pad = max(0, 5 - n)
+        ys[:pad] = np.nan
+        for i, (_, y) in enumerate(islice(track_coords, max(0, n - 5), None), pad):
+            ys[i] = y
         return ys
 
     def _update_y_trend(self, track_coords):
-        ys = self._pad_last5_y(track_coords)
+        ys = self._fill_last5_y(track_coords)
         self.y_line.set_data(self._y_indices, ys)
 
         # highlight newest non-NaN point
-        finite = np.isfinite(ys)
-        if np.any(finite):
-            newest_idx = np.max(np.where(finite)[0])
-            self.y_last.set_data([newest_idx], [ys[newest_idx]])
+        for newest_idx in range(4, -1, -1):
+            y = ys[newest_idx]
+            if y == y:  # Not NaN
+                self.y_last.set_data([newest_idx], [y])
+                break
         else:
             self.y_last.set_data([], [])
 
@@ -88,33 +122,46 @@ class Viewer:
         alpha = math.atan2(Ey - Py, Ex - Px)
         alpha_deg = math.degrees(alpha)
 
-        # ----- draw circle -----
-        if self.circle_artist is not None:
-            self.circle_artist.remove()
-        self.circle_artist = plt.Circle((0,0), r, fill=False, lw=2, color='k')
-        self.ax.add_artist(self.circle_artist)
-
-        # axes lines
-        self.ax.axhline(0, color='0.7', lw=1)
-        self.ax.axvline(0, color='0.7', lw=1)
+        # circle and view limits, the backgrounds are only redrawn in full when they change
+        canvas = self.fig.canvas
+        if self._bg_top is None or r != self._bg_r:
+            self.circle_artist.set_radius(r)
+            m = r * 1.25
+            self.ax.set_xlim(-m, m)
+            self.ax.set_ylim(-m, m)
+            self._bg_r = r
+            canvas.draw()  # Fires _on_draw
 
         # arc from TOP to E
         theta_top = math.radians(90.0)
-        thetas = np.linspace(theta_top, theta, 150)
-        self.arc_line.set_data(r*np.cos(thetas), r*np.sin(thetas))
+        thetas = np.multiply(self._t150, theta - theta_top, out=self._arc_t)
+        thetas += theta_top
+        np.cos(thetas, out=self._arc_x)
+        self._arc_x *= r
+        np.sin(thetas, out=self._arc_y)
+        self._arc_y *= r
+        self.arc_line.set_data(self._arc_x, self._arc_y)
 
         # chord P->E
         self.chord_line.set_data([Px, Ex], [Py, Ey])
 
         # points
-        self.P_scatter.set_offsets(np.array([[Px, Py]]))
-        self.E_scatter.set_offsets(np.array([[Ex, Ey]]))
+        self._p_buf[0, 0] = Px
+        self._p_buf[0, 1] = Py
+        self.P_scatter.set_offsets(self._p_buf)
+        self._e_buf[0, 0] = Ex
+        self._e_buf[0, 1] = Ey
+        self.E_scatter.set_offsets(self._e_buf)
 
         # small angle marker at P
         rad = 0.2 * r
-        phis = np.linspace(0.0, alpha, 64)
-        ang_x = Px + rad*np.cos(phis)
-        ang_y = Py + rad*np.sin(phis)
+        phis = np.multiply(self._t64, alpha, out=self._ang_t)
+        ang_x = np.cos(phis, out=self._ang_x)
+        ang_x *= rad
+        ang_x += Px
+        ang_y = np.sin(phis, out=self._ang_y)
+        ang_y *= rad
+        ang_y += Py
         self.angle_arc.set_data(ang_x, ang_y)
 
         # annotation
@@ -126,18 +173,20 @@ class Viewer:
             f"alpha = {alpha_deg:+.2f}°"
         )
 
-        # view limits
-        m = r * 1.25
-        self.ax.set_xlim(-m, m)
-        self.ax.set_ylim(-m, m)
-
         # --- update Y trend if provided ---
         if track_coords is not None:
             self._update_y_trend(track_coords)
 
-        # redraw
-        self.fig.canvas.draw_idle()
+        # redraw only what moved
+        canvas.restore_region(self._bg_top)
+        for artist in self._top_artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+        canvas.restore_region(self._bg_bot)
+        for artist in self._bottom_artists:
+            self.ax_y.draw_artist(artist)
+        canvas.blit(self.ax_y.bbox)
         if self.show:
-            plt.pause(0.001)
+            canvas.flush_events()
 
         return alpha, (Ex, Ey)
\ No newline at end of file
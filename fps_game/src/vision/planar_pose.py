@@ -0,0 +1,138 @@
+import numpy as np
+
+# Marker corners TL, TR, BR, BL on a square of half-size 1, same layout as Estimate.objp
+_UNIT_SQUARE = np.array([[-1.0, 1.0], [1.0, 1.0], [1.0, -1.0], [-1.0, -1.0]])
+
+def _solve_each(A, b):
+    """Batched np.linalg.solve where a singular system yields NaN instead of failing the whole batch"""
+    try:
+        return np.linalg.solve(A, b)
+    except np.linalg.LinAlgError:
+        out = np.full(b.shape, np.nan)
+        for i in range(len(A)):
+            try:
+                out[i] = np.linalg.solve(A[i], b[i])
+            except np.linalg.LinAlgError:
+                pass
+        return out
+
+def _homographies(x, y):
+    """(N, 8) homographies from _UNIT_SQUARE to normalized image points (x, y), h22 = 1"""
+    n = len(x)
+    u, v = _UNIT_SQUARE[:, 0], _UNIT_SQUARE[:, 1]
+    A = np.zeros((n, 8, 8))
+    A[:, :4, 0] = u
+    A[:, :4, 1] = v
+    A[:, :4, 2] = 1.0
+    A[:, :4, 6] = -x * u
+    A[:, :4, 7] = -x * v
+    A[:, 4:, 3] = u
+    A[:, 4:, 4] = v
+    A[:, 4:, 5] = 1.0
+    A[:, 4:, 6] = -y * u
+    A[:, 4:, 7] = -y * v
+    b = np.concatenate([x, y], axis=1)
+    return _solve_each(A, b[:, :, None])[:, :, 0]
+
+def _rotations_to(p, q):
+    """(N, 3, 3) rotations taking the z axis onto the direction of (p, q, 1)"""
+    inv_len = 1.0 / np.sqrt(p * p + q * q + 1.0)
+    nx, ny, c = p * inv_len, q * inv_len, inv_len
+    k = 1.0 / (1.0 + c)
+    Rv = np.empty((len(p), 3, 3))
+    Rv[:, 0, 0] = 1.0 - nx * nx * k
+    Rv[:, 0, 1] = -nx * ny * k
+    Rv[:, 0, 2] = nx
+    Rv[:, 1, 0] = -nx * ny * k
+    Rv[:, 1, 1] = 1.0 - ny * ny * k
+    Rv[:, 1, 2] = ny
+    Rv[:, 2, 0] = -nx
+    Rv[:, 2, 1] = -ny
+    Rv[:, 2, 2] = c
+    return Rv
+
+def _translations(R, X, x, y):
+    """Least-squares (N, 3) translations for rotations R, model points X (4, 2) and image points (x, y)"""
+    # x * (r2 . X + tz) = r0 . X + tx, likewise for y, is linear in t
+    r0X = R[:, 0, :2] @ X.T
+    r1X = R[:, 1, :2] @ X.T
+    r2X = R[:, 2, :2] @ X.T
+    n = len(R)
+    M = np.zeros((n, 8, 3))
+    M[:, :4, 0] = 1.0
+    M[:, :4, 2] = -x
+    M[:, 4:, 1] = 1.0
+    M[:, 4:, 2] = -y
+    rhs = np.concatenate([x * r2X - r0X, y * r2X - r1X], axis=1)
+    Mt = M.transpose(0, 2, 1)
+    return _solve_each(Mt @ M, (Mt @ rhs[:, :, None]))[:, :, 0]
+
+def _reprojection_errors(R, t, X, x, y):
+    """Sum of squared normalized reprojection errors of the (N, 4) points"""
+    P = R[:, :, :2] @ X.T + t[:, :, None]  # (N, 3, 4) camera coordinates
+    return ((P[:, 0] / P[:, 2] - x) ** 2 + (P[:, 1] / P[:, 2] - y) ** 2).sum(axis=1)
+
+def square_poses(corners, K, half_size):
+    """
+    Poses of N square markers from their (N, 4, 2) TL, TR, BR, BL pixel corners, without distortion.
+    Infinitesimal plane-based pose estimation (IPPE, Collins & Bartoli), as solvePnP's
+    SOLVEPNP_IPPE_SQUARE, for every marker at once. Returns (N, 3, 3) rotations and (N, 3) translations,
+    NaN for degenerate quads so one bad marker doesn't fail the others.
+    """
+    corners = np.asarray(corners, dtype=np.float64)
+    y = (corners[:, :, 1] - K[1, 2]) / K[1, 1]
+    x = (corners[:, :, 0] - K[0, 2] - K[0, 1] * y) / K[0, 0]
+    X = _UNIT_SQUARE * half_size
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _square_poses(x, y, X, half_size)
+
+def _square_poses(x, y, X, half_size):
+    """square_poses on normalized image points, NaN propagates through degenerate markers"""
+    # Homography Jacobian at the marker centre, in model units
+    h = _homographies(x, y)
+    p, q = h[:, 2], h[:, 5]
+    j00 = (h[:, 0] - h[:, 6] * p) / half_size
+    j01 = (h[:, 1] - h[:, 7] * p) / half_size
+    j10 = (h[:, 3] - h[:, 6] * q) / half_size
+    j11 = (h[:, 4] - h[:, 7] * q) / half_size
+
+    # In a frame whose z axis points at the centre, J is B times the top-left of the rotation
+    Rv = _rotations_to(p, q)
+    b00 = Rv[:, 0, 0] - p * Rv[:, 2, 0]
+    b01 = Rv[:, 0, 1] - p * Rv[:, 2, 1]
+    b10 = Rv[:, 1, 0] - q * Rv[:, 2, 0]
+    b11 = Rv[:, 1, 1] - q * Rv[:, 2, 1]
+    inv_det = 1.0 / (b00 * b11 - b01 * b10)
+    a00 = inv_det * (b11 * j00 - b01 * j10)
+    a01 = inv_det * (b11 * j01 - b01 * j11)
+    a10 = inv_det * (b00 * j10 - b10 * j00)
+    a11 = inv_det * (b00 * j11 - b10 * j01)
+
+    # Scale by the largest singular value so the block belongs to a rotation
+    ata00 = a00 * a00 + a01 * a01
+    ata01 = a00 * a10 + a01 * a11
+    ata11 = a10 * a10 + a11 * a11
+    gamma = np.sqrt(0.5 * (ata00 + ata11 + np.sqrt((ata00 - ata11) ** 2 + 4.0 * ata01 * ata01)))
+    r00, r01, r10, r11 = a00 / gamma, a01 / gamma, a10 / gamma, a11 / gamma
+
+    # Complete the first two columns to unit length; the two signs are the two candidate poses
+    b0 = np.sqrt(np.maximum(1.0 - r00 * r00 - r10 * r10, 0.0))
+    b1 = np.sqrt(np.maximum(1.0 - r01 * r01 - r11 * r11, 0.0))
+    b1 = np.where(r00 * r01 + r10 * r11 > 0.0, -b1, b1)  # Keep the columns orthogonal
+
+    best_R = best_t = best_err = None
+    for sign in (1.0, -1.0):
+        c0 = np.stack([r00, r10, sign * b0], axis=1)
+        c1 = np.stack([r01, r11, sign * b1], axis=1)
+        local = np.stack([c0, c1, np.cross(c0, c1)], axis=2)
+        R = Rv @ local
+        t = _translations(R, X, x, y)
+        err = _reprojection_errors(R, t, X, x, y)
+        if best_R is None:
+            best_R, best_t, best_err = R, t, err
+        else:
+            better = err < best_err
+            best_R = np.where(better[:, None, None], R, best_R)
+            best_t = np.where(better[:, None], t, best_t)
+    return best_R, best_t
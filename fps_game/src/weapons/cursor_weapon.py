@@ -1,7 +1,11 @@
 import math
+import logging
 import numpy as np
 import pygame
 from OpenGL.GL import *
+from src.weapons.weapon_kernel import weapon_pose
+
+log = logging.getLogger(__name__)
 
 class QuaternionWeapon:
     """Weapon system that tracks ArUco marker position and orientation using geometry calculations"""
@@ -12,15 +16,19 @@ class QuaternionWeapon:
         # Base weapon offset from camera (will be modified by ArUco position)
         self.base_weapon_offset = np.array([0, -0.4, -2.0])  # Base offset from camera
         self.weapon_offset = self.base_weapon_offset.copy()  # Current actual offset
+        self._world_pos = np.zeros(3, dtype=np.float32)  # Reused weapon world position buffer
         
-        self.cursor_world_pos = np.array([0, 0, -10])  # Default target position
+        self.cursor_world_pos = np.array([0.0, 0.0, -10.0])  # Default target position, updated in place
         
         # Quaternion for weapon rotation (identity quaternion = no rotation)
-        self.quaternion = np.array([1.0, 0.0, 0.0, 0.0])  # [w, x, y, z]
+        self.quaternion = np.array([1.0, 0.0, 0.0, 0.0])  # [w, x, y, z], written in place every frame
+        
+        # Rotation handed to glMultMatrixf, column-major: row i of the buffer is matrix column i
+        self._gl_matrix = np.identity(4, dtype=np.float32)
         
-        # Separate yaw and roll quaternions
-        self.yaw_quaternion = np.array([1.0, 0.0, 0.0, 0.0])    # Rotation around Y-axis
-        self.roll_quaternion = np.array([1.0, 0.0, 0.0, 0.0])   # Rotation around Z-axis
+        # Barrel tip and firing direction from the last orientation update
+        self._tip_pos = (0.0, 0.0, 0.0)
+        self._fire_dir = (0.0, 0.0, -1.0)
         
         # Separate yaw and roll angles (in radians)
         self.yaw_angle = 0.0    # Left/right rotation
@@ -57,8 +65,12 @@ class QuaternionWeapon:
         # Roll sensitivity (replaces pitch sensitivity)
         self.roll_sensitivity = 1.0
         
-        # Debug flag
+        # Frame counters for the periodic debug logging
         self._debug_counter = 0
+        self._debug_tip_counter = 0
+        
+        # Compile the pose kernel now rather than on the first frame
+        self.calculate_weapon_orientation()
         
     def update_full_aruco_data(self, full_data):
         """Update weapon using complete ArUco detection data including rotation and distance"""
@@ -76,15 +88,17 @@ class QuaternionWeapon:
         if distance_to_cam <= 0.01:
             distance_to_cam = self.default_distance_to_cam
         
-        # Calculate weapon offset based on ArUco data
-        self.weapon_offset = self.base_weapon_offset.copy()
+        # Calculate weapon offset based on ArUco data, written in place
+        offset = self.weapon_offset
+        base = self.base_weapon_offset
         
         # Apply horizontal position offset (left-right movement based on d value)
-        self.weapon_offset[0] += position_offset * self.position_sensitivity
+        offset[0] = base[0] + position_offset * self.position_sensitivity
+        offset[1] = base[1]
         
         # Apply distance-based Z offset (forward-back movement)
         distance_offset = (distance_to_cam - self.default_distance_to_cam) * self.distance_sensitivity
-        self.weapon_offset[2] += (distance_offset * 10) + 3
+        offset[2] = base[2] + (distance_offset * 10) + 3
         
         # Calculate separate yaw and roll angles
         # Yaw: horizontal rotation (left-right aiming)
@@ -95,21 +109,24 @@ class QuaternionWeapon:
         self.roll_angle = -(math.radians(rotation_angle) + roll_offset) * self.roll_sensitivity
         
         # Calculate target position using yaw only (no pitch, weapon aims horizontally)
-        weapon_world_pos = np.array(self.camera_pos) + self.weapon_offset
+        cam = self.camera_pos
         
         # Apply yaw to calculate horizontal target position
-        target_x = weapon_world_pos[0] + (math.cos(self.yaw_angle) * self.target_distance)
-        target_y = weapon_world_pos[1]  # Same height as weapon
-        target_z = weapon_world_pos[2] - (math.sin(self.yaw_angle) * self.target_distance)
+        target_x = cam[0] + offset[0] + (math.cos(self.yaw_angle) * self.target_distance)
+        target_y = cam[1] + offset[1]  # Same height as weapon
+        target_z = cam[2] + offset[2] - (math.sin(self.yaw_angle) * self.target_distance)
         
-        self.cursor_world_pos = np.array([target_x, target_y, target_z])
+        cursor = self.cursor_world_pos
+        cursor[0] = target_x
+        cursor[1] = target_y
+        cursor[2] = target_z
         
-        # Debug output
+        # Debug output, formatted only when DEBUG logging is on
         self._debug_counter += 1
-        if self._debug_counter % 30 == 0:  # Print every 0.5 seconds at 60 FPS
-            print(f"Yaw: {math.degrees(self.yaw_angle):.1f}°, Roll: {math.degrees(self.roll_angle):.1f}°")
-            print(f"Distance: {distance_to_cam:.2f}m, Pos offset: {position_offset:.3f}")
-            print(f"Target: ({target_x:.1f}, {target_y:.1f}, {target_z:.1f})")
+        if self._debug_counter % 30 == 0 and log.isEnabledFor(logging.DEBUG):  # Every 0.5 seconds at 60 FPS
+            log.debug("Yaw: %.1f°, Roll: %.1f°", math.degrees(self.yaw_angle), math.degrees(self.roll_angle))
+            log.debug("Distance: %.2fm, Pos offset: %.3f", distance_to_cam, position_offset)
+            log.debug("Target: (%.1f, %.1f, %.1f)", target_x, target_y, target_z)
     
     def update_aruco_geometry(self, geometry_data):
         """Update weapon using geometry calculations from ArUco detection"""
@@ -133,129 +150,76 @@ class QuaternionWeapon:
         self.update_full_aruco_data(geometry_data)
     
     def calculate_weapon_orientation(self):
-        """Calculate weapon orientation using separate yaw and roll quaternions"""
-        weapon_pos = np.array(self.camera_pos) + self.weapon_offset
-        
-        direction = self.cursor_world_pos - weapon_pos
-        direction_norm = np.linalg.norm(direction)
-        
-        if direction_norm < 0.001:
-            self.quaternion = np.array([1.0, 0.0, 0.0, 0.0])
-            self.yaw_quaternion = np.array([1.0, 0.0, 0.0, 0.0])
-            self.roll_quaternion = np.array([1.0, 0.0, 0.0, 0.0])
-            return
-            
-        direction = direction / direction_norm
-        
-        # Calculate yaw (rotation around Y-axis)
-        # Project direction onto XZ plane
-        xz_direction = np.array([direction[0], 0, direction[2]])
-        xz_norm = np.linalg.norm(xz_direction)
-        
-        if xz_norm > 0.001:
-            xz_direction = xz_direction / xz_norm
-            # Calculate yaw angle from forward vector [0, 0, -1]
-            yaw = math.atan2(-xz_direction[0], -xz_direction[2])
-            
-            # Create yaw quaternion (rotation around Y-axis)
-            half_yaw = yaw / 2.0
-            self.yaw_quaternion = np.array([
-                math.cos(half_yaw),
-                0.0,
-                math.sin(half_yaw),
-                0.0
-            ])
-        else:
-            self.yaw_quaternion = np.array([1.0, 0.0, 0.0, 0.0])
-        
-        # Create roll quaternion (rotation around Z-axis)
-        # Roll rotates the weapon around its forward-facing axis
-        half_roll = self.roll_angle / 2.0
-        self.roll_quaternion = np.array([
-            math.cos(half_roll),
-            0.0,
-            0.0,
-            math.sin(half_roll)
-        ])
-        
-        # Combine quaternions: first yaw, then roll
-        # Order matters! We apply yaw first, then roll around the new forward axis
-        self.quaternion = self.multiply_quaternions(self.yaw_quaternion, self.roll_quaternion)
-        
-        # Normalize final quaternion
-        quat_norm = np.linalg.norm(self.quaternion)
-        if quat_norm > 0:
-            self.quaternion = self.quaternion / quat_norm
+        """Calculate weapon orientation (yaw towards the target, then roll), barrel tip and firing direction"""
+        cam = self.camera_pos
+        offset = self.weapon_offset
+        target = self.cursor_world_pos
+        tip = self.barrel_tip_offset
+        q, self._tip_pos, self._fire_dir = weapon_pose(
+            float(cam[0]), float(cam[1]), float(cam[2]),
+            float(offset[0]), float(offset[1]), float(offset[2]),
+            float(target[0]), float(target[1]), float(target[2]),
+            float(self.roll_angle), float(tip[0]), float(tip[1]), float(tip[2]))
+        self.quaternion[:] = q
     
-    def multiply_quaternions(self, q1, q2):
-        """Multiply two quaternions q1 * q2"""
-        w1, x1, y1, z1 = q1
-        w2, x2, y2, z2 = q2
-        
-        return np.array([
-            w1*w2 - x1*x2 - y1*y2 - z1*z2,
-            w1*x2 + x1*w2 + y1*z2 - z1*y2,
-            w1*y2 - x1*z2 + y1*w2 + z1*x2,
-            w1*z2 + x1*y2 - y1*x2 + z1*w2
-        ])
-    
-    def quaternion_to_matrix(self, q):
-        """Convert quaternion to rotation matrix"""
+    def quaternion_to_matrix(self, q, out=None):
+        """
+        Convert quaternion to rotation matrix.
+        With out, write its transpose (column-major, as OpenGL reads it) into the 3x3 block of
+        that 4x4 buffer instead of allocating; the rest of out is left as it is.
+        """
         w, x, y, z = q
         
         norm = math.sqrt(w*w + x*x + y*y + z*z)
         if norm > 0:
             w, x, y, z = w/norm, x/norm, y/norm, z/norm
         
+        m00, m01, m02 = 1 - 2*y*y - 2*z*z, 2*x*y - 2*w*z,     2*x*z + 2*w*y
+        m10, m11, m12 = 2*x*y + 2*w*z,     1 - 2*x*x - 2*z*z, 2*y*z - 2*w*x
+        m20, m21, m22 = 2*x*z - 2*w*y,     2*y*z + 2*w*x,     1 - 2*x*x - 2*y*y
+        
+        if out is not None:
+            out[0, 0], out[0, 1], out[0, 2] = m00, m10, m20
+            out[1, 0], out[1, 1], out[1, 2] = m01, m11, m21
+            out[2, 0], out[2, 1], out[2, 2] = m02, m12, m22
+            return out
+        
         matrix = np.array([
-            [1 - 2*y*y - 2*z*z, 2*x*y - 2*w*z,     2*x*z + 2*w*y,     0],
-            [2*x*y + 2*w*z,     1 - 2*x*x - 2*z*z, 2*y*z - 2*w*x,     0],
-            [2*x*z - 2*w*y,     2*y*z + 2*w*x,     1 - 2*x*x - 2*y*y, 0],
-            [0,                 0,                 0,                 1]
+            [m00, m01, m02, 0],
+            [m10, m11, m12, 0],
+            [m20, m21, m22, 0],
+            [0,   0,   0,   1]
         ])
         
         return matrix
     
     def get_weapon_tip_position(self):
         """Get the position of the weapon tip (barrel end) in world coordinates"""
-        weapon_pos = np.array(self.camera_pos) + self.weapon_offset
-        
-        rotation_matrix = self.quaternion_to_matrix(self.quaternion)
-        rotated_tip_offset = (rotation_matrix[:3, :3] @ self.barrel_tip_offset)
+        tip_position = np.array(self._tip_pos)
         
-        tip_position = weapon_pos + rotated_tip_offset
-        
-        if hasattr(self, '_debug_tip_counter'):
-            self._debug_tip_counter += 1
-        else:
-            self._debug_tip_counter = 0
-            
-        if self._debug_tip_counter % 60 == 0:
-            print(f"Weapon tip position: ({tip_position[0]:.2f}, {tip_position[1]:.2f}, {tip_position[2]:.2f})")
-            print(f"Yaw: {math.degrees(self.yaw_angle):.1f}°, Roll: {math.degrees(self.roll_angle):.1f}°")
+        if self._debug_tip_counter % 60 == 0 and log.isEnabledFor(logging.DEBUG):
+            log.debug("Weapon tip position: (%.2f, %.2f, %.2f)", *self._tip_pos)
+            log.debug("Yaw: %.1f°, Roll: %.1f°", math.degrees(self.yaw_angle), math.degrees(self.roll_angle))
+        self._debug_tip_counter += 1
         
         return tip_position
     
     def get_firing_direction(self):
         """Get the direction from weapon tip to ArUco target"""
-        tip_pos = self.get_weapon_tip_position()
-        direction = self.cursor_world_pos - tip_pos
-        norm = np.linalg.norm(direction)
-        if norm > 0:
-            return direction / norm
-        else:
-            return np.array([0, 0, -1])
+        return np.array(self._fire_dir)
     
-    def apply_weapon_transform(self):
-        """Apply the weapon transformation for rendering"""
+    def apply_weapon_transform(self, quaternion=None):
+        """Apply the weapon transformation for rendering (optionally with an override orientation)"""
+        if quaternion is None:
+            quaternion = self.quaternion
+        
         glPushMatrix()
         
-        weapon_world_pos = np.array(self.camera_pos) + self.weapon_offset
-        glTranslatef(weapon_world_pos[0], weapon_world_pos[1], weapon_world_pos[2])
+        cam = self.camera_pos
+        offset = self.weapon_offset
+        glTranslatef(cam[0] + offset[0], cam[1] + offset[1], cam[2] + offset[2])
         
-        rotation_matrix = self.quaternion_to_matrix(self.quaternion)
-        gl_matrix = rotation_matrix.flatten(order='F')
-        glMultMatrixf(gl_matrix.astype(np.float32))
+        glMultMatrixf(self.quaternion_to_matrix(quaternion, out=self._gl_matrix))
         
         return True
     
@@ -305,6 +269,7 @@ class QuaternionWeapon:
     def calibrate_barrel_tip_offset(self, x_offset, y_offset, z_offset):
         """Allow runtime calibration of barrel tip position"""
         self.barrel_tip_offset = np.array([x_offset, y_offset, z_offset])
+        self.calculate_weapon_orientation()  # Move the cached tip and firing direction with it
         print(f"Barrel tip offset updated to: ({x_offset:.2f}, {y_offset:.2f}, {z_offset:.2f})")
         
     def calibrate_position_sensitivity(self, sensitivity):
@@ -324,5 +289,7 @@ class QuaternionWeapon:
         
     def set_weapon_forward_direction(self, forward_vector):
         """Allow setting the weapon's forward direction for different models"""
-        self.weapon_forward = np.array(forward_vector) / np.linalg.norm(forward_vector)
+        x, y, z = forward_vector
+        inv_len = 1.0 / math.sqrt(x*x + y*y + z*z)
+        self.weapon_forward = np.array([x * inv_len, y * inv_len, z * inv_len])
         print(f"Weapon forward direction set to: {self.weapon_forward}")
\ No newline at end of file
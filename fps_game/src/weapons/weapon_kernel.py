@@ -0,0 +1,77 @@
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _rotate_vec_by_quat(qw, qx, qy, qz, vx, vy, vz):
+    """Rotate (vx, vy, vz) by the unit quaternion, v + w*t + u x t with t = 2 * (u x v)"""
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+    return (vx + qw * tx + (qy * tz - qz * ty),
+            vy + qw * ty + (qz * tx - qx * tz),
+            vz + qw * tz + (qx * ty - qy * tx))
+
+def weapon_pose(cam_x, cam_y, cam_z, off_x, off_y, off_z, target_x, target_y, target_z,
+                roll, tip_x, tip_y, tip_z):
+    """
+    Orientation, barrel tip and firing direction of a weapon at camera + offset aiming at the target.
+    Returns the quaternion (w, x, y, z), the tip position (x, y, z) and the unit firing direction (x, y, z).
+    """
+    pos_x = cam_x + off_x
+    pos_y = cam_y + off_y
+    pos_z = cam_z + off_z
+
+    qw, qx, qy, qz = 1.0, 0.0, 0.0, 0.0
+    dx = target_x - pos_x
+    dy = target_y - pos_y
+    dz = target_z - pos_z
+    dir_norm = math.sqrt(dx * dx + dy * dy + dz * dz)
+    if dir_norm >= 0.001:
+        dx /= dir_norm
+        dz /= dir_norm
+
+        # Yaw around y from the forward vector (0, 0, -1), on the direction projected onto xz
+        cy, sy = 1.0, 0.0
+        if math.sqrt(dx * dx + dz * dz) > 0.001:
+            half_yaw = math.atan2(-dx, -dz) / 2.0
+            cy = math.cos(half_yaw)
+            sy = math.sin(half_yaw)
+
+        # Roll around z, applied after the yaw: (cy, 0, sy, 0) * (cr, 0, 0, sr)
+        half_roll = roll / 2.0
+        cr = math.cos(half_roll)
+        sr = math.sin(half_roll)
+        qw, qx, qy, qz = cy * cr, sy * sr, sy * cr, cy * sr
+        q_norm = math.sqrt(qw * qw + qx * qx + qy * qy + qz * qz)
+        qw /= q_norm
+        qx /= q_norm
+        qy /= q_norm
+        qz /= q_norm
+
+    # Barrel tip: rotate the model offset by the quaternion
+    rx, ry, rz = _rotate_vec_by_quat(qw, qx, qy, qz, tip_x, tip_y, tip_z)
+    tip_pos_x = pos_x + rx
+    tip_pos_y = pos_y + ry
+    tip_pos_z = pos_z + rz
+
+    # Firing direction from the tip to the target, straight ahead if they coincide
+    fx = target_x - tip_pos_x
+    fy = target_y - tip_pos_y
+    fz = target_z - tip_pos_z
+    fire_norm = math.sqrt(fx * fx + fy * fy + fz * fz)
+    if fire_norm > 0.0:
+        fx /= fire_norm
+        fy /= fire_norm
+        fz /= fire_norm
+    else:
+        fx, fy, fz = 0.0, 0.0, -1.0
+
+    return (qw, qx, qy, qz), (tip_pos_x, tip_pos_y, tip_pos_z), (fx, fy, fz)
+
+if NUMBA_AVAILABLE:
+    _rotate_vec_by_quat = njit(cache=True)(_rotate_vec_by_quat)  # Before weapon_pose, which calls it
+    weapon_pose = njit(cache=True)(weapon_pose)
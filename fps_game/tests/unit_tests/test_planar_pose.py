@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.vision.planar_pose import square_poses
+
+def _axis_angle_matrix(w):
+    theta = np.linalg.norm(w)
+    k = np.array([[0.0, -w[2], w[1]], [w[2], 0.0, -w[0]], [-w[1], w[0], 0.0]]) / theta
+    return np.eye(3) + np.sin(theta) * k + (1.0 - np.cos(theta)) * k @ k
+
+def test_square_poses_recovers_projected_markers():
+    """Poses solved from exactly projected corners should match the poses they came from"""
+    rng = np.random.default_rng(0)
+    K = np.array([[800.0, 0.0, 640.0], [0.0, 810.0, 360.0], [0.0, 0.0, 1.0]])
+    half = 0.015
+    objp = np.array([[-half, half, 0.0], [half, half, 0.0], [half, -half, 0.0], [-half, -half, 0.0]])
+
+    rotations, translations, corners = [], [], []
+    for _ in range(20):
+        # Facing the camera (flipped about x) with a random tilt
+        R = _axis_angle_matrix(np.array([np.pi, 0.0, 0.0])) @ _axis_angle_matrix(rng.normal(0.0, 0.5, 3))
+        t = np.array([rng.uniform(-0.2, 0.2), rng.uniform(-0.1, 0.1), rng.uniform(0.3, 1.5)])
+        projected = (objp @ R.T + t) @ K.T
+        rotations.append(R)
+        translations.append(t)
+        corners.append(projected[:, :2] / projected[:, 2:])
+
+    R, t = square_poses(np.array(corners), K, half)
+
+    np.testing.assert_allclose(R, rotations, atol=1e-9)
+    np.testing.assert_allclose(t, translations, atol=1e-9)
+
+def test_square_poses_isolates_degenerate_markers():
+    """A collapsed quad gives a NaN pose without failing the markers detected with it"""
+    K = np.array([[800.0, 0.0, 640.0], [0.0, 800.0, 360.0], [0.0, 0.0, 1.0]])
+    good = np.array([[600.0, 320.0], [680.0, 320.0], [680.0, 400.0], [600.0, 400.0]])
+    collapsed = np.full((4, 2), 500.0)
+
+    R, t = square_poses(np.array([good, collapsed, good]), K, 0.015)
+
+    assert np.isfinite(R[[0, 2]]).all() and np.isfinite(t[[0, 2]]).all()
+    assert np.isnan(t[1]).all()
+    np.testing.assert_allclose(t[0], [0.0, 0.0, 0.3], atol=1e-9)
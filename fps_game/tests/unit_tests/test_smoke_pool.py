@@ -0,0 +1,31 @@
+import numpy as np
+
+from src.systems.smoke_pool import SmokePool
+
+def test_spawn_drops_oldest_when_full():
+    """Spawning past capacity should keep only the newest particles"""
+    pool = SmokePool(capacity=5)
+    pool.birth_time[pool.spawn(4)] = [0.0, 1.0, 2.0, 3.0]
+    pool.birth_time[pool.spawn(3)] = [4.0, 5.0, 6.0]
+
+    assert len(pool) == 5
+    assert sorted(pool.birth_time[:5]) == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+def test_update_removes_expired_and_moves_survivors():
+    """Expired particles are compacted away and the rest integrate one step"""
+    pool = SmokePool(capacity=4)
+    new = pool.spawn(3)
+    pool.birth_time[new] = [0.0, 9.0, 9.5]
+    pool.max_life[new] = 1.0
+    pool.max_size[new] = 0.3
+    pool.velocity[new] = (1.0, 0.0, 0.0)
+    dt = 0.1
+
+    pool.update(10.0, dt)
+
+    assert len(pool) == 1
+    assert pool.birth_time[0] == 9.5
+    np.testing.assert_allclose(pool.position[0], (0.1, 0.0, 0.0), atol=1e-6)
+    drag = 0.98 ** (dt * 60.0)
+    np.testing.assert_allclose(pool.velocity[0], (drag, 2.0 * dt * drag, 0.0), atol=1e-6)
+    np.testing.assert_allclose(pool.size[0], 0.3 * (0.1 + 0.9 * 0.5), atol=1e-6)
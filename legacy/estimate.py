@@ -5,6 +5,9 @@ from collections import deque
 import json
 import os
 
+# convertScaleAbs(alpha=1.2, beta=20) as a lookup table for the detection frame
+_BRIGHTEN_LUT = np.clip(np.rint(np.arange(256) * 1.2 + 20), 0, 255).astype(np.uint8)
+
 class Estimate:
     MARKER_SIZE_M = 0.03
     WIDTH = 1280
@@ -46,10 +49,14 @@ class Estimate:
             [ half,  half, 0.0],  # TR
             [ half, -half, 0.0],  # BR
             [-half, -half, 0.0],  # BL
-        ], dtype=np.float32)
+        ], dtype=np.float64)  # Same dtype as K so solvePnP doesn't convert per call
+        # solvePnP writes the pose into these instead of allocating new arrays per marker
+        self._rvec = np.zeros((3, 1), dtype=np.float64)
+        self._tvec = np.zeros((3, 1), dtype=np.float64)
         
         self.quaternion = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
         self.in_game_deg = 90.0  # Default to center position
+        self._gauge_cache = {}  # radius -> (major, minor) tick endpoint offsets
 
     def draw_semi_gauge(
         self,
@@ -73,7 +80,7 @@ class Estimate:
             return frame
 
         # Clamp and norm
-        val = float(np.clip(value_deg, min_deg, max_deg))
+        val = max(min_deg, min(max_deg, float(value_deg)))
         # Map value to angle on screen: left = 180°, right = 0°, top = 90°
         # We'll render arc from 180° to 0° (OpenCV uses degrees, 0° = +x axis, counter-clockwise positive)
         def val_to_screen_deg(v):
@@ -85,56 +92,59 @@ class Estimate:
                     angle=0, startAngle=180, endAngle=0,
                     color=color_arc, thickness=thickness_arc, lineType=cv2.LINE_AA)
 
-        major_ticks = 5
-        minor_per_major = 4
-        for i in range(major_ticks + 1):
-            scr_deg = 180.0 - (180.0 * i / major_ticks)
-            ang = np.deg2rad(scr_deg)
-            r1 = radius - 2
-            r2 = radius - 16
-            x1 = int(x0 + r1 * np.cos(ang))
-            y1 = int(y0 - r1 * np.sin(ang))
-            x2 = int(x0 + r2 * np.cos(ang))
-            y2 = int(y0 - r2 * np.sin(ang))
-            cv2.line(frame, (x1, y1), (x2, y2), color_tick, 2, cv2.LINE_AA)
-
-            # Minor ticks between majors
-            if i < major_ticks:
-                for m in range(1, minor_per_major):
-                    frac = (i + m / minor_per_major) / major_ticks
-                    scr_deg_m = 180.0 - 180.0 * frac
-                    angm = np.deg2rad(scr_deg_m)
-                    rm1 = radius - 2
-                    rm2 = radius - 10
-                    xm1 = int(x0 + rm1 * np.cos(angm))
-                    ym1 = int(y0 - rm1 * np.sin(angm))
-                    xm2 = int(x0 + rm2 * np.cos(angm))
-                    ym2 = int(y0 - rm2 * np.sin(angm))
-                    cv2.line(frame, (xm1, ym1), (xm2, ym2), color_tick, 1, cv2.LINE_AA)
+        ticks = self._gauge_cache.get(radius)
+        if ticks is None:
+            ticks = self._gauge_cache[radius] = self._gauge_tick_offsets(radius)
+        major, minor = ticks
+        for x1, y1, x2, y2 in major:
+            cv2.line(frame, (int(x0 + x1), int(y0 + y1)), (int(x0 + x2), int(y0 + y2)), color_tick, 2, cv2.LINE_AA)
+        for x1, y1, x2, y2 in minor:
+            cv2.line(frame, (int(x0 + x1), int(y0 + y1)), (int(x0 + x2), int(y0 + y2)), color_tick, 1, cv2.LINE_AA)
 
         # Needle
         scr_deg_val = val_to_screen_deg(val)
-        angv = np.deg2rad(scr_deg_val)
+        angv = math.radians(scr_deg_val)
         r_need = radius - 20
-        xn = int(x0 + r_need * np.cos(angv))
-        yn = int(y0 - r_need * np.sin(angv))
+        xn = int(x0 + r_need * math.cos(angv))
+        yn = int(y0 - r_need * math.sin(angv))
         cv2.line(frame, (x0, y0), (xn, yn), color_needle, 3, cv2.LINE_AA)
         cv2.circle(frame, (x0, y0), 5, color_needle, -1, cv2.LINE_AA)
 
+    @staticmethod
+    def _gauge_tick_offsets(radius, major_ticks=5, minor_per_major=4):
+        """(x1, y1, x2, y2) pixel offsets from the gauge center for the major and minor ticks"""
+        def offsets(frac, r1, r2):
+            ang = np.deg2rad(180.0 - 180.0 * frac)
+            cos, sin = np.cos(ang), np.sin(ang)
+            return np.stack([r1 * cos, -r1 * sin, r2 * cos, -r2 * sin], axis=1).tolist()
+
+        major_frac = np.arange(major_ticks + 1) / major_ticks
+        # Minor ticks between majors
+        minor_frac = (np.arange(major_ticks)[:, None] + np.arange(1, minor_per_major) / minor_per_major) / major_ticks
+        return (offsets(major_frac, radius - 2, radius - 16),
+                offsets(minor_frac.reshape(-1), radius - 2, radius - 10))
+
     def get_inplane_angle(self, rvec):
         """Return marker orientation about camera Z-axis in degrees [-180, 180]."""
-        R, _ = cv2.Rodrigues(rvec)
-        angle_rad = math.atan2(R[1,0], R[0,0])
+        # Only R[0,0] and R[1,0] of the Rodrigues matrix are needed, build just those two
+        rx, ry, rz = rvec.ravel().tolist()
+        theta2 = rx*rx + ry*ry + rz*rz
+        if theta2 < 1e-18:
+            return 0.0
+        theta = math.sqrt(theta2)
+        k = (1.0 - math.cos(theta)) / theta2
+        s = math.sin(theta) / theta
+        angle_rad = math.atan2(rz*s + rx*ry*k, 1.0 - (ry*ry + rz*rz)*k)
         angle_deg = math.degrees(angle_rad)
         return angle_deg # [-180, 180]
 
     # Estimate distance (z) from marker to cam
     def get_distance(self, c):
-        TL, TR, BR, BL = c
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = c.tolist()  # TL, TR, BR, BL
 
-        # Average side length in pixels
-        side_px = (np.linalg.norm(TR-TL) + np.linalg.norm(TR-BR) +
-                np.linalg.norm(BR-BL) + np.linalg.norm(BL-TL)) / 4.0
+        # Average side length in pixels, on plain floats rather than four tiny arrays
+        side_px = (math.hypot(x1 - x0, y1 - y0) + math.hypot(x1 - x2, y1 - y2) +
+                math.hypot(x2 - x3, y2 - y3) + math.hypot(x3 - x0, y3 - y0)) / 4.0
 
         fx = self.K[0,0]  # Focal length in pixels
         # Pinhole model: size_in_pixels = (f * real_size) / Z
@@ -157,16 +167,18 @@ class Estimate:
         gauge_deg = self.in_game_deg - 90
         self.draw_semi_gauge(frame, value_deg=gauge_deg)
         
-    def get_measurements(self, frame):
-        corners, ids, _ = self.detector.detectMarkers(frame)
+    def get_measurements(self, frame, gray=None):
+        # Markers are found on luma only, a prepared grayscale frame saves the detector converting
+        corners, ids, _ = self.detector.detectMarkers(frame if gray is None else gray)
 
         if ids is not None and len(ids) > 0:
             self.aruco.drawDetectedMarkers(frame, corners, ids)
 
             for c in corners:
-                c = c.reshape(-1, 2).astype(np.float32)
+                c = np.ascontiguousarray(c.reshape(-1, 2), dtype=np.float32)  # No copy, detectMarkers gives float32
                 # rvec is rotation vector (stores rotation of aruco relative to cam), tvec is translation vector relative to camera
-                ok_pnp, rvec, tvec = cv2.solvePnP(self.objp, c, self.K, self.dist, flags=cv2.SOLVEPNP_IPPE_SQUARE)
+                ok_pnp, rvec, tvec = cv2.solvePnP(self.objp, c, self.K, self.dist, self._rvec, self._tvec,
+                                                  flags=cv2.SOLVEPNP_IPPE_SQUARE)
                 if ok_pnp:  # Only process if pose estimation was successful
                     self.get_degree_in_game(rvec, tvec, frame)
         else:
@@ -187,9 +199,11 @@ if __name__ == "__main__":
     
     while True:
         _, frame = cap.read()
-        frame = cv2.flip(frame, 1)
-        frame = cv2.convertScaleAbs(frame, alpha=1.2, beta=20)
-        frame = estimator.get_measurements(frame)
+        cv2.flip(frame, 1, dst=frame)  # Mirror in place, the frame is ours
+        # Brighten only the grayscale copy used for detection (a third of the pixels), by table lookup
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        cv2.LUT(gray, _BRIGHTEN_LUT, dst=gray)
+        frame = estimator.get_measurements(frame, gray)
 
         cv2.imshow("Cam Feed", frame)
 
@@ -6,6 +6,14 @@ import json
 import os
 from src.vision.geometry_viewer import GeometryViewer
 
+# Unit circle [cos, sin] in 256 steps (plus the closing point), sliced to draw the alpha arc
+_ARC_STEPS = 256
+_ARC_PHIS = np.linspace(0, 2 * np.pi, _ARC_STEPS + 1)
+_UNIT_ARC = np.stack([np.cos(_ARC_PHIS), np.sin(_ARC_PHIS)], axis=1)
+
+# convertScaleAbs(alpha=1.2, beta=20) as a lookup table for the detection frame
+_BRIGHTEN_LUT = np.clip(np.rint(np.arange(256) * 1.2 + 20), 0, 255).astype(np.uint8)
+
 class Estimate:
     MARKER_SIZE_M = 0.03
     WIDTH = 1280
@@ -44,12 +52,19 @@ class Estimate:
             [ half,  half, 0.0],  # TR
             [ half, -half, 0.0],  # BR
             [-half, -half, 0.0],  # BL
-        ], dtype=np.float32)
+        ], dtype=np.float64)  # Same dtype as K so solvePnP doesn't convert per call
+        # solvePnP writes the pose into these instead of allocating new arrays per marker
+        self._rvec = np.zeros((3, 1), dtype=np.float64)
+        self._tvec = np.zeros((3, 1), dtype=np.float64)
         
         self.quaternion = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
         self.d, self.alpha = 0, 0
         
         self.viewer = GeometryViewer("Degree and Pos Visualizer")
+        
+        # Scratch buffers for the alpha arc in draw_semi_gauge
+        self._arc_buf = np.empty_like(_UNIT_ARC)
+        self._arc_pts = np.empty(_UNIT_ARC.shape, dtype=np.int32)
 
     def draw_semi_gauge(
         self,
@@ -75,38 +90,28 @@ class Estimate:
             P_x = center_x + (d/r)*radius_px, P_y = center_y.
         - Arc starts at the TOP of the circle; arc_deg ∈ [-90, +90] like your mapping.
         """
-        import numpy as np
-        import cv2
         x0, y0 = center
 
         # --- helper: map arc_deg in [-90..+90] to screen angle in [180..0]
         # (OpenCV ellipse: 0° = +x axis, CCW positive; top is 90°)
         t = (arc_deg - (-90.0)) / (180.0)      # normalize -90..+90 to 0..1
         scr_end_deg = 180.0 * (1.0 - t)        # 180..0
-        scr_end_deg = float(np.clip(scr_end_deg, 0.0, 180.0))
+        scr_end_deg = max(0.0, min(180.0, scr_end_deg))
 
         # --- circle outline (semi only)
         cv2.ellipse(frame, (x0, y0), (radius_px, radius_px),
                     angle=0, startAngle=180, endAngle=0,
                     color=color_circle, thickness=2, lineType=cv2.LINE_AA)
 
-        # --- draw the arc from top (180→90) continuing to scr_end_deg
-        # Split in two segments to handle left/right halves cleanly
-        if scr_end_deg <= 90:
-            # left half (180→90) then (90→scr_end_deg)
-            cv2.ellipse(frame, (x0, y0), (radius_px, radius_px),
-                        0, 180, 90, color_arc, 4, cv2.LINE_AA)
-            cv2.ellipse(frame, (x0, y0), (radius_px, radius_px),
-                        0, 90, scr_end_deg, color_arc, 4, cv2.LINE_AA)
-        else:
-            # arc goes only within left half
-            cv2.ellipse(frame, (x0, y0), (radius_px, radius_px),
-                        0, 180, scr_end_deg, color_arc, 4, cv2.LINE_AA)
+        # --- draw the arc from the left end (180) through the top (90) to scr_end_deg,
+        # one call covers both halves since OpenCV orders start and end itself
+        cv2.ellipse(frame, (x0, y0), (radius_px, radius_px),
+                    0, 180, scr_end_deg, color_arc, 4, cv2.LINE_AA)
 
         # --- compute arc end point E in pixels from screen angle
-        ang = np.deg2rad(scr_end_deg)
-        Ex = int(round(x0 + radius_px * np.cos(ang)))
-        Ey = int(round(y0 - radius_px * np.sin(ang)))  # y down
+        ang = math.radians(scr_end_deg)
+        Ex = int(round(x0 + radius_px * math.cos(ang)))
+        Ey = int(round(y0 - radius_px * math.sin(ang)))  # y down
 
         # --- compute P=(d,0) mapped to pixels along the diameter
         # scale d/r by radius_px
@@ -121,15 +126,15 @@ class Estimate:
         # --- draw small angle alpha at P, measured from the diameter (x-axis) toward chord
         # alpha_rad is in standard math coords; image y is down → use y0 - sin()
         small_r = max(8, int(0.12 * radius_px))
-        # determine direction sign from alpha
-        steps = 24
-        phis = np.linspace(0, alpha_rad, steps)  # 0 is along +x; positive alpha is CCW (up)
-        arc_pts = np.stack([
-            Px + small_r * np.cos(phis),
-            Py - small_r * np.sin(phis)  # y down
-        ], axis=1).astype(np.int32)
-        if len(arc_pts) >= 2:
-            cv2.polylines(frame, [arc_pts], isClosed=False, color=color_angle, thickness=2, lineType=cv2.LINE_AA)
+        # 0 is along +x; positive alpha is CCW (up), negative mirrors the unit arc below the axis
+        n = max(1, min(_ARC_STEPS, int(round(abs(alpha_rad) / (2 * np.pi) * _ARC_STEPS))))
+        sin_scale = -small_r if alpha_rad >= 0 else small_r  # y down
+        buf = self._arc_buf[:n + 1]
+        np.multiply(_UNIT_ARC[:n + 1], (small_r, sin_scale), out=buf)
+        buf += (Px, Py)
+        arc_pts = self._arc_pts[:n + 1]
+        arc_pts[...] = buf  # Truncates like astype(np.int32)
+        cv2.polylines(frame, [arc_pts], isClosed=False, color=color_angle, thickness=2, lineType=cv2.LINE_AA)
         cv2.circle(frame, (Px, Py), 3, color_angle, -1, cv2.LINE_AA)
 
         return frame
@@ -137,18 +142,25 @@ class Estimate:
 
     def get_inplane_angle(self, rvec):
         """Return marker orientation about camera Z-axis in degrees [-180, 180]."""
-        R, _ = cv2.Rodrigues(rvec)
-        angle_rad = math.atan2(R[1,0], R[0,0])
+        # Only R[0,0] and R[1,0] of the Rodrigues matrix are needed, build just those two
+        rx, ry, rz = rvec.ravel().tolist()
+        theta2 = rx*rx + ry*ry + rz*rz
+        if theta2 < 1e-18:
+            return 0.0
+        theta = math.sqrt(theta2)
+        k = (1.0 - math.cos(theta)) / theta2
+        s = math.sin(theta) / theta
+        angle_rad = math.atan2(rz*s + rx*ry*k, 1.0 - (ry*ry + rz*rz)*k)
         angle_deg = math.degrees(angle_rad)
         return angle_deg # [-180, 180]
 
     # Estimate distance (z) from marker to cam
     def get_distance(self, c):
-        TL, TR, BR, BL = c
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = c.tolist()  # TL, TR, BR, BL
 
-        # Average side length in pixels
-        side_px = (np.linalg.norm(TR-TL) + np.linalg.norm(TR-BR) +
-                np.linalg.norm(BR-BL) + np.linalg.norm(BL-TL)) / 4.0
+        # Average side length in pixels, on plain floats rather than four tiny arrays
+        side_px = (math.hypot(x1 - x0, y1 - y0) + math.hypot(x1 - x2, y1 - y2) +
+                math.hypot(x2 - x3, y2 - y3) + math.hypot(x3 - x0, y3 - y0)) / 4.0
 
         fx = self.K[0,0]  # Focal length in pixels
         # Pinhole model: size_in_pixels = (f * real_size) / Z
@@ -168,17 +180,19 @@ class Estimate:
         self.d = (x / self.WIDTH * r - r / 2) * artistic
         arc_deg = x / self.WIDTH * 180 - 90
       
-        self.alpha, _ = self.viewer.update(r=0.4, d=self.d, arc_deg=arc_deg)
+        self.alpha, _ = self.viewer.update(r=0.4, d=self.d, arc_deg=arc_deg)  # Plain solve when headless
 
-    def get_measurements(self, frame):
-        corners, ids, _ = self.detector.detectMarkers(frame)
+    def get_measurements(self, frame, gray=None):
+        # Markers are found on luma only, a prepared grayscale frame saves the detector converting
+        corners, ids, _ = self.detector.detectMarkers(frame if gray is None else gray)
         
         if ids is not None and len(ids) > 0:
             self.aruco.drawDetectedMarkers(frame, corners, ids)
             for c in corners:
-                c = c.reshape(-1, 2).astype(np.float32)
+                c = np.ascontiguousarray(c.reshape(-1, 2), dtype=np.float32)  # No copy, detectMarkers gives float32
                 # rvec is rotation vector (stores rotation of aruco relative to cam), tvec is translation vector relative to camera
-                ok_pnp, rvec, tvec = cv2.solvePnP(self.objp, c, self.K, self.dist, flags=cv2.SOLVEPNP_IPPE_SQUARE)
+                ok_pnp, rvec, tvec = cv2.solvePnP(self.objp, c, self.K, self.dist, self._rvec, self._tvec,
+                                                  flags=cv2.SOLVEPNP_IPPE_SQUARE)
                 self.get_degree_in_game(rvec, tvec, frame, ok_pnp)
                 
         return frame
@@ -194,9 +208,11 @@ if __name__ == "__main__":
     
     while True:
         _, frame = cap.read()
-        frame = cv2.flip(frame, 1)
-        frame = cv2.convertScaleAbs(frame, alpha=1.2, beta=20)
-        frame = estimator.get_measurements(frame)
+        cv2.flip(frame, 1, dst=frame)  # Mirror in place, the frame is ours
+        # Brighten only the grayscale copy used for detection (a third of the pixels), by table lookup
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        cv2.LUT(gray, _BRIGHTEN_LUT, dst=gray)
+        frame = estimator.get_measurements(frame, gray)
 
         cv2.imshow("Cam Feed", frame)
 
@@ -24,7 +24,11 @@ class GeometryViewer:
                 self.fig.canvas.manager.set_window_title(title)
                 self.ax.set_aspect('equal', 'box')
                 self.ax.grid(True, linestyle='--', alpha=0.3)
-                self.circle_artist = None
+                # Static artists, drawn into the cached background
+                self.circle_artist = plt.Circle((0,0), 1.0, fill=False, lw=2, color='k')
+                self.ax.add_artist(self.circle_artist)
+                self.ax.axhline(0, color='0.7', lw=1)
+                self.ax.axvline(0, color='0.7', lw=1)
                 self.arc_line, = self.ax.plot([], [], lw=2, color='tab:cyan')
                 self.chord_line, = self.ax.plot([], [], lw=3, color='tab:red')
                 self.P_scatter = self.ax.scatter([], [], s=60, color='tab:red', zorder=3, label='P(d,0)')
@@ -33,6 +37,14 @@ class GeometryViewer:
                 self.text_handle = self.ax.text(0.02, 0.98, "", transform=self.ax.transAxes,
                                                 ha='left', va='top', fontsize=10)
                 self.ax.legend(loc='upper right')
+                # Dynamic artists are left out of full draws and blitted over the background
+                self._dynamic_artists = (self.arc_line, self.chord_line, self.P_scatter,
+                                         self.E_scatter, self.angle_arc, self.text_handle)
+                for artist in self._dynamic_artists:
+                    artist.set_animated(True)
+                self._bg = None
+                self._bg_r = None  # Circle radius the background was drawn for
+                self.fig.canvas.mpl_connect('draw_event', self._on_draw)
                 self.matplotlib_available = True
                 print(f"GeometryViewer: Matplotlib GUI initialized on main thread")
             except Exception as e:
@@ -41,6 +53,10 @@ class GeometryViewer:
         else:
             self.matplotlib_available = False
             print(f"GeometryViewer: Running on background thread - GUI disabled, calculations only")
+        
+        # Headless: the math is all update has to do, skip the display checks on every call
+        if not self.matplotlib_available:
+            self.update = self.solve
 
     @staticmethod
     def _end_angle_from_arc_deg(arc_deg):
@@ -49,54 +65,55 @@ class GeometryViewer:
         # TOP is 90°, moving CW decreases angle -> theta = 90 - arc_deg
         return 90.0 - arc_deg
 
+    @staticmethod
+    def solve(r, d, arc_deg):
+        """Return (alpha, (Ex, Ey)) for the chord from P=(d, 0) to the arc end, plain scalar math"""
+        theta = math.radians(GeometryViewer._end_angle_from_arc_deg(arc_deg))
+        Ex = r * math.cos(theta)
+        Ey = r * math.sin(theta)
+        # Angle alpha at P relative to +x axis
+        return math.atan2(Ey, Ex - d), (Ex, Ey)
+
     def calculate_geometry(self, r, d, arc_deg):
         """Calculate geometry values without updating display - thread-safe"""
-        # Compute arc end E
-        theta_deg = self._end_angle_from_arc_deg(arc_deg)
-        theta = math.radians(theta_deg)
-        Ex, Ey = r*math.cos(theta), r*math.sin(theta)
-
-        # Point P on diameter
-        Px, Py = d, 0.0
-
-        # Angle alpha at P relative to +x axis
-        alpha = math.atan2(Ey - Py, Ex - Px)          # radians
-        alpha_deg = math.degrees(alpha)
-        
-        return alpha, (Ex, Ey), alpha_deg
+        alpha, end_point = self.solve(r, d, arc_deg)
+        return alpha, end_point, math.degrees(alpha)
 
     def update(self, r, d, arc_deg):
-        """Update geometry calculations and optionally display if on main thread"""
-        # Always calculate the geometry (this is thread-safe)
+        """Update geometry calculations and the display, replaced by solve when headless"""
         alpha, end_point, alpha_deg = self.calculate_geometry(r, d, arc_deg)
         Ex, Ey = end_point
         Px, Py = d, 0.0
         
-        # Only update display if matplotlib is available and we're on main thread
-        if self.matplotlib_available and self.is_main_thread:
-            try:
-                self._update_display(r, d, arc_deg, alpha, alpha_deg, Ex, Ey, Px, Py)
-            except Exception as e:
-                print(f"GeometryViewer: Display update failed: {e}")
-                # If display fails, disable it for future calls
-                self.matplotlib_available = False
+        try:
+            self._update_display(r, d, arc_deg, alpha, alpha_deg, Ex, Ey, Px, Py)
+        except Exception as e:
+            print(f"GeometryViewer: Display update failed: {e}")
+            # If display fails, disable it for future calls
+            self.matplotlib_available = False
+            self.update = self.solve
         
         return alpha, (Ex, Ey)
     
+    def _on_draw(self, event):
+        """Snapshot the static background after every full draw (first show, resize, new radius)"""
+        self._bg = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+
     def _update_display(self, r, d, arc_deg, alpha, alpha_deg, Ex, Ey, Px, Py):
         """Update the matplotlib display - only call from main thread"""
         theta_deg = self._end_angle_from_arc_deg(arc_deg)
         theta = math.radians(theta_deg)
+        canvas = self.fig.canvas
         
-        # ----- draw circle -----
-        if self.circle_artist is not None:
-            self.circle_artist.remove()
-        self.circle_artist = plt.Circle((0,0), r, fill=False, lw=2, color='k')
-        self.ax.add_artist(self.circle_artist)
-
-        # Axes lines
-        self.ax.axhline(0, color='0.7', lw=1)
-        self.ax.axvline(0, color='0.7', lw=1)
+        # ----- circle and view limits, only redrawn in full when r changes -----
+        if self._bg is None or r != self._bg_r:
+            self.circle_artist.set_radius(r)
+            m = r * 1.25
+            self.ax.set_xlim(-m, m)
+            self.ax.set_ylim(-m, m)
+            self._bg_r = r
+            canvas.draw()  # Fires _on_draw
+        canvas.restore_region(self._bg)
 
         # ----- draw arc from TOP to E -----
         theta_top = math.radians(90.0)
@@ -127,13 +144,10 @@ class GeometryViewer:
             f"alpha = {alpha_deg:+.2f}°"
         )
 
-        # ----- view limits -----
-        m = r * 1.25
-        self.ax.set_xlim(-m, m)
-        self.ax.set_ylim(-m, m)
-
-        # Use draw_idle instead of draw for better performance and thread safety
-        self.fig.canvas.draw_idle()
+        # ----- only rasterize what moved -----
+        for artist in self._dynamic_artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
         
         # Remove the plt.pause call that was causing threading issues
         # plt.pause(0.001)  # This was the problematic line